@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Saved-Search Alerts
+Matches ingested bids against every saved search through an inverted
+index on terms and facets, so each bid only examines the searches that
+could possibly match it rather than all of them
+"""
+
+import re
+import threading
+from datetime import datetime, timedelta
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Facets a saved search can constrain, most selective first; a search is
+# indexed under the first one it sets
+SEARCH_FACETS = ('keywords', 'tags', 'locations', 'types')
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall((text or '').lower())
+
+
+def split_list(value):
+    """Saved searches store facets as comma-separated text"""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip().lower() for v in value if str(v).strip()]
+    return [v.strip().lower() for v in str(value).split(',') if v.strip()]
+
+
+class CompiledSearch:
+    """A saved search with its facets normalized for matching"""
+
+    def __init__(self, row):
+        self.id = row['id']
+        self.name = row['name']
+        self.email = row.get('email')
+        # Phrases are matched as token runs, so "storm water" needs both words in order
+        self.keywords = [' '.join(tokenize(k)) for k in split_list(row.get('keywords')) if tokenize(k)]
+        self.tags = set(split_list(row.get('tags')))
+        self.locations = [' '.join(tokenize(l)) for l in split_list(row.get('locations')) if tokenize(l)]
+        self.types = set(split_list(row.get('types')))
+        self.deadline_within = row.get('deadline_within')
+
+    def index_keys(self):
+        """Posting-list keys for the search's most selective facet ([] = matches anything)"""
+        if self.keywords:
+            return [('term', k.split(' ')[0]) for k in self.keywords]
+        if self.tags:
+            return [('tag', t) for t in self.tags]
+        if self.locations:
+            return [('location', l.split(' ')[0]) for l in self.locations]
+        if self.types:
+            return [('type', t) for t in self.types]
+        return []
+
+    def matches(self, bid):
+        """Every set facet must match (any value within a facet)"""
+        if self.keywords and not any(_contains_phrase(bid.text, k) for k in self.keywords):
+            return False
+        if self.tags and not self.tags & bid.tags:
+            return False
+        if self.locations and not any(_contains_phrase(bid.location, l) for l in self.locations):
+            return False
+        if self.types and bid.type not in self.types:
+            return False
+        if self.deadline_within is not None:
+            if bid.deadline is None:
+                return False
+            if not bid.today <= bid.deadline <= bid.today + timedelta(days=int(self.deadline_within)):
+                return False
+        return True
+
+    def to_dict(self):
+        return {'id': self.id, 'name': self.name, 'email': self.email}
+
+
+def _contains_phrase(padded_text, phrase):
+    return f' {phrase} ' in padded_text
+
+
+class IndexedBid:
+    """Tokens and facets of one bid, computed once per match"""
+
+    def __init__(self, row):
+        tokens = tokenize(f"{row.get('title', '')} {row.get('description', '')}")
+        self.tokens = set(tokens)
+        self.text = f" {' '.join(tokens)} "
+        location_tokens = tokenize(row.get('location'))
+        self.location_tokens = set(location_tokens)
+        self.location = f" {' '.join(location_tokens)} "
+        self.tags = set(split_list(row.get('keywords')))
+        self.type = (row.get('type') or '').strip().lower()
+        self.today = datetime.now().date()
+        try:
+            self.deadline = datetime.strptime(row.get('deadline') or '', '%Y-%m-%d').date()
+        except ValueError:
+            self.deadline = None
+
+    def index_keys(self):
+        keys = [('term', t) for t in self.tokens]
+        keys.extend(('tag', t) for t in self.tags)
+        keys.extend(('location', t) for t in self.location_tokens)
+        keys.append(('type', self.type))
+        return keys
+
+
+class SavedSearchIndex:
+    """Inverted index from terms/facet values to the saved searches using them"""
+
+    def __init__(self, searches=(), version=None):
+        self.version = version
+        self.searches = {}
+        self.postings = {}
+        self.unindexed = []  # Searches with no term/facet (e.g. deadline only)
+        for row in searches:
+            self.add(CompiledSearch(row))
+
+    def add(self, search):
+        self.searches[search.id] = search
+        keys = search.index_keys()
+        if not keys:
+            self.unindexed.append(search)
+        for key in keys:
+            self.postings.setdefault(key, []).append(search)
+
+    def candidates(self, bid):
+        seen = {}
+        for key in bid.index_keys():
+            for search in self.postings.get(key, ()):
+                seen[search.id] = search
+        for search in self.unindexed:
+            seen[search.id] = search
+        return seen.values()
+
+    def match(self, row):
+        """Saved searches matching a bid row, ordered by id"""
+        if not self.searches:
+            return []
+        bid = IndexedBid(row)
+        return sorted((s for s in self.candidates(bid) if s.matches(bid)), key=lambda s: s.id)
+
+    def __len__(self):
+        return len(self.searches)
+
+
+class AlertMatcher:
+    """Keeps a SavedSearchIndex current with the saved-search version
+
+    `load(version)` returns the active saved-search rows; it is only called
+    when the stored version differs from the one the index was built from.
+    """
+
+    def __init__(self):
+        self.index = SavedSearchIndex()
+        self._lock = threading.Lock()
+
+    def current(self, version, load):
+        if self.index.version != version:
+            with self._lock:
+                if self.index.version != version:
+                    self.index = SavedSearchIndex(load(), version)
+        return self.index
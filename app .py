@@ -6,7 +6,7 @@ Flask server that connects the Python bot to the web dashboard
 Provides REST API endpoints for the frontend
 """
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, g, jsonify, request, send_file, send_from_directory
 from flask_cors import CORS
 import sqlite3
 import json
@@ -16,21 +16,115 @@ import time
 import os
 import sys
 
-# Import the bot
+# The bot (and with it requests/bs4) is imported on first monitoring run
 sys.path.append('/home/user')
-from bid_monitor_bot import BidMonitorBot
+from events import EventBroker
+from exports import iter_csv, iter_ndjson
+from compression import StaticAssets, init_compression
+from metrics import (
+    DB_QUERY_SECONDS, HTTP_REQUEST_SECONDS, REFRESH_LAST_SUCCESS,
+    REFRESH_SECONDS, REGISTRY, instrument_methods
+)
+from profiling import Profiler
+from crawl_queue import (
+    DISCOVER_TASK, SOURCE_TASK, CrawlQueue, CrawlWorker, collect_opportunities, worker_id
+)
+from poll_scheduler import HOUR, AdaptiveScheduler, results_signature
+from alerts import SEARCH_FACETS, AlertMatcher
+from notifications import NotificationWorker, SMTPPool
+from discovery import url_bid_number
+from dedup import MinHasher, THRESHOLD as DUPLICATE_THRESHOLD, bid_text, collapse_repeats
+from profiles import DEFAULT_PROFILE, ProfileCache, RetagJob, validate_profile
+from reports import ReportCache, render_report
+from parse_pool import ParsePool, configured_workers
+from maintenance import MAINTENANCE_TASKS, DatabaseMaintenance
+from artifacts import ExportStage
 
 app = Flask(__name__, static_folder='static', static_url_path='')
 CORS(app)  # Enable CORS for frontend
 
+# Fingerprinted, precompressed dashboard assets
+assets = StaticAssets(app.static_folder)
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_latency(response):
+    if 'request_start' in g:
+        HTTP_REQUEST_SECONDS.labels(
+            endpoint=request.endpoint or 'unmatched',
+            method=request.method,
+            status=response.status_code
+        ).observe(time.perf_counter() - g.request_start)
+    return response
+
+# Registered after the timer so compression counts toward request latency
+init_compression(app)  # gzip/brotli for API responses
+
 # Database configuration
-DB_PATH = '/mnt/user-data/outputs/bids.db'
+DB_PATH = os.environ.get('BID_MONITOR_DB', '/mnt/user-data/outputs/bids.db')
+
+# Fast start: serve existing DB contents immediately and run the initial
+# scrape in the background (set BID_MONITOR_FAST_START=0 to block instead)
+FAST_START = os.environ.get('BID_MONITOR_FAST_START', '1') != '0'
+
+# Discovery: also crawl sitemaps and paginated listings on each run
+DISCOVERY_ENABLED = os.environ.get('BID_MONITOR_DISCOVERY', '0') == '1'
+
+# Enrichment: fetch detail pages for matched links (cached per URL)
+ENRICH_ENABLED = os.environ.get('BID_MONITOR_ENRICH', '1') != '0'
+
+# Adaptive polling: poll each source at a rate learned from how often its
+# listings change (set BID_MONITOR_ADAPTIVE_POLLING=0 for a fixed cadence)
+ADAPTIVE_POLLING = os.environ.get('BID_MONITOR_ADAPTIVE_POLLING', '1') != '0'
+POLL_MIN_HOURS = float(os.environ.get('BID_MONITOR_POLL_MIN_HOURS', 1))
+POLL_MAX_HOURS = float(os.environ.get('BID_MONITOR_POLL_MAX_HOURS', 72))
 
+# Relevance: keyword matches are stored with their score; set a minimum
+# to drop the ones below it at ingestion (unset = keep every match)
+MIN_RELEVANCE = os.environ.get('BID_MONITOR_MIN_RELEVANCE')
+MIN_RELEVANCE = float(MIN_RELEVANCE) if MIN_RELEVANCE else None
+
+# Parse pool: parse fetched pages in this many worker processes so a refresh
+# uses every core ('auto' = one per core, 0 = parse in the monitor thread)
+PARSE_WORKERS = configured_workers(os.environ.get('BID_MONITOR_PARSE_WORKERS', '0'))
+
+# Outgoing mail for saved-search alerts (unset = no email)
+SMTP_HOST = os.environ.get('BID_MONITOR_SMTP_HOST')
+
+# Rendered HTML reports are cached here (one file per data version)
+REPORT_DIR = os.environ.get('BID_MONITOR_REPORT_DIR', os.path.join(os.path.dirname(DB_PATH), 'reports'))
+
+# Export artifacts (CSV, JSON, HTML report and an NDJSON journal of new
+# bids) republished here after each run that changed data (unset = off)
+EXPORT_DIR = os.environ.get('BID_MONITOR_EXPORT_DIR')
+
+# Database maintenance: checkpoint/vacuum every N hours, ANALYZE daily and,
+# when a backup directory is set, keep the newest few online backups
+MAINTENANCE_HOURS = float(os.environ.get('BID_MONITOR_MAINTENANCE_HOURS', 6))
+BACKUP_DIR = os.environ.get('BID_MONITOR_BACKUP_DIR')
+BACKUP_HOURS = float(os.environ.get('BID_MONITOR_BACKUP_HOURS', 24))
+BACKUP_KEEP = int(os.environ.get('BID_MONITOR_BACKUP_KEEP', 3))
+
+# Profiling: sample a fraction of requests (0 = only requests sent with
+# an "X-Profile: 1" header) and keep pstats files next to the database
+PROFILE_DIR = os.environ.get('BID_MONITOR_PROFILE_DIR', os.path.join(os.path.dirname(DB_PATH), 'profiles'))
+profiler = Profiler(PROFILE_DIR, sample_rate=float(os.environ.get('BID_MONITOR_PROFILE_RATE', 0)))
+profiler.init_app(app)
+
+@instrument_methods(DB_QUERY_SECONDS)
 class BidDatabase:
     """Database manager for bid opportunities"""
     
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
+        self.alert_matcher = AlertMatcher()
+        self.outbox_enabled = False  # Set when an SMTP server is configured
+        self.hasher = MinHasher()
+        self.profiles = ProfileCache()
+        self.change_listeners = []
         self.init_database()
     
     def get_connection(self):
@@ -43,6 +137,13 @@ class BidDatabase:
         """Initialize database tables"""
         conn = self.get_connection()
         cursor = conn.cursor()
+
+        # Free pages are returned in slices by the maintenance thread (only
+        # takes effect on a new file; older ones are converted by maintenance)
+        cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+
+        # WAL lets long-running exports read while the monitor writes
+        cursor.execute('PRAGMA journal_mode=WAL')
         
         # Create bids table
         cursor.execute('''
@@ -61,10 +162,19 @@ class BidDatabase:
                 first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 is_active INTEGER DEFAULT 1,
-                is_favorited INTEGER DEFAULT 0
+                is_favorited INTEGER DEFAULT 0,
+                relevance REAL
             )
         ''')
         
+        # Columns added after the first release
+        columns = {row['name'] for row in cursor.execute('PRAGMA table_info(bids)')}
+        if 'relevance' not in columns:
+            cursor.execute('ALTER TABLE bids ADD COLUMN relevance REAL')
+        if 'notes' not in columns:
+            cursor.execute('ALTER TABLE bids ADD COLUMN notes TEXT')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_bids_relevance ON bids(relevance)')
+        
         # Create monitoring log table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS monitoring_log (
@@ -76,6 +186,153 @@ class BidDatabase:
                 error_message TEXT
             )
         ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_monitoring_log_run_timestamp ON monitoring_log(run_timestamp)')
+        
+        # Create per-source run history (one row per landing-page scrape)
+        # and its hourly/daily rollups
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS source_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT,
+                source TEXT NOT NULL,
+                run_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                duration_seconds REAL,
+                bytes INTEGER,
+                http_status INTEGER,
+                parse_seconds REAL,
+                matches INTEGER,
+                inserts INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_source_runs_run_at ON source_runs(run_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_source_runs_source ON source_runs(source)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_source_runs_run_id ON source_runs(run_id)')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS source_stats (
+                period TEXT NOT NULL,
+                source TEXT NOT NULL,
+                bucket TIMESTAMP NOT NULL,
+                runs INTEGER NOT NULL,
+                errors INTEGER NOT NULL,
+                duration_seconds REAL,
+                max_duration_seconds REAL,
+                bytes INTEGER,
+                parse_seconds REAL,
+                matches INTEGER,
+                inserts INTEGER,
+                PRIMARY KEY (period, source, bucket)
+            )
+        ''')
+        
+        # Create change events table (feeds the dashboard event stream)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_type TEXT NOT NULL,
+                payload TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Create crawl state table (validators for incremental discovery)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                url TEXT PRIMARY KEY,
+                source TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT,
+                sitemap_lastmod TEXT,
+                last_crawled TIMESTAMP,
+                last_changed TIMESTAMP
+            )
+        ''')
+        columns = {row['name'] for row in cursor.execute('PRAGMA table_info(crawl_state)')}
+        if 'links' not in columns:
+            cursor.execute('ALTER TABLE crawl_state ADD COLUMN links TEXT')
+        
+        # Create detail page cache (extracted fields per URL + validators)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS detail_cache (
+                url TEXT PRIMARY KEY,
+                details TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at TIMESTAMP
+            )
+        ''')
+        
+        # Create per-source poll schedule (adaptive polling state)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS source_schedule (
+                source TEXT PRIMARY KEY,
+                signature TEXT,
+                change_rate REAL NOT NULL DEFAULT 0,
+                interval_seconds REAL,
+                last_polled_at REAL,
+                last_changed_at REAL,
+                next_poll_at REAL NOT NULL DEFAULT 0,
+                polls INTEGER NOT NULL DEFAULT 0,
+                changes INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        # Create near-duplicate index: MinHash signature and cluster per bid,
+        # plus one LSH bucket row per band
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bid_signatures (
+                bid_id INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL,
+                cluster_id INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_bid_signatures_cluster ON bid_signatures(cluster_id)')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                bucket INTEGER NOT NULL,
+                bid_id INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_lsh_buckets_bucket ON lsh_buckets(bucket)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_lsh_buckets_bid ON lsh_buckets(bid_id)')
+        
+        # Create saved searches (facets are comma-separated lists)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS saved_searches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                email TEXT,
+                keywords TEXT,
+                tags TEXT,
+                locations TEXT,
+                types TEXT,
+                deadline_within INTEGER,
+                is_active INTEGER DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Create notification outbox (one row per recipient, search and bid)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS notification_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recipient TEXT NOT NULL,
+                search_id INTEGER,
+                bid_id INTEGER,
+                payload TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL DEFAULT 0,
+                claimed_at REAL,
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP,
+                UNIQUE(recipient, search_id, bid_id)
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_outbox_status ON notification_outbox(status, available_at)')
         
         # Create settings table
         cursor.execute('''
@@ -91,6 +348,11 @@ class BidDatabase:
         
         print(f"✅ Database initialized: {self.db_path}")
     
+    def _notify_change(self):
+        """Tell listeners (e.g. the event broker) that a change was committed"""
+        for listener in self.change_listeners:
+            listener()
+    
     def add_bid(self, bid_data):
         """Add or update a bid opportunity"""
         conn = self.get_connection()
@@ -98,19 +360,42 @@ class BidDatabase:
         
         try:
             # Extract keywords from title and description
-            keywords = self._extract_keywords(bid_data)
+            keywords = self._extract_keywords(bid_data, self._keyword_profile(cursor))
+            # Scraped links rarely show a bid number; key them by URL instead
+            # of letting them all upsert the same '' row
+            bid_number = bid_data.get('bid_number') or url_bid_number(bid_data.get('url'))
+            
+            cursor.execute(
+                'SELECT title, description FROM bids WHERE bid_number = ?',
+                (bid_number,)
+            )
+            existing = cursor.fetchone()
+            if existing is None and bid_data.get('bid_number') and bid_data.get('url'):
+                # Enrichment found the real number of a bid first stored under
+                # its URL key: re-key that row instead of adding a second one
+                cursor.execute(
+                    'UPDATE bids SET bid_number = ? WHERE bid_number = ?',
+                    (bid_number, url_bid_number(bid_data['url']))
+                )
+                if cursor.rowcount:
+                    cursor.execute(
+                        'SELECT title, description FROM bids WHERE bid_number = ?',
+                        (bid_number,)
+                    )
+                    existing = cursor.fetchone()
             
             cursor.execute('''
                 INSERT INTO bids (
                     bid_number, title, source, location, type, url,
-                    description, posted_date, deadline, keywords
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    description, posted_date, deadline, keywords, relevance
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(bid_number) DO UPDATE SET
                     title=excluded.title,
                     last_updated=CURRENT_TIMESTAMP,
-                    description=excluded.description
+                    description=excluded.description,
+                    relevance=COALESCE(excluded.relevance, relevance)
             ''', (
-                bid_data.get('bid_number', ''),
+                bid_number,
                 bid_data.get('title', ''),
                 bid_data.get('source', ''),
                 bid_data.get('location', ''),
@@ -119,10 +404,30 @@ class BidDatabase:
                 bid_data.get('description', ''),
                 bid_data.get('posted_date', ''),
                 bid_data.get('deadline', ''),
-                keywords
+                keywords,
+                bid_data.get('relevance')
             ))
             
+            # Record the change in the same transaction so subscribers
+            # never see an event for an uncommitted bid
+            event_type = None
+            if existing is None:
+                event_type = 'bid.created'
+            elif (existing['title'], existing['description']) != (
+                    bid_data.get('title', ''), bid_data.get('description', '')):
+                event_type = 'bid.updated'
+            
+            if event_type:
+                cursor.execute('SELECT * FROM bids WHERE bid_number = ?', (bid_number,))
+                bid = dict(cursor.fetchone())
+                bid['cluster_id'] = self._index_duplicates(cursor, bid)
+                self._insert_event(cursor, event_type, bid)
+                self._insert_alerts(cursor, bid)
+                self._bump_version(cursor, 'data_version')
+            
             conn.commit()
+            if event_type:
+                self._notify_change()
             return True
         except Exception as e:
             print(f"Error adding bid: {e}")
@@ -130,42 +435,263 @@ class BidDatabase:
         finally:
             conn.close()
     
-    def _extract_keywords(self, bid_data):
-        """Extract relevant keywords from bid data"""
-        keywords = []
-        text = f"{bid_data.get('title', '')} {bid_data.get('description', '')}".lower()
-        
-        keyword_map = {
-            'stormwater': ['stormwater', 'storm water', 'drainage'],
-            'vac-truck': ['vac truck', 'vacuum truck', 'vactor'],
-            'cleaning': ['cleaning', 'sweeping'],
-            'sewer': ['sewer', 'sanitary'],
-            'maintenance': ['maintenance', 'repair'],
-            'catch-basin': ['catch basin', 'storm drain']
-        }
+    def _extract_keywords(self, bid_data, profile):
+        """Extract relevant keywords from bid data (tags from the keyword profile)"""
+        return profile.tag(f"{bid_data.get('title', '')} {bid_data.get('description', '')}")
+    
+    def _keyword_profile(self, cursor):
+        return self.profiles.current(
+            self._get_version(cursor, 'keyword_profile_version'),
+            lambda: self._load_keyword_profile(cursor)
+        )
+    
+    def _load_keyword_profile(self, cursor):
+        cursor.execute("SELECT value FROM settings WHERE key = 'keyword_profile'")
+        result = cursor.fetchone()
+        profile = json.loads(result['value']) if result else DEFAULT_PROFILE
+        return profile, self._get_version(cursor, 'keyword_profile_version')
+    
+    def keyword_profile(self):
+        """Compiled keyword/tag/relevance matchers for the current profile"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
         
-        for tag, terms in keyword_map.items():
-            if any(term in text for term in terms):
-                keywords.append(tag)
+        profile = self._keyword_profile(cursor)
+        conn.close()
         
-        return ','.join(keywords)
+        return profile
     
-    def get_all_bids(self, active_only=True):
-        """Get all bids from database"""
+    def get_keyword_profile(self):
+        """Stored keyword profile and its version"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        profile, version = self._load_keyword_profile(cursor)
+        conn.close()
+        
+        return profile, version
+    
+    def save_keyword_profile(self, profile):
+        """Replace the keyword profile (validated); returns the new version"""
+        profile = validate_profile(profile)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO settings (key, value) VALUES ('keyword_profile', ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+        ''', (json.dumps(profile),))
+        self._bump_version(cursor, 'keyword_profile_version')
+        version = self._get_version(cursor, 'keyword_profile_version')
+        
+        conn.commit()
+        conn.close()
+        return version
+    
+    def retag_bids(self, profile, after_id=0, batch_size=1000):
+        """Re-apply a profile's tags and relevance to one batch of stored bids
+        
+        Returns (last id seen, bids processed, bids changed).
+        """
+        statistics = profile.relevance_statistics(self.get_relevance_corpus)
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        query = "SELECT * FROM bids"
+        cursor.execute('''
+            SELECT id, title, description, keywords, relevance FROM bids
+            WHERE id > ? ORDER BY id LIMIT ?
+        ''', (after_id, batch_size))
+        rows = cursor.fetchall()
+        if not rows:
+            conn.close()
+            return after_id, 0, 0
+        
+        texts = [f"{row['title']} {row['description'] or ''}" for row in rows]
+        scores = profile.relevance.score(texts, statistics).tolist()
+        changes = []
+        for row, score in zip(rows, scores):
+            keywords = self._extract_keywords(dict(row), profile)
+            relevance = round(score, 4)
+            if (keywords, relevance) != (row['keywords'], row['relevance']):
+                changes.append((keywords, relevance, row['id']))
+        cursor.executemany('UPDATE bids SET keywords = ?, relevance = ? WHERE id = ?', changes)
+        if changes:
+            self._bump_version(cursor, 'data_version')
+        
+        conn.commit()
+        conn.close()
+        return rows[-1]['id'], len(rows), len(changes)
+    
+    def _build_bid_filters(self, filters=None, active_only=True):
+        """Build the WHERE clause shared by the list and export APIs"""
+        filters = filters or {}
+        clauses = []
+        params = []
+        
         if active_only:
-            query += " WHERE is_active = 1"
-        query += " ORDER BY posted_date DESC, id DESC"
+            clauses.append('is_active = 1')
+        
+        if filters.get('search'):
+            clauses.append('(title LIKE ? OR description LIKE ? OR location LIKE ?)')
+            params.extend([f"%{filters['search']}%"] * 3)
+        
+        if filters.get('types'):
+            placeholders = ','.join('?' * len(filters['types']))
+            clauses.append(f'LOWER(type) IN ({placeholders})')
+            params.extend(t.lower() for t in filters['types'])
+        
+        if filters.get('source'):
+            clauses.append('source = ?')
+            params.append(filters['source'])
+        
+        if filters.get('location'):
+            clauses.append('location LIKE ?')
+            params.append(f"%{filters['location']}%")
+        
+        if filters.get('keywords'):
+            # keywords is a comma-joined tag list; match whole tags only
+            clauses.append('(' + ' OR '.join(
+                ["(',' || keywords || ',') LIKE ?"] * len(filters['keywords'])
+            ) + ')')
+            params.extend(f'%,{k},%' for k in filters['keywords'])
+        
+        if filters.get('deadline_within') is not None:
+            clauses.append("deadline != '' AND deadline <= date('now', ?)")
+            params.append(f"+{int(filters['deadline_within'])} days")
+        
+        if filters.get('favorites'):
+            clauses.append('is_favorited = 1')
         
-        cursor.execute(query)
+        if filters.get('collapse_duplicates'):
+            # Only the first posting of each near-duplicate cluster
+            clauses.append('id NOT IN (SELECT bid_id FROM bid_signatures WHERE cluster_id != bid_id)')
+        
+        where = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+        return where, params
+    
+    # Orderings accepted by the list and export APIs
+    BID_ORDERINGS = {
+        'posted': 'posted_date DESC, id DESC',
+        'relevance': 'relevance DESC, posted_date DESC, id DESC'
+    }
+    
+    # Batch mutations: operation -> (column, value or None for the item's note)
+    BID_MUTATIONS = {
+        'favorite': ('is_favorited', 1),
+        'unfavorite': ('is_favorited', 0),
+        'archive': ('is_active', 0),
+        'unarchive': ('is_active', 1),
+        'note': ('notes', None)
+    }
+    MAX_BATCH_SIZE = 500
+    MAX_NOTE_LENGTH = 10000
+    
+    def get_all_bids(self, active_only=True, filters=None, sort='posted'):
+        """Get all bids from database"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        where, params = self._build_bid_filters(filters, active_only)
+        query = "SELECT * FROM bids" + where
+        query += " ORDER BY " + self.BID_ORDERINGS.get(sort, self.BID_ORDERINGS['posted'])
+        
+        cursor.execute(query, params)
         rows = cursor.fetchall()
         conn.close()
         
         return [dict(row) for row in rows]
     
+    def iter_bids(self, active_only=True, filters=None, batch_size=500, sort='posted'):
+        """Stream bids from a cursor in batches (constant memory)"""
+        conn = self.get_connection()
+        
+        try:
+            cursor = conn.cursor()
+            where, params = self._build_bid_filters(filters, active_only)
+            cursor.execute(
+                "SELECT * FROM bids" + where + " ORDER BY "
+                + self.BID_ORDERINGS.get(sort, self.BID_ORDERINGS['posted']),
+                params
+            )
+            
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            conn.close()
+    
+    def iter_bids_since(self, after_id, batch_size=500):
+        """Stream bids with id > after_id in insertion order (journal feed)"""
+        conn = self.get_connection()
+        
+        try:
+            cursor = conn.cursor()
+            while True:
+                cursor.execute(
+                    'SELECT * FROM bids WHERE id > ? ORDER BY id LIMIT ?',
+                    (after_id, batch_size)
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+                after_id = rows[-1]['id']
+        finally:
+            conn.close()
+    
+    def get_relevance_corpus(self, limit=20000):
+        """Title + description of recent bids, the reference corpus for relevance IDF"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT title, description FROM bids ORDER BY id DESC LIMIT ?
+        ''', (limit,))
+        
+        results = [f"{row['title']} {row['description'] or ''}" for row in cursor.fetchall()]
+        conn.close()
+        
+        return results
+    
+    def score_unranked_bids(self, profile, batch_size=5000):
+        """Score bids stored without a relevance score; returns how many"""
+        statistics = profile.relevance_statistics(self.get_relevance_corpus)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT id, title, description FROM bids WHERE relevance IS NULL LIMIT ?
+        ''', (batch_size,))
+        rows = cursor.fetchall()
+        scores = profile.relevance.score([f"{row['title']} {row['description'] or ''}" for row in rows], statistics)
+        cursor.executemany(
+            'UPDATE bids SET relevance = ? WHERE id = ?',
+            [(round(score, 4), row['id']) for row, score in zip(rows, scores.tolist())]
+        )
+        if rows:
+            self._bump_version(cursor, 'data_version')
+        
+        conn.commit()
+        conn.close()
+        return len(rows)
+    
+    def get_type_counts(self, filters=None):
+        """Number of bids per type matching the list/export filters"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        where, params = self._build_bid_filters(filters)
+        cursor.execute('SELECT type, COUNT(*) AS count FROM bids' + where + ' GROUP BY type', params)
+        counts = {row['type']: row['count'] for row in cursor.fetchall()}
+        conn.close()
+        
+        return counts
+    
     def get_statistics(self):
         """Get bid statistics"""
         conn = self.get_connection()
@@ -196,11 +722,83 @@ class BidDatabase:
             SET is_favorited = 1 - is_favorited 
             WHERE id = ?
         ''', (bid_id,))
+        self._bump_version(cursor, 'data_version')
         
         conn.commit()
         conn.close()
         return True
     
+    def apply_bid_mutations(self, operations):
+        """Apply favorite/unfavorite/archive/unarchive/note operations in one transaction
+
+        Operations set state rather than toggle it, so replaying a batch is
+        harmless. Returns (results, data_version): one result per operation,
+        in order, with status 'updated', 'unchanged', 'not_found' or
+        'invalid'. The data version is bumped once if anything changed.
+        """
+        if not isinstance(operations, list):
+            raise ValueError('operations must be a list')
+        if len(operations) > self.MAX_BATCH_SIZE:
+            raise ValueError(f'At most {self.MAX_BATCH_SIZE} operations per batch')
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            ids = {item['id'] for item in operations if isinstance(item, dict) and isinstance(item.get('id'), int)}
+            current = {}
+            if ids:
+                cursor.execute(
+                    f"SELECT id, is_favorited, is_active, notes FROM bids WHERE id IN ({','.join('?' * len(ids))})",
+                    list(ids)
+                )
+                current = {row['id']: dict(row) for row in cursor.fetchall()}
+            
+            results = []
+            updates = []
+            for item in operations:
+                op = item.get('op') if isinstance(item, dict) else None
+                bid_id = item.get('id') if isinstance(item, dict) else None
+                result = {'id': bid_id, 'op': op}
+                results.append(result)
+                
+                if op not in self.BID_MUTATIONS or not isinstance(bid_id, int) or isinstance(bid_id, bool):
+                    result.update(status='invalid', error='Each operation needs an integer id and an op of '
+                                  + ', '.join(self.BID_MUTATIONS))
+                    continue
+                column, value = self.BID_MUTATIONS[op]
+                if op == 'note':
+                    value = item.get('note')
+                    if value is not None and not isinstance(value, str):
+                        result.update(status='invalid', error='note must be a string or null')
+                        continue
+                    if value and len(value) > self.MAX_NOTE_LENGTH:
+                        result.update(status='invalid', error=f'note is longer than {self.MAX_NOTE_LENGTH} characters')
+                        continue
+                    value = value or None
+                
+                bid = current.get(bid_id)
+                if bid is None:
+                    result['status'] = 'not_found'
+                elif bid[column] == value:
+                    result['status'] = 'unchanged'
+                else:
+                    # Later operations on the same bid see this one's effect
+                    bid[column] = value
+                    updates.append((column, value, bid_id))
+                    result['status'] = 'updated'
+            
+            for column, value, bid_id in updates:
+                cursor.execute(f'UPDATE bids SET {column} = ? WHERE id = ?', (value, bid_id))
+            if updates:
+                self._bump_version(cursor, 'data_version')
+            version = self._get_version(cursor, 'data_version')
+            
+            conn.commit()
+        finally:
+            conn.close()
+        return results, version
+    
     def log_monitoring_run(self, opportunities_found, new_opportunities, status, error_message=None):
         """Log a monitoring run"""
         conn = self.get_connection()
@@ -215,48 +813,835 @@ class BidDatabase:
         conn.commit()
         conn.close()
     
-    def get_last_update(self):
-        """Get timestamp of last monitoring run"""
+    def log_source_runs(self, run_id, runs):
+        """Record the outcome of each source scrape in a crawl run"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.executemany('''
+            INSERT INTO source_runs (
+                run_id, source, duration_seconds, bytes, http_status,
+                parse_seconds, matches, error
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [(
+            run_id,
+            run['source'],
+            run.get('duration_seconds'),
+            run.get('bytes'),
+            run.get('http_status'),
+            run.get('parse_seconds'),
+            run.get('matches', 0),
+            run.get('error')
+        ) for run in runs])
+        
+        conn.commit()
+        conn.close()
+    
+    def get_max_bid_id(self):
+        """Highest bid id (bids inserted later have larger ids)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT COALESCE(MAX(id), 0) AS max_id FROM bids')
+        
+        max_id = cursor.fetchone()['max_id']
+        conn.close()
+        return max_id
+    
+    def record_source_inserts(self, run_id, after_id):
+        """Credit each source in a run with the bids it added beyond `after_id`"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
-            SELECT run_timestamp FROM monitoring_log 
-            ORDER BY run_timestamp DESC LIMIT 1
-        ''')
+            UPDATE source_runs SET inserts = (
+                SELECT COUNT(*) FROM bids
+                WHERE bids.id > ? AND bids.source = source_runs.source
+            )
+            WHERE run_id = ?
+        ''', (after_id, run_id))
+        
+        conn.commit()
+        conn.close()
+    
+    def rollup_source_runs(self, keep_raw_days=7, keep_hourly_days=30, keep_daily_days=365):
+        """Fold new run history into hourly and daily buckets, then apply retention
+
+        Only buckets touched by rows added since the last rollup are
+        recomputed, so the cost does not grow with the history.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
         
+        cursor.execute("SELECT value FROM settings WHERE key = 'source_runs_rolled_id'")
         result = cursor.fetchone()
+        rolled_id = int(result['value']) if result else 0
+        
+        cursor.execute(
+            'SELECT MIN(run_at) AS since, MAX(id) AS last_id FROM source_runs WHERE id > ?',
+            (rolled_id,)
+        )
+        pending = cursor.fetchone()
+        
+        if pending['last_id'] is not None:
+            cursor.execute('''
+                INSERT OR REPLACE INTO source_stats
+                SELECT 'hour', source, strftime('%Y-%m-%d %H:00:00', run_at),
+                       COUNT(*), COUNT(error), SUM(duration_seconds), MAX(duration_seconds),
+                       SUM(bytes), SUM(parse_seconds), SUM(matches), SUM(inserts)
+                FROM source_runs
+                WHERE run_at >= strftime('%Y-%m-%d %H:00:00', ?)
+                GROUP BY 1, 2, 3
+            ''', (pending['since'],))
+            cursor.execute('''
+                INSERT OR REPLACE INTO source_stats
+                SELECT 'day', source, date(bucket),
+                       SUM(runs), SUM(errors), SUM(duration_seconds), MAX(max_duration_seconds),
+                       SUM(bytes), SUM(parse_seconds), SUM(matches), SUM(inserts)
+                FROM source_stats
+                WHERE period = 'hour' AND bucket >= date(?)
+                GROUP BY 1, 2, 3
+            ''', (pending['since'],))
+            cursor.execute('''
+                INSERT INTO settings (key, value) VALUES ('source_runs_rolled_id', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+            ''', (str(pending['last_id']),))
+        
+        # Retention: raw rows only once rolled up
+        cursor.execute(
+            "DELETE FROM source_runs WHERE run_at < datetime('now', ?) AND id <= ?",
+            (f'-{int(keep_raw_days)} days', pending['last_id'] or rolled_id)
+        )
+        cursor.execute(
+            "DELETE FROM source_stats WHERE period = 'hour' AND bucket < datetime('now', ?)",
+            (f'-{int(keep_hourly_days)} days',)
+        )
+        cursor.execute(
+            "DELETE FROM source_stats WHERE period = 'day' AND bucket < date('now', ?)",
+            (f'-{int(keep_daily_days)} days',)
+        )
+        cursor.execute(
+            "DELETE FROM monitoring_log WHERE run_timestamp < datetime('now', ?)",
+            (f'-{int(keep_daily_days)} days',)
+        )
+        
+        conn.commit()
         conn.close()
+    
+    def get_source_health(self, period='hour', buckets=48):
+        """Latest scrape plus a trend of rolled-up buckets for every source"""
+        if period not in ('hour', 'day'):
+            raise ValueError("period must be 'hour' or 'day'")
+        since = f"-{int(buckets)} {'hours' if period == 'hour' else 'days'}"
         
-        return result['run_timestamp'] if result else None
-
-# Initialize database
-db = BidDatabase()
-
-# Background monitoring thread
-class BidMonitorThread:
-    def __init__(self, interval_hours=6):
-        self.interval_hours = interval_hours
-        self.running = False
-        self.thread = None
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT * FROM source_runs
+            WHERE id IN (SELECT MAX(id) FROM source_runs GROUP BY source)
+        ''')
+        latest = {row['source']: dict(row) for row in cursor.fetchall()}
+        
+        cursor.execute('''
+            SELECT * FROM source_stats
+            WHERE period = ? AND bucket >= strftime(?, 'now', ?)
+            ORDER BY source, bucket
+        ''', (period, '%Y-%m-%d %H:00:00' if period == 'hour' else '%Y-%m-%d', since))
+        trends = {}
+        for row in cursor.fetchall():
+            trends.setdefault(row['source'], []).append(dict(row))
+        conn.close()
+        
+        health = []
+        for source in sorted(set(latest) | set(trends)):
+            trend = trends.get(source, [])
+            runs = sum(b['runs'] for b in trend)
+            errors = sum(b['errors'] for b in trend)
+            parsed = runs - errors
+            health.append({
+                'source': source,
+                'last_run': latest.get(source),
+                'summary': {
+                    'runs': runs,
+                    'errors': errors,
+                    'error_rate': round(errors / runs, 4) if runs else None,
+                    'avg_duration_seconds': round(sum(b['duration_seconds'] or 0 for b in trend) / runs, 4) if runs else None,
+                    'max_duration_seconds': max((b['max_duration_seconds'] or 0 for b in trend), default=None),
+                    'avg_bytes': round(sum(b['bytes'] or 0 for b in trend) / runs) if runs else None,
+                    'avg_parse_seconds': round(sum(b['parse_seconds'] or 0 for b in trend) / parsed, 4) if parsed > 0 else None,
+                    'matches': sum(b['matches'] or 0 for b in trend),
+                    'inserts': sum(b['inserts'] or 0 for b in trend)
+                },
+                'trend': [{k: v for k, v in b.items() if k not in ('period', 'source')} for b in trend]
+            })
+        return health
     
-    def start(self):
-        """Start background monitoring"""
-        if not self.running:
-            self.running = True
-            self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
-            self.thread.start()
-            print(f"✅ Background monitoring started (every {self.interval_hours} hours)")
+    def _insert_event(self, cursor, event_type, payload):
+        cursor.execute(
+            'INSERT INTO events (event_type, payload) VALUES (?, ?)',
+            (event_type, json.dumps(payload))
+        )
+        return cursor.lastrowid
     
-    def stop(self):
-        """Stop background monitoring"""
-        self.running = False
-        print("⏹️  Background monitoring stopped")
+    def record_event(self, event_type, payload):
+        """Store a change event and return its id"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        event_id = self._insert_event(cursor, event_type, payload)
+        
+        conn.commit()
+        conn.close()
+        self._notify_change()
+        return event_id
     
-    def _monitor_loop(self):
-        """Background monitoring loop"""
-        while self.running:
-            try:
+    def get_events_since(self, last_event_id, limit=500):
+        """Get events newer than the given id, oldest first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT id, event_type, payload, created_at FROM events
+            WHERE id > ? ORDER BY id LIMIT ?
+        ''', (last_event_id, limit))
+        
+        rows = cursor.fetchall()
+        conn.close()
+        
+        events = []
+        for row in rows:
+            event = dict(row)
+            event['payload'] = json.loads(event['payload']) if event['payload'] else {}
+            events.append(event)
+        return events
+    
+    def get_latest_event_id(self):
+        """Get the id of the newest event (0 if none)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT MAX(id) AS last_id FROM events')
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        return result['last_id'] or 0
+    
+    def prune_events(self, keep_hours=24):
+        """Delete events older than the retention window"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "DELETE FROM events WHERE created_at < datetime('now', ?)",
+            (f'-{int(keep_hours)} hours',)
+        )
+        
+        deleted = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return deleted
+    
+    def claim_notifications(self, max_recipients=200, stale_seconds=600):
+        """Atomically mark every due outbox row of up to `max_recipients` recipients as being sent"""
+        now = time.time()
+        # Rows claimed by a sender that died mid-delivery become due again
+        due = "((status = 'pending' AND available_at <= ?) OR (status = 'sending' AND claimed_at < ?))"
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute(f'''
+                SELECT DISTINCT recipient FROM notification_outbox
+                WHERE {due} LIMIT ?
+            ''', (now, now - stale_seconds, max_recipients))
+            recipients = [row['recipient'] for row in cursor.fetchall()]
+            
+            rows = []
+            if recipients:
+                cursor.execute(f'''
+                    SELECT * FROM notification_outbox
+                    WHERE {due} AND recipient IN ({','.join('?' * len(recipients))})
+                    ORDER BY id
+                ''', [now, now - stale_seconds] + recipients)
+                rows = [dict(row) for row in cursor.fetchall()]
+            
+            cursor.executemany('''
+                UPDATE notification_outbox
+                SET status = 'sending', attempts = attempts + 1, claimed_at = ?
+                WHERE id = ?
+            ''', [(now, row['id']) for row in rows])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        
+        for row in rows:
+            row['payload'] = json.loads(row['payload'])
+            row['attempts'] += 1
+        return rows
+    
+    def finish_notifications(self, ids, status):
+        """Mark claimed outbox rows sent (or skipped)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.executemany('''
+            UPDATE notification_outbox
+            SET status = ?, finished_at = CURRENT_TIMESTAMP, last_error = NULL
+            WHERE id = ?
+        ''', [(status, i) for i in ids])
+        
+        conn.commit()
+        conn.close()
+    
+    def retry_notifications(self, ids, error, give_up=False, delay=60):
+        """Put claimed outbox rows back for a later attempt, or fail them"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        status = 'failed' if give_up else 'pending'
+        cursor.executemany('''
+            UPDATE notification_outbox
+            SET status = ?, available_at = ?, last_error = ?,
+                finished_at = CASE WHEN ? = 'failed' THEN CURRENT_TIMESTAMP END
+            WHERE id = ?
+        ''', [(status, time.time() + delay, str(error)[:500], status, i) for i in ids])
+        
+        conn.commit()
+        conn.close()
+    
+    def prune_notifications(self, keep_days=7):
+        """Delete delivered, skipped and failed outbox rows past retention"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            DELETE FROM notification_outbox
+            WHERE status IN ('sent', 'skipped', 'failed') AND finished_at < datetime('now', ?)
+        ''', (f'-{int(keep_days)} days',))
+        
+        deleted = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return deleted
+    
+    def get_notification_stats(self):
+        """Outbox row counts by status"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT status, COUNT(*) AS n FROM notification_outbox GROUP BY status')
+        
+        results = {row['status']: row['n'] for row in cursor.fetchall()}
+        conn.close()
+        
+        return results
+    
+    def notifications_enabled(self):
+        """Dashboard email toggle (on unless switched off)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT value FROM settings WHERE key = 'email_notifications'")
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        return result is None or result['value'] != '0'
+    
+    def set_notifications_enabled(self, enabled):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO settings (key, value) VALUES ('email_notifications', ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+        ''', ('1' if enabled else '0',))
+        
+        conn.commit()
+        conn.close()
+    
+    def _index_duplicates(self, cursor, bid):
+        """Add a bid to the LSH index and return its near-duplicate cluster id"""
+        signature = self.hasher.signature(bid_text(bid))
+        cursor.execute('DELETE FROM lsh_buckets WHERE bid_id = ?', (bid['id'],))
+        if signature is None:
+            # Nothing to compare (e.g. an image-only link); an empty placeholder
+            # marks the bid as indexed so the catch-up does not revisit it
+            cursor.execute('''
+                INSERT OR REPLACE INTO bid_signatures (bid_id, signature, cluster_id) VALUES (?, ?, ?)
+            ''', (bid['id'], b'', bid['id']))
+            return bid['id']
+        
+        buckets = self.hasher.band_keys(signature)
+        cursor.execute(f'''
+            SELECT s.bid_id, s.signature, s.cluster_id FROM bid_signatures s
+            WHERE s.bid_id IN (
+                SELECT DISTINCT bid_id FROM lsh_buckets WHERE bucket IN ({','.join('?' * len(buckets))})
+            ) AND s.bid_id != ?
+        ''', buckets + [bid['id']])
+        clusters = {
+            row['cluster_id'] for row in cursor.fetchall()
+            if self.hasher.similarity(signature, self.hasher.from_blob(row['signature'])) >= DUPLICATE_THRESHOLD
+        }
+        
+        # A posting can bridge clusters found earlier; merge into the oldest
+        cluster_id = min(clusters | {bid['id']})
+        if clusters - {cluster_id}:
+            cursor.execute(f'''
+                UPDATE bid_signatures SET cluster_id = ?
+                WHERE cluster_id IN ({','.join('?' * len(clusters))})
+            ''', [cluster_id] + list(clusters))
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO bid_signatures (bid_id, signature, cluster_id) VALUES (?, ?, ?)
+        ''', (bid['id'], self.hasher.to_blob(signature), cluster_id))
+        cursor.executemany(
+            'INSERT INTO lsh_buckets (bucket, bid_id) VALUES (?, ?)',
+            [(bucket, bid['id']) for bucket in buckets]
+        )
+        return cluster_id
+    
+    def index_missing_duplicates(self, batch_size=1000):
+        """Cluster bids stored before the duplicate index existed; returns how many"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT b.* FROM bids b
+            LEFT JOIN bid_signatures s ON s.bid_id = b.id
+            WHERE s.bid_id IS NULL ORDER BY b.id LIMIT ?
+        ''', (batch_size,))
+        rows = [dict(row) for row in cursor.fetchall()]
+        for bid in rows:
+            self._index_duplicates(cursor, bid)
+        if rows:
+            self._bump_version(cursor, 'data_version')
+        
+        conn.commit()
+        conn.close()
+        return len(rows)
+    
+    def get_duplicates(self, bid_id):
+        """Other postings clustered with a bid"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT b.*, s.cluster_id FROM bid_signatures s
+            JOIN bids b ON b.id = s.bid_id
+            WHERE s.cluster_id = (SELECT cluster_id FROM bid_signatures WHERE bid_id = ?)
+                AND s.bid_id != ?
+            ORDER BY b.id
+        ''', (bid_id, bid_id))
+        
+        results = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return results
+    
+    def _get_version(self, cursor, key):
+        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
+        result = cursor.fetchone()
+        return int(result['value']) if result else 0
+    
+    def _bump_version(self, cursor, key):
+        cursor.execute('''
+            INSERT INTO settings (key, value) VALUES (?, '1')
+            ON CONFLICT(key) DO UPDATE SET
+                value = CAST(value AS INTEGER) + 1,
+                updated_at = CURRENT_TIMESTAMP
+        ''', (key,))
+    
+    def get_data_version(self):
+        """Counter bumped whenever stored bids change (keys report/export caches)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        version = self._get_version(cursor, 'data_version')
+        conn.close()
+        
+        return version
+    
+    def _insert_alerts(self, cursor, bid):
+        """Record an alert event if the bid matches any saved search"""
+        index = self.alert_matcher.current(
+            self._get_version(cursor, 'saved_searches_version'),
+            lambda: self._load_saved_searches(cursor, active_only=True)
+        )
+        matches = index.match(bid)
+        if not matches:
+            return
+        
+        summary = {k: bid.get(k) for k in (
+            'id', 'bid_number', 'title', 'source', 'location', 'type', 'url', 'deadline'
+        )}
+        self._insert_event(cursor, 'alert.matched', {
+            'bid': summary,
+            'searches': [search.to_dict() for search in matches]
+        })
+        
+        if self.outbox_enabled:
+            # Re-matching an unchanged alert is a no-op thanks to the unique key
+            cursor.executemany('''
+                INSERT OR IGNORE INTO notification_outbox (recipient, search_id, bid_id, payload)
+                VALUES (?, ?, ?, ?)
+            ''', [
+                (search.email, search.id, bid['id'], json.dumps({'bid': summary, 'search_name': search.name}))
+                for search in matches if search.email
+            ])
+    
+    def _load_saved_searches(self, cursor, active_only=False):
+        query = 'SELECT * FROM saved_searches'
+        if active_only:
+            query += ' WHERE is_active = 1'
+        cursor.execute(query + ' ORDER BY id')
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def get_saved_searches(self):
+        """Get all saved searches"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        results = self._load_saved_searches(cursor)
+        conn.close()
+        
+        return results
+    
+    def get_saved_search(self, search_id):
+        """Get one saved search"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM saved_searches WHERE id = ?', (search_id,))
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        return dict(result) if result else None
+    
+    def _saved_search_values(self, data):
+        values = {}
+        for facet in SEARCH_FACETS:
+            if facet in data:
+                value = data[facet]
+                if isinstance(value, (list, tuple)):
+                    value = ','.join(str(v).strip() for v in value if str(v).strip())
+                values[facet] = value or None
+        for field in ('name', 'email', 'deadline_within', 'is_active'):
+            if field in data:
+                values[field] = data[field]
+        if values.get('deadline_within') is not None:
+            try:
+                values['deadline_within'] = int(values['deadline_within'])
+            except (TypeError, ValueError):
+                raise ValueError(f"deadline_within must be a whole number of days, got {values['deadline_within']!r}")
+        if 'is_active' in values:
+            values['is_active'] = int(bool(values['is_active']))
+        return values
+    
+    def create_saved_search(self, data):
+        """Add a saved search and return its id"""
+        values = self._saved_search_values(data)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            f"INSERT INTO saved_searches ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})",
+            list(values.values())
+        )
+        search_id = cursor.lastrowid
+        self._bump_version(cursor, 'saved_searches_version')
+        
+        conn.commit()
+        conn.close()
+        return search_id
+    
+    def update_saved_search(self, search_id, data):
+        """Change fields of a saved search (False if it does not exist)"""
+        values = self._saved_search_values(data)
+        if not values:
+            return self.get_saved_search(search_id) is not None
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            f"UPDATE saved_searches SET {', '.join(f'{k} = ?' for k in values)}, "
+            f"updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            list(values.values()) + [search_id]
+        )
+        updated = cursor.rowcount > 0
+        if updated:
+            self._bump_version(cursor, 'saved_searches_version')
+        
+        conn.commit()
+        conn.close()
+        return updated
+    
+    def delete_saved_search(self, search_id):
+        """Remove a saved search (False if it does not exist)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('DELETE FROM saved_searches WHERE id = ?', (search_id,))
+        deleted = cursor.rowcount > 0
+        if deleted:
+            self._bump_version(cursor, 'saved_searches_version')
+        
+        conn.commit()
+        conn.close()
+        return deleted
+    
+    def get_crawl_state(self, url):
+        """Get stored validators for a crawled URL"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM crawl_state WHERE url = ?', (url,))
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        if not result:
+            return None
+        state = dict(result)
+        state['links'] = json.loads(state['links']) if state['links'] else []
+        return state
+    
+    def save_crawl_state(self, url, source, changed=True, etag=None, last_modified=None,
+                         content_hash=None, sitemap_lastmod=None, links=None):
+        """Record the outcome of fetching a URL during discovery (and its listing links)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO crawl_state (
+                url, source, etag, last_modified, content_hash, sitemap_lastmod, links,
+                last_crawled, last_changed
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            ON CONFLICT(url) DO UPDATE SET
+                etag=COALESCE(excluded.etag, etag),
+                last_modified=COALESCE(excluded.last_modified, last_modified),
+                content_hash=COALESCE(excluded.content_hash, content_hash),
+                sitemap_lastmod=COALESCE(excluded.sitemap_lastmod, sitemap_lastmod),
+                links=COALESCE(excluded.links, links),
+                last_crawled=CURRENT_TIMESTAMP,
+                last_changed=CASE WHEN ? THEN CURRENT_TIMESTAMP ELSE last_changed END
+        ''', (url, source, etag, last_modified, content_hash, sitemap_lastmod,
+              json.dumps(links) if links is not None else None, int(changed)))
+        
+        conn.commit()
+        conn.close()
+    
+    def get_crawl_hashes(self, source):
+        """(url, content_hash) of every page discovery has fetched for a source"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT url, content_hash FROM crawl_state
+            WHERE source = ? AND content_hash IS NOT NULL ORDER BY url
+        ''', (source,))
+        
+        hashes = [(row['url'], row['content_hash']) for row in cursor.fetchall()]
+        conn.close()
+        return hashes
+    
+    def get_detail_cache(self, url):
+        """Get cached detail-page fields for a URL"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM detail_cache WHERE url = ?', (url,))
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        if not result:
+            return None
+        cached = dict(result)
+        cached['details'] = json.loads(cached['details']) if cached['details'] else {}
+        return cached
+    
+    def save_detail_cache(self, url, details, etag=None, last_modified=None):
+        """Store extracted detail-page fields and their validators"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO detail_cache (url, details, etag, last_modified, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (url, json.dumps(details), etag, last_modified,
+              datetime.now().isoformat(sep=' ', timespec='seconds')))
+        
+        conn.commit()
+        conn.close()
+    
+    def get_source_schedule(self, source):
+        """Get the adaptive polling state for a source"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM source_schedule WHERE source = ?', (source,))
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        return dict(result) if result else None
+    
+    def get_source_schedules(self):
+        """Get the adaptive polling state for every source, soonest first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM source_schedule ORDER BY next_poll_at')
+        
+        results = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return results
+    
+    def save_source_schedule(self, source, **fields):
+        """Insert or update a source's polling state"""
+        columns = ['source'] + list(fields)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(f'''
+            INSERT INTO source_schedule ({', '.join(columns)})
+            VALUES ({', '.join('?' * len(columns))})
+            ON CONFLICT(source) DO UPDATE SET
+                {', '.join(f'{c}=excluded.{c}' for c in fields)}
+        ''', [source] + list(fields.values()))
+        
+        conn.commit()
+        conn.close()
+    
+    def has_upcoming_deadline(self, source, days):
+        """Whether a source has an active bid due within the next `days` days"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT 1 FROM bids
+            WHERE source = ? AND is_active = 1
+                AND deadline BETWEEN date('now', 'localtime') AND date('now', 'localtime', ?)
+            LIMIT 1
+        ''', (source, f'+{int(days)} days'))
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        return result is not None
+    
+    def get_last_update(self):
+        """Get timestamp of last monitoring run"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT run_timestamp FROM monitoring_log 
+            ORDER BY run_timestamp DESC LIMIT 1
+        ''')
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        return result['run_timestamp'] if result else None
+
+# Initialize database
+db = BidDatabase()
+
+# Dashboard push channel
+broker = EventBroker(db)
+
+# Durable crawl work queue (shares the bids database file)
+crawl_queue = CrawlQueue(DB_PATH)
+
+# Saved-search email digests (only when an SMTP server is configured;
+# use `python notifications.py --debug-server` locally)
+notifier = None
+if SMTP_HOST:
+    db.outbox_enabled = True
+    notifier = NotificationWorker(
+        db,
+        SMTPPool(
+            SMTP_HOST,
+            port=int(os.environ.get('BID_MONITOR_SMTP_PORT', 25)),
+            username=os.environ.get('BID_MONITOR_SMTP_USER'),
+            password=os.environ.get('BID_MONITOR_SMTP_PASSWORD'),
+            starttls=os.environ.get('BID_MONITOR_SMTP_STARTTLS', '0') == '1',
+            size=int(os.environ.get('BID_MONITOR_SMTP_CONNECTIONS', 2))
+        ),
+        sender=os.environ.get('BID_MONITOR_MAIL_FROM', 'bid-monitor@localhost'),
+        interval=int(os.environ.get('BID_MONITOR_DIGEST_SECONDS', 300))
+    )
+
+# Background re-application of an edited keyword profile to stored bids
+retag_job = RetagJob(db)
+
+# Rendered HTML reports, reused until the bids change
+report_cache = ReportCache(REPORT_DIR)
+
+# Export artifacts, regenerated only when the data version moves
+export_stage = ExportStage(EXPORT_DIR) if EXPORT_DIR else None
+
+# Worker processes shared by every refresh (created on first use)
+parse_pool = ParsePool(PARSE_WORKERS)
+
+# Sliced ANALYZE / checkpoint / incremental vacuum / backup passes
+maintenance = DatabaseMaintenance(
+    DB_PATH,
+    backup_dir=BACKUP_DIR,
+    interval=MAINTENANCE_HOURS * HOUR,
+    backup_every=BACKUP_HOURS * HOUR,
+    keep_backups=BACKUP_KEEP
+)
+
+# Per-source poll timing
+scheduler = AdaptiveScheduler(db, min_interval=POLL_MIN_HOURS * HOUR, max_interval=POLL_MAX_HOURS * HOUR)
+
+# Backfill batches (duplicate index, relevance scores) at most per run
+CATCHUP_BATCHES = 100
+
+# Background monitoring thread
+class BidMonitorThread:
+    def __init__(self, interval_hours=6):
+        self.interval_hours = interval_hours
+        self.running = False
+        self.thread = None
+        self.last_run_at = None
+        self._refresh_lock = threading.Lock()  # One refresh per process at a time
+    
+    def start(self):
+        """Start background monitoring"""
+        if not self.running:
+            self.running = True
+            self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
+            self.thread.start()
+            if ADAPTIVE_POLLING:
+                print(f"✅ Background monitoring started (adaptive, {POLL_MIN_HOURS:g}-{POLL_MAX_HOURS:g} hours per source)")
+            else:
+                print(f"✅ Background monitoring started (every {self.interval_hours} hours)")
+    
+    def stop(self):
+        """Stop background monitoring"""
+        self.running = False
+        print("⏹️  Background monitoring stopped")
+    
+    def _monitor_loop(self):
+        """Background monitoring loop"""
+        while self.running:
+            try:
+                if ADAPTIVE_POLLING:
+                    self._adaptive_tick()
+                    continue
+                
                 print(f"\n{'='*60}")
                 print(f"🔄 Auto-refresh: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
                 print(f"{'='*60}\n")
@@ -272,22 +1657,100 @@ class BidMonitorThread:
                 print(f"❌ Error in monitoring loop: {e}")
                 time.sleep(300)  # Wait 5 minutes on error
     
-    def run_monitor(self):
-        """Run the bid monitor and update database"""
+    def _adaptive_tick(self):
+        """Poll the sources that are due, then sleep until the next one is"""
+        from bid_monitor_bot import BidMonitorBot
+        
+        sources = list(BidMonitorBot.SCRAPE_METHODS)
+        due = scheduler.due_sources(sources)
+        if due:
+            print(f"\n{'='*60}")
+            print(f"🔄 Auto-refresh: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ({', '.join(due)})")
+            print(f"{'='*60}\n")
+            self.run_monitor(sources=due)
+        
+        # Wake at least hourly so deadline bumps and manual refreshes are picked up
+        sleep_seconds = min(max(scheduler.seconds_until_next(sources), 60), HOUR)
+        print(f"\n⏰ Next check in {sleep_seconds / 60:.0f} minutes")
+        time.sleep(sleep_seconds)
+    
+    def run_monitor(self, sources=None):
+        """Run the bid monitor and update database (all sources unless given)
+        
+        Returns None without doing anything while another refresh is running
+        (the background loop and /api/refresh share this).
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            print("⏳ A refresh is already running, skipped")
+            return None
         try:
-            bot = BidMonitorBot()
+            return self._run_monitor(sources)
+        finally:
+            self._refresh_lock.release()
+    
+    def _run_monitor(self, sources):
+        started = time.perf_counter()
+        run_id = None
+        try:
+            from bid_monitor_bot import BidMonitorBot
+            
+            profile = db.keyword_profile()
+            bot = BidMonitorBot(profile=profile, parse_pool=parse_pool)
+            sources = [s for s in bot.SCRAPE_METHODS if sources is None or s in sources]
+            discovery_sources = [s for s in bot.DISCOVERY_CONFIG if s in sources] if DISCOVERY_ENABLED else []
+            
+            # Resume a run a killed worker left behind, or queue a new one;
+            # a run another process still holds is left for it to ingest
+            owner = worker_id()
+            run_id = crawl_queue.claim_run(owner)
+            if run_id:
+                print(f"↩️  Resuming crawl run {run_id}: {crawl_queue.run_status(run_id)}")
+            elif crawl_queue.unfinished_run():
+                print("⏳ Another process is ingesting the current crawl run, skipped")
+                return None
+            else:
+                run_id = crawl_queue.start_run(owner)
+                for source in sources:
+                    crawl_queue.enqueue(run_id, SOURCE_TASK, source)
+                for source in discovery_sources:
+                    crawl_queue.enqueue(run_id, DISCOVER_TASK, source)
+            
+            total_steps = len(sources) + len(discovery_sources)
+            broker.publish('refresh.started', {'total_steps': total_steps, 'run_id': run_id})
+            
+            progress = {'step': 0, 'found': 0}
+            def report_progress(kind, source, found):
+                progress['step'] += 1
+                progress['found'] += found
+                broker.publish('refresh.progress', {
+                    'step': progress['step'],
+                    'total_steps': total_steps,
+                    'source': source if kind == SOURCE_TASK else f'{source} (discovery)',
+                    'opportunities_found': progress['found']
+                })
             
             # Run monitoring
-            bot.scrape_cleveland_city()
-            time.sleep(1)
-            bot.scrape_cuyahoga_county()
-            time.sleep(1)
-            bot.scrape_ohio_state()
-            time.sleep(1)
+            worker = CrawlWorker(
+                crawl_queue,
+                bot_factory=lambda: bot,
+                store=db,
+                enrich=ENRICH_ENABLED,
+                source_batch=max(PARSE_WORKERS, 1),
+                on_progress=report_progress
+            )
+            worker.drain(run_id)
+            
+            bot.opportunities = collect_opportunities(crawl_queue, run_id)
             bot.add_sample_opportunities()
+            found = len(bot.opportunities)
+            bot.opportunities = collapse_repeats(bot.opportunities)
+            if found != len(bot.opportunities):
+                print(f"🧬 Collapsed {found - len(bot.opportunities)} repeated links")
+            bot.rank_opportunities(corpus=db.get_relevance_corpus(), min_relevance=MIN_RELEVANCE)
             
             # Count existing bids before update
             existing_count = len(db.get_all_bids())
+            max_bid_id = db.get_max_bid_id()
             
             # Update database
             new_count = 0
@@ -295,6 +1758,15 @@ class BidMonitorThread:
                 if db.add_bid(opp):
                     new_count += 1
             
+            # One-off catch-up for bids stored before duplicate clustering
+            # existed (bounded so a row that never settles cannot stall a run)
+            for _ in range(CATCHUP_BATCHES):
+                if not db.index_missing_duplicates():
+                    break
+            for _ in range(CATCHUP_BATCHES):
+                if not db.score_unranked_bids(profile):
+                    break
+            
             # Calculate new opportunities
             current_count = len(db.get_all_bids())
             new_opportunities = current_count - existing_count
@@ -306,6 +1778,28 @@ class BidMonitorThread:
                 status='success'
             )
             
+            db.record_source_inserts(run_id, max_bid_id)
+            db.rollup_source_runs()
+            self._publish_exports()
+            
+            self._record_polls(run_id, sources)
+            crawl_queue.finish_run(run_id)
+            crawl_queue.purge()
+            
+            broker.publish('refresh.completed', {
+                'opportunities_found': len(bot.opportunities),
+                'new_opportunities': new_opportunities,
+                'total': current_count
+            })
+            db.prune_events()
+            if notifier:
+                # Send this run's alerts now, batched into one digest per recipient
+                notifier.wake()
+            
+            self.last_run_at = datetime.now()
+            REFRESH_SECONDS.labels(status='success').observe(time.perf_counter() - started)
+            REFRESH_LAST_SUCCESS.set_to_current_time()
+            
             print(f"✅ Monitoring complete: {len(bot.opportunities)} opportunities")
             print(f"   New: {new_opportunities}, Total in DB: {current_count}")
             
@@ -313,9 +1807,44 @@ class BidMonitorThread:
             
         except Exception as e:
             print(f"❌ Monitoring error: {e}")
+            if run_id and crawl_queue.fail_run(run_id, e):
+                print(f"   Giving up on crawl run {run_id}; the next check starts a new one")
+            REFRESH_SECONDS.labels(status='error').observe(time.perf_counter() - started)
             db.log_monitoring_run(0, 0, 'error', str(e))
+            broker.publish('refresh.failed', {'error': str(e)})
             return False
 
+    def _publish_exports(self):
+        """Refresh the export artifacts; a failure here does not fail the run"""
+        if not export_stage:
+            return
+        try:
+            export_stage.export(
+                db.get_data_version(),
+                rows=db.iter_bids,
+                counts=db.get_type_counts,
+                new_rows=db.iter_bids_since
+            )
+        except Exception as e:
+            print(f"⚠ Export failed: {e}")
+    
+    def _record_polls(self, run_id, sources):
+        """Feed each polled source's listings to the adaptive scheduler"""
+        listings = {}
+        for source, _, opportunities in crawl_queue.results(run_id, SOURCE_TASK):
+            listings.setdefault(source, []).extend(opportunities)
+        discovered = {source for source, _, _ in crawl_queue.results(run_id, DISCOVER_TASK)}
+        
+        # A failed fetch is not an empty listing; don't count it as a change
+        failed = crawl_queue.failed_sources(run_id, (SOURCE_TASK, DISCOVER_TASK))
+        for source in set(sources) | set(listings) | discovered:
+            if source in failed or (source not in listings and source not in discovered):
+                scheduler.record_failure(source)
+                continue
+            pages = db.get_crawl_hashes(source) if source in discovered else ()
+            changed, interval = scheduler.record_poll(source, results_signature(listings.get(source, ()), pages))
+            print(f"   {source}: {'changed' if changed else 'unchanged'}, next poll in {interval / HOUR:.1f}h")
+
 # Initialize background monitor
 monitor_thread = BidMonitorThread(interval_hours=6)
 
@@ -324,18 +1853,70 @@ monitor_thread = BidMonitorThread(interval_hours=6)
 @app.route('/')
 def index():
     """Serve the main page"""
-    return send_from_directory('static', 'index.html')
+    return assets.index_response()
+
+@app.route('/assets/<path:filename>')
+def hashed_asset(filename):
+    """Serve content-hashed CSS/JS with immutable cache headers"""
+    return assets.asset_response(filename)
+
+def parse_bid_filters(args):
+    """Read list/export filters from query parameters (ValueError if malformed)"""
+    def split(name):
+        return [v.strip() for v in args.get(name, '').split(',') if v.strip()]
+    
+    deadline_within = args.get('deadline_within', '').strip() or None
+    if deadline_within is not None:
+        try:
+            deadline_within = int(deadline_within)
+        except ValueError:
+            raise ValueError(f"deadline_within must be a whole number of days, got {deadline_within!r}")
+    
+    return {
+        'search': args.get('search', '').strip(),
+        'types': split('type'),
+        'source': args.get('source', '').strip(),
+        'location': args.get('location', '').strip(),
+        'keywords': split('keywords'),
+        'deadline_within': deadline_within,
+        'favorites': args.get('favorites', '').lower() in ('1', 'true', 'yes'),
+        'collapse_duplicates': args.get('collapse_duplicates', '').lower() in ('1', 'true', 'yes')
+    }
 
 @app.route('/api/bids', methods=['GET'])
 def get_bids():
     """Get all bid opportunities"""
     try:
-        bids = db.get_all_bids()
+        bids = db.get_all_bids(
+            filters=parse_bid_filters(request.args),
+            sort=request.args.get('sort', 'posted')
+        )
         return jsonify({
             'success': True,
             'count': len(bids),
             'bids': bids
         })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/bids/<int:bid_id>/duplicates', methods=['GET'])
+def get_duplicates(bid_id):
+    """Near-duplicate postings of a bid (e.g. the same work from city and county)"""
+    try:
+        duplicates = db.get_duplicates(bid_id)
+        return jsonify({
+            'success': True,
+            'count': len(duplicates),
+            'duplicates': duplicates
+        })
     except Exception as e:
         return jsonify({
             'success': False,
@@ -375,16 +1956,55 @@ def toggle_favorite(bid_id):
             'error': str(e)
         }), 500
 
+@app.route('/api/bids/batch', methods=['POST'])
+def mutate_bids():
+    """Apply many favorite/unfavorite/archive/unarchive/note operations at once
+
+    Body: {"operations": [{"id": 1, "op": "favorite"}, {"id": 2, "op": "note", "note": "..."}]}
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            raise ValueError('Body must be a JSON object with an operations list')
+        results, version = db.apply_bid_mutations(data.get('operations'))
+        
+        return jsonify({
+            'success': True,
+            'updated': sum(1 for r in results if r['status'] == 'updated'),
+            'data_version': version,
+            'results': results
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/refresh', methods=['POST'])
 def manual_refresh():
-    """Manually trigger a monitoring refresh"""
+    """Manually trigger a monitoring refresh (?profile=1 to profile it)"""
     try:
-        success = monitor_thread.run_monitor()
+        profile_name = None
+        if request.args.get('profile') == '1':
+            success, profile_name = profiler.profile_call('run_monitor', monitor_thread.run_monitor)
+        else:
+            success = monitor_thread.run_monitor()
         
+        if success is None:
+            return jsonify({
+                'success': False,
+                'message': 'A refresh is already running'
+            }), 409
         if success:
             return jsonify({
                 'success': True,
-                'message': 'Monitoring refresh completed'
+                'message': 'Monitoring refresh completed',
+                'profile': profile_name
             })
         else:
             return jsonify({
@@ -398,32 +2018,393 @@ def manual_refresh():
             'error': str(e)
         }), 500
 
-@app.route('/api/export/csv', methods=['GET'])
-def export_csv():
-    """Export bids to CSV"""
+@app.route('/api/sources/schedule', methods=['GET'])
+def source_schedule():
+    """Adaptive polling state per source"""
+    try:
+        schedules = db.get_source_schedules()
+        for row in schedules:
+            for field in ('last_polled_at', 'last_changed_at', 'next_poll_at'):
+                if row[field]:
+                    row[field] = datetime.fromtimestamp(row[field]).isoformat(timespec='seconds')
+            row['deadline_priority'] = db.has_upcoming_deadline(row['source'], scheduler.deadline_days)
+        
+        return jsonify({
+            'success': True,
+            'adaptive': ADAPTIVE_POLLING,
+            'sources': schedules
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/sources/health', methods=['GET'])
+def source_health():
+    """Latest scrape and hourly (?period=hour&buckets=48) or daily trends per source"""
+    try:
+        period = request.args.get('period', 'hour')
+        buckets = request.args.get('buckets', 48 if period == 'hour' else 30, type=int)
+        
+        return jsonify({
+            'success': True,
+            'period': period,
+            'sources': db.get_source_health(period, buckets)
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/searches', methods=['GET'])
+def list_saved_searches():
+    """List saved searches"""
+    try:
+        return jsonify({
+            'success': True,
+            'searches': db.get_saved_searches()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/searches', methods=['POST'])
+def create_saved_search():
+    """Save a search; newly ingested bids matching it raise alert events"""
+    try:
+        data = request.get_json(silent=True) or {}
+        if not data.get('name'):
+            return jsonify({
+                'success': False,
+                'error': 'name is required'
+            }), 400
+        
+        search_id = db.create_saved_search(data)
+        return jsonify({
+            'success': True,
+            'search': db.get_saved_search(search_id)
+        }), 201
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/searches/<int:search_id>', methods=['PUT', 'DELETE'])
+def modify_saved_search(search_id):
+    """Update or delete a saved search"""
+    try:
+        if request.method == 'DELETE':
+            found = db.delete_saved_search(search_id)
+        else:
+            found = db.update_saved_search(search_id, request.get_json(silent=True) or {})
+        
+        if not found:
+            return jsonify({
+                'success': False,
+                'error': 'Saved search not found'
+            }), 404
+        return jsonify({
+            'success': True,
+            'search': db.get_saved_search(search_id)
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/notifications', methods=['GET'])
+def notification_status():
+    """Email delivery settings and outbox counts"""
+    try:
+        return jsonify({
+            'success': True,
+            'configured': notifier is not None,
+            'enabled': db.notifications_enabled(),
+            'outbox': db.get_notification_stats()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/notifications', methods=['PUT'])
+def update_notifications():
+    """Turn email digests on or off (the dashboard email toggle)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        db.set_notifications_enabled(bool(data.get('enabled', True)))
+        return jsonify({
+            'success': True,
+            'configured': notifier is not None,
+            'enabled': db.notifications_enabled()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/profile', methods=['GET'])
+def get_keyword_profile():
+    """Keywords, tag map and relevance weights currently in use"""
+    try:
+        profile, version = db.get_keyword_profile()
+        return jsonify({
+            'success': True,
+            'version': version,
+            'profile': profile
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/profile', methods=['PUT'])
+def update_keyword_profile():
+    """Replace the keyword profile (?retag=1 also re-tags stored bids)"""
+    try:
+        version = db.save_keyword_profile(request.get_json(silent=True))
+        retag_started = request.args.get('retag') == '1' and retag_job.start()
+        return jsonify({
+            'success': True,
+            'version': version,
+            'retag_started': bool(retag_started)
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/profile/retag', methods=['GET', 'POST'])
+def retag_history():
+    """Start (POST) or check (GET) the background re-tag of stored bids"""
+    try:
+        started = retag_job.start() if request.method == 'POST' else False
+        return jsonify({
+            'success': True,
+            'started': started,
+            'status': retag_job.status
+        }), 202 if started else 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/events', methods=['GET'])
+def event_stream():
+    """Server-Sent Events stream of bid changes and refresh progress"""
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('since')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid event id: {last_event_id!r}'
+        }), 400
+    
+    return Response(
+        broker.stream(last_event_id),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+@app.route('/api/events/poll', methods=['GET'])
+def poll_events():
+    """Long-poll fallback for clients without EventSource"""
     try:
-        import csv
-        from io import StringIO
+        since = request.args.get('since', type=int)
+        timeout = min(request.args.get('timeout', 25, type=float), 55)
         
-        bids = db.get_all_bids()
+        if since is None:
+            # First poll just returns the cursor to wait from
+            broker.start()
+            return jsonify({
+                'success': True,
+                'last_event_id': broker.last_event_id or 0,
+                'events': []
+            })
         
-        output = StringIO()
-        if bids:
-            writer = csv.DictWriter(output, fieldnames=bids[0].keys())
-            writer.writeheader()
-            writer.writerows(bids)
+        events = broker.wait_for_events(since, timeout)
+        return jsonify({
+            'success': True,
+            'last_event_id': events[-1]['id'] if events else since,
+            'events': events
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/export/csv', methods=['GET'])
+def export_csv():
+    """Export bids to CSV (streamed)"""
+    try:
+        bids = db.iter_bids(filters=parse_bid_filters(request.args))
         
-        return app.response_class(
-            output.getvalue(),
+        return Response(
+            iter_csv(bids),
             mimetype='text/csv',
             headers={'Content-Disposition': f'attachment; filename=bids_{datetime.now().strftime("%Y%m%d")}.csv'}
         )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/export/ndjson', methods=['GET'])
+def export_ndjson():
+    """Export bids as newline-delimited JSON (streamed)"""
+    try:
+        bids = db.iter_bids(filters=parse_bid_filters(request.args))
+        
+        return Response(
+            iter_ndjson(bids),
+            mimetype='application/x-ndjson',
+            headers={'Content-Disposition': f'attachment; filename=bids_{datetime.now().strftime("%Y%m%d")}.ndjson'}
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/report', methods=['GET'])
+def html_report():
+    """HTML report of the (filtered) bids, re-rendered only when bids change"""
+    try:
+        filters = parse_bid_filters(request.args)
+        key = report_cache.key(db.get_data_version(), filters)
+        
+        path = report_cache.get(key)
+        if path:
+            return send_file(path, mimetype='text/html', etag=key, conditional=True)
+        if key in request.if_none_match:
+            return Response(status=304, headers={'ETag': f'"{key}"'})
+        
+        counts = db.get_type_counts(filters)
+        chunks = render_report(db.iter_bids(filters=filters), counts=counts)
+        return Response(
+            report_cache.stream(key, chunks),
+            mimetype='text/html',
+            headers={'ETag': f'"{key}"'}
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/maintenance', methods=['GET'])
+def maintenance_status():
+    """Maintenance schedule and the timings of the last pass"""
+    return jsonify({
+        'success': True,
+        **maintenance.status()
+    })
+
+@app.route('/api/maintenance', methods=['POST'])
+def run_maintenance():
+    """Run a maintenance pass now (?tasks=analyze,checkpoint,...; default: all)"""
+    try:
+        tasks = [t for t in request.args.get('tasks', '').split(',') if t] or list(MAINTENANCE_TASKS)
+        unknown = set(tasks) - set(MAINTENANCE_TASKS)
+        if unknown:
+            raise ValueError(f"Unknown maintenance task(s): {', '.join(sorted(unknown))}")
+        if 'backup' in tasks and not maintenance.backup_dir:
+            if request.args.get('tasks'):
+                raise ValueError('Backups are disabled (set BID_MONITOR_BACKUP_DIR)')
+            tasks.remove('backup')
+        
+        return jsonify({
+            'success': True,
+            'report': maintenance.run_pass(tasks)
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/profiles', methods=['GET'])
+def list_profiles():
+    """List saved cProfile captures"""
+    try:
+        return jsonify({
+            'success': True,
+            'sample_rate': profiler.sample_rate,
+            'profiles': profiler.list_profiles()
+        })
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@app.route('/api/profiles/<name>', methods=['GET'])
+def download_profile(name):
+    """Download a pstats file for offline analysis"""
+    return send_from_directory(PROFILE_DIR, name, as_attachment=True)
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -431,11 +2412,12 @@ def health_check():
         'success': True,
         'status': 'running',
         'timestamp': datetime.now().isoformat(),
-        'monitoring_active': monitor_thread.running
+        'monitoring_active': monitor_thread.running,
+        'initial_check_complete': monitor_thread.last_run_at is not None
     })
 
 # Startup
-def startup():
+def startup(fast_start=FAST_START):
     """Initialize application on startup"""
     print("\n" + "="*70)
     print("🚀 BID MONITOR WEB APPLICATION")
@@ -443,12 +2425,20 @@ def startup():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    # Run initial monitoring
-    print("Running initial monitoring check...")
-    monitor_thread.run_monitor()
+    if fast_start:
+        # The monitor loop runs its first check straight away, in the background
+        print("⚡ Fast start: serving existing data, initial check runs in background")
+        threading.Thread(target=assets.warm, daemon=True).start()
+    else:
+        # Run initial monitoring
+        print("Running initial monitoring check...")
+        monitor_thread.run_monitor()
     
     # Start background monitoring
     monitor_thread.start()
+    if notifier:
+        notifier.start()
+    maintenance.start()
     
     print("\n" + "="*70)
     print("✅ Application ready!")
@@ -461,6 +2451,26 @@ def startup():
     print("Press Ctrl+C to stop")
     print("="*70 + "\n")
 
+def run_crawl_worker(poll_seconds=10):
+    """Standalone scraping worker that helps drain unfinished crawl runs"""
+    from bid_monitor_bot import BidMonitorBot
+    
+    print("👷 Crawl worker started")
+    while True:
+        run_id = crawl_queue.unfinished_run()
+        if run_id and crawl_queue.outstanding(run_id):
+            CrawlWorker(
+                crawl_queue,
+                bot_factory=lambda: BidMonitorBot(profile=db.keyword_profile(), parse_pool=parse_pool),
+                store=db,
+                enrich=ENRICH_ENABLED,
+                source_batch=max(PARSE_WORKERS, 1)
+            ).drain(run_id)
+        else:
+            time.sleep(poll_seconds)
+
 if __name__ == '__main__':
+    if '--crawl-worker' in sys.argv:
+        run_crawl_worker()
     startup()
-    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=False, threaded=True)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Export Artifacts
+Publishes the CSV, JSON and HTML exports to an output directory only when
+the data has changed, and appends new bids to an NDJSON journal. Every file
+is written to a temporary name and renamed into place, so readers never see
+a half-written export
+"""
+
+import hashlib
+import json
+import os
+
+from exports import iter_csv, iter_json_array, iter_ndjson, write_chunks
+from reports import render_report
+
+CSV_FILE = 'bid_opportunities.csv'
+JSON_FILE = 'bid_opportunities.json'
+REPORT_FILE = 'bid_report.html'
+JOURNAL_FILE = 'bid_journal.ndjson'
+
+# Last published version, journal position and length (the journal is only
+# valid up to `journal_bytes`; anything after it is an interrupted append)
+STATE_FILE = '.export-state.json'
+
+
+def fingerprint(rows):
+    """Content version for rows that have no stored data version"""
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update(json.dumps(row, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:16]
+
+
+class ExportStage:
+    """Regenerates the export artifacts in `directory` when the version changes
+
+    `fieldnames` fixes the CSV column order (default: keys of the first row).
+    """
+
+    def __init__(self, directory, fieldnames=None):
+        self.directory = directory
+        self.fieldnames = fieldnames
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def load_state(self):
+        try:
+            with open(self.path(STATE_FILE), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def export(self, version, rows, counts=None, new_rows=None):
+        """Publish the artifacts for `version` unless they are already current
+
+        `rows` and `counts` are zero-argument callables (rows is called once
+        per artifact; counts gives type -> count for the report). `new_rows`,
+        if given, is called with the last journaled id and returns the bids
+        added since, in id order, for the journal. Returns a summary dict.
+        """
+        state = self.load_state()
+        artifacts = [CSV_FILE, JSON_FILE, REPORT_FILE]
+        if state.get('version') == version and all(os.path.exists(self.path(name)) for name in artifacts):
+            print(f"📦 Exports unchanged (version {version}), skipped")
+            return {'skipped': True, 'version': version}
+
+        os.makedirs(self.directory, exist_ok=True)
+        write_chunks(self.path(CSV_FILE), iter_csv(rows(), fieldnames=self.fieldnames))
+        write_chunks(self.path(JSON_FILE), iter_json_array(rows()))
+        write_chunks(self.path(REPORT_FILE), render_report(rows(), counts=counts() if counts else None))
+
+        journaled = 0
+        if new_rows is not None:
+            journaled = self._append_journal(state, new_rows)
+
+        state['version'] = version
+        write_chunks(self.path(STATE_FILE), [json.dumps(state, indent=2)])
+
+        print(f"📦 Published exports (version {version}) to {self.directory}"
+              + (f", journaled {journaled} new bids" if journaled else ''))
+        return {'skipped': False, 'version': version, 'artifacts': artifacts, 'journaled': journaled}
+
+    def _append_journal(self, state, new_rows):
+        """Append bids after state['journal_id']; updates state in place"""
+        last_id = state.get('journal_id', 0)
+        count = 0
+
+        def track(rows):
+            nonlocal last_id, count
+            for row in rows:
+                last_id = row['id']
+                count += 1
+                yield row
+
+        path = self.path(JOURNAL_FILE)
+        with open(path, 'a+b') as f:
+            # Drop the tail of an append that never made it into the state file
+            f.truncate(state.get('journal_bytes', 0))
+            f.seek(0, os.SEEK_END)
+            for chunk in iter_ndjson(track(new_rows(last_id))):
+                f.write(chunk.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+            state['journal_bytes'] = f.tell()
+
+        state['journal_id'] = last_id
+        return count
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Saved-Search Alert Benchmark
+Matches synthetic bids against thousands of synthetic saved searches,
+comparing the inverted index with checking every search for every bid
+
+Usage:
+    python benchmarks/alert_benchmark.py --searches 5000 --bids 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from common import ROOT
+from synthetic_bids import DETAILS, SERVICES, SOURCES, synthetic_bids
+
+sys.path.insert(0, ROOT)
+from alerts import CompiledSearch, IndexedBid, SavedSearchIndex  # noqa: E402
+
+
+# Interests of subscribers outside this trade (never in synthetic bids)
+OTHER_TRADES = [
+    'roofing', 'hvac', 'elevator', 'landscaping', 'paving', 'signage', 'fencing',
+    'plumbing', 'electrical', 'painting', 'demolition', 'asbestos', 'uniforms',
+    'software', 'printing', 'catering', 'security', 'towing', 'lighting', 'masonry'
+]
+
+
+def synthetic_searches(count, seed=0):
+    """Saved searches over the synthetic bid vocabulary and other trades"""
+    rng = random.Random(seed)
+    phrases = [p.lower() for p in SERVICES + DETAILS]
+    locations = sorted({s[1].split(',')[0] for s in SOURCES})
+
+    for i in range(count):
+        search = {'id': i + 1, 'name': f'search {i + 1}', 'email': f'user{i % (count // 3 + 1)}@example.com'}
+        if rng.random() < 0.8:
+            pool = phrases if rng.random() < 0.3 else OTHER_TRADES
+            search['keywords'] = ','.join(rng.sample(pool, rng.randint(1, 3)))
+        else:
+            search['locations'] = rng.choice(locations)
+        if rng.random() < 0.3:
+            search['types'] = rng.choice(['municipal', 'county', 'state'])
+        if rng.random() < 0.05:
+            search['deadline_within'] = rng.choice([7, 14, 30])
+        yield search
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--searches', type=int, default=5000)
+    parser.add_argument('--bids', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    searches = list(synthetic_searches(args.searches, args.seed))
+    bids = list(synthetic_bids(args.bids, args.seed))
+
+    start = time.perf_counter()
+    index = SavedSearchIndex(searches, version=1)
+    build = time.perf_counter() - start
+    print(f"🗂  Indexed {len(index)} searches in {build * 1000:.1f}ms "
+          f"({len(index.postings)} posting lists, {len(index.unindexed)} unindexed)")
+
+    start = time.perf_counter()
+    indexed_matches = sum(len(index.match(bid)) for bid in bids)
+    indexed = time.perf_counter() - start
+
+    compiled = [CompiledSearch(s) for s in searches]
+    start = time.perf_counter()
+    scan_matches = 0
+    for row in bids:
+        bid = IndexedBid(row)
+        scan_matches += sum(1 for s in compiled if s.matches(bid))
+    scan = time.perf_counter() - start
+
+    print(f"⚡ Inverted index: {indexed:.3f}s ({indexed / len(bids) * 1e6:.0f}µs/bid), {indexed_matches} matches")
+    print(f"🐢 Full scan:      {scan:.3f}s ({scan / len(bids) * 1e6:.0f}µs/bid), {scan_matches} matches")
+    if indexed_matches != scan_matches:
+        print("❌ Match counts differ")
+        sys.exit(1)
+    print(f"📈 Speedup: {scan / indexed:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the benchmark scripts
+"""
+
+import importlib.util
+import os
+import socket
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(ROOT, 'app .py')
+
+
+def load_app(db_path=None):
+    """Import the web app module, optionally pointed at another database"""
+    if db_path:
+        os.environ['BID_MONITOR_DB'] = db_path
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    spec = importlib.util.spec_from_file_location('app', APP_FILE)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['app'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def free_port():
+    """An unused local TCP port"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
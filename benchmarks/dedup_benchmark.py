@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection Benchmark
+Grows an LSH index of synthetic bids and times duplicate lookups at each
+history size, against comparing the new posting with every stored one
+
+Usage:
+    python benchmarks/dedup_benchmark.py --history 50000 --probes 200
+"""
+
+import argparse
+import sys
+import time
+
+from common import ROOT
+from synthetic_bids import synthetic_bids
+
+sys.path.insert(0, ROOT)
+from dedup import MinHasher, MinHashLSH, bid_text  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--history', type=int, default=50000)
+    parser.add_argument('--probes', type=int, default=200, help='lookups timed at each checkpoint')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    hasher = MinHasher()
+    index = MinHashLSH(hasher)
+    checkpoints = sorted({c for c in (1000, 5000, 10000, 25000, 50000, 100000) if c <= args.history} | {args.history})
+
+    probes = [hasher.signature(bid_text(b)) for b in synthetic_bids(args.probes, seed=args.seed + 1)]
+    history = synthetic_bids(args.history, seed=args.seed)
+
+    print(f"{'history':>9}{'sign µs':>10}{'LSH µs':>10}{'pairwise µs':>13}{'candidates':>12}{'dupes':>8}")
+    start = time.perf_counter()
+    inserted = 0
+    signing = 0.0
+    for checkpoint in checkpoints:
+        while inserted < checkpoint:
+            bid = next(history)
+            t = time.perf_counter()
+            signature = hasher.signature(bid_text(bid))
+            signing += time.perf_counter() - t
+            index.insert(inserted, signature)
+            inserted += 1
+
+        t = time.perf_counter()
+        dupes = sum(len(index.query(signature)) for signature in probes)
+        lsh = (time.perf_counter() - t) / len(probes)
+
+        candidates = 0
+        for signature in probes:
+            keys = set()
+            for bucket in hasher.band_keys(signature):
+                keys.update(index.buckets.get(bucket, ()))
+            candidates += len(keys)
+
+        # Pairwise cost extrapolated from a sample of comparisons
+        sample = list(index.signatures.values())[:2000]
+        t = time.perf_counter()
+        for other in sample:
+            hasher.similarity(probes[0], other)
+        pairwise = (time.perf_counter() - t) / len(sample) * len(index)
+
+        print(f"{len(index):>9}{signing / inserted * 1e6:>10.0f}{lsh * 1e6:>10.0f}{pairwise * 1e6:>13.0f}"
+              f"{candidates / len(probes):>12.1f}{dupes / len(probes):>8.1f}")
+
+    print(f"\n⏱  Total {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
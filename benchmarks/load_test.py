@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+API Load Test
+Replays a mixed read/refresh/favorite workload against a local server
+and reports p50/p95/p99 latency and throughput per operation
+
+By default a server is started on a free port against --db with scraping
+in replay mode (no network). Use --url to target a running server instead.
+
+Usage:
+    python benchmarks/synthetic_bids.py --db /tmp/bids.db --count 100000
+    python benchmarks/load_test.py --db /tmp/bids.db --concurrency 8 --duration 30
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --mix bids=80,statistics=20
+"""
+
+import argparse
+import math
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from common import APP_FILE, ROOT, free_port
+
+DEFAULT_MIX = 'bids=55,filtered=10,statistics=20,export=3,favorite=10,refresh=2'
+
+
+def parse_mix(spec):
+    mix = {}
+    for part in spec.split(','):
+        name, weight = part.split('=')
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+class Workload:
+    """The operations a simulated dashboard user performs"""
+
+    def __init__(self, base_url, max_bid_id):
+        self.base_url = base_url.rstrip('/')
+        self.max_bid_id = max(max_bid_id, 1)
+
+    def request(self, path, method='GET'):
+        req = urllib.request.Request(self.base_url + path, method=method,
+                                     headers={'Accept-Encoding': 'gzip'})
+        with urllib.request.urlopen(req, timeout=120) as response:
+            # Read the full body so streamed exports are fully timed
+            while response.read(65536):
+                pass
+            return response.status
+
+    def bids(self, rng):
+        return self.request('/api/bids')
+
+    def filtered(self, rng):
+        term = rng.choice(['sewer', 'catch', 'sweeping', 'stormwater', 'jetting'])
+        return self.request(f'/api/bids?search={term}&type=municipal,county')
+
+    def statistics(self, rng):
+        return self.request('/api/statistics')
+
+    def export(self, rng):
+        return self.request('/api/export/csv')
+
+    def favorite(self, rng):
+        return self.request(f'/api/bids/{rng.randint(1, self.max_bid_id)}/favorite', method='POST')
+
+    def refresh(self, rng):
+        return self.request('/api/refresh', method='POST')
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return float('nan')
+    index = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def run_load(workload, mix, concurrency, duration, seed=0):
+    """Run worker threads for `duration` seconds; returns per-op samples"""
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    results = {name: {'latencies': [], 'errors': 0} for name in names}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(worker_id):
+        rng = random.Random(seed + worker_id)
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                getattr(workload, name)(rng)
+                ok = True
+            except (urllib.error.URLError, OSError):
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                if ok:
+                    results[name]['latencies'].append(elapsed)
+                else:
+                    results[name]['errors'] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, time.perf_counter() - started
+
+
+def start_server(db_path, port):
+    fixtures = tempfile.mkdtemp(prefix='bid-fixtures-')
+    env = dict(
+        os.environ,
+        BID_MONITOR_DB=db_path,
+        PORT=str(port),
+        BID_MONITOR_HTTP_MODE='replay',
+        BID_MONITOR_FIXTURES=fixtures
+    )
+    proc = subprocess.Popen([sys.executable, APP_FILE], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    url = f'http://127.0.0.1:{port}'
+    for _ in range(600):
+        try:
+            urllib.request.urlopen(url + '/api/health', timeout=1)
+            return proc, url
+        except OSError:
+            if proc.poll() is not None:
+                break
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError('server did not start')
+
+
+def max_bid_id(db_path):
+    if not db_path or not os.path.exists(db_path):
+        return 1000
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute('SELECT COALESCE(MAX(id), 1) FROM bids').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def report(results, elapsed):
+    total = sum(len(r['latencies']) for r in results.values())
+    errors = sum(r['errors'] for r in results.values())
+
+    print("=" * 78)
+    print("📈 LOAD TEST RESULTS")
+    print("=" * 78)
+    print(f"{'operation':<12}{'requests':>10}{'errors':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, r in results.items():
+        latencies = sorted(r['latencies'])
+        print(f"{name:<12}{len(latencies):>10}{r['errors']:>8}{len(latencies) / elapsed:>9.1f}"
+              f"{percentile(latencies, 50) * 1000:>10.1f}{percentile(latencies, 95) * 1000:>10.1f}"
+              f"{percentile(latencies, 99) * 1000:>10.1f}")
+
+    everything = sorted(l for r in results.values() for l in r['latencies'])
+    print("-" * 78)
+    print(f"{'all':<12}{total:>10}{errors:>8}{total / elapsed:>9.1f}"
+          f"{percentile(everything, 50) * 1000:>10.1f}{percentile(everything, 95) * 1000:>10.1f}"
+          f"{percentile(everything, 99) * 1000:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', help='database for the spawned server')
+    parser.add_argument('--url', help='target an already running server')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'weighted operations (default {DEFAULT_MIX})')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.url and not args.db:
+        parser.error('either --db or --url is required')
+
+    proc = None
+    url = args.url
+    if not url:
+        proc, url = start_server(os.path.abspath(args.db), free_port())
+
+    try:
+        workload = Workload(url, max_bid_id(args.db))
+        print(f"🚚 {args.concurrency} workers for {args.duration:.0f}s against {url}")
+        results, elapsed = run_load(workload, parse_mix(args.mix), args.concurrency, args.duration, args.seed)
+        report(results, elapsed)
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == '__main__':
+    main()
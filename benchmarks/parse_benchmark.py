@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Parse Pool Scaling Benchmark
+Parses a batch of synthetic listing pages inline and with 1, 2, 4, ...
+worker processes (up to the core count) and reports pages/sec, speedup
+and how many bytes cross the process boundary in each direction
+
+Usage:
+    python benchmarks/parse_benchmark.py --pages 32 --links 5000
+    python benchmarks/parse_benchmark.py --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+
+from common import ROOT
+from scraper_benchmark import synthetic_listing_page
+
+sys.path.insert(0, ROOT)
+from bid_monitor_bot import BidMonitorBot  # noqa: E402
+from parse_pool import ParsePool, parse_listing  # noqa: E402
+
+
+def run(pool, pages, pattern):
+    start = time.perf_counter()
+    futures = [pool.submit(parse_listing, body, pattern, 'https://example.gov', False) for body in pages]
+    results = [future.result() for future in futures]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=32)
+    parser.add_argument('--links', type=int, default=5000, help='links per listing page')
+    parser.add_argument('--workers', type=int, nargs='+', help='pool sizes to try (default: powers of two up to the core count)')
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    sizes = args.workers or [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= cores]
+    pages = [synthetic_listing_page(args.links, seed=i).encode() for i in range(args.pages)]
+    pattern = BidMonitorBot().profile.keyword_pattern.pattern
+
+    inline, results = run(ParsePool(0), pages, pattern)
+    sent = sum(len(pickle.dumps(body)) for body in pages)
+    returned = sum(len(pickle.dumps(result)) for result in results)
+
+    print(f"📄 {args.pages} pages x {args.links} links ({sent / 1e6:.1f} MB sent, "
+          f"{returned / 1e3:.0f} kB returned), {cores} cores")
+    print(f"{'workers':>8}{'seconds':>10}{'pages/s':>10}{'speedup':>9}")
+    print(f"{'inline':>8}{inline:>10.2f}{args.pages / inline:>10.1f}{1:>9.2f}")
+
+    for workers in sizes:
+        pool = ParsePool(workers)
+        run(pool, pages[:workers], pattern)  # Start the workers before timing
+        elapsed, _ = run(pool, pages, pattern)
+        pool.close()
+        print(f"{workers:>8}{elapsed:>10.2f}{args.pages / elapsed:>10.1f}{inline / elapsed:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
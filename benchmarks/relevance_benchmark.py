@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Relevance Scoring Benchmark
+Ranks a batch of synthetic scraped links (titles only, like landing-page
+links) and of full postings, and compares precision with plain keyword
+substring matching on a labelled set of look-alike titles
+
+Usage:
+    python benchmarks/relevance_benchmark.py --count 50000
+"""
+
+import argparse
+import sys
+import time
+
+from common import ROOT
+from synthetic_bids import synthetic_bids
+
+sys.path.insert(0, ROOT)
+from relevance import RelevanceModel  # noqa: E402
+
+KEYWORDS = [
+    'stormwater', 'storm water', 'drainage', 'sewer', 'vac truck', 'vacuum truck',
+    'vactor', 'hydro excavation', 'cleaning', 'street cleaning', 'catch basin',
+    'storm drain', 'jetting', 'pipe cleaning', 'sanitary sewer'
+]
+
+# (title, relevant?) pairs that substring matching gets wrong or right
+LABELLED = [
+    ('Storm Sewer Cleaning - Annual Contract', True),
+    ('Catch Basin Cleaning Zone 4', True),
+    ('Vactor Truck Rental with Operator', True),
+    ('Sanitary Sewer Jetting and CCTV', True),
+    ('Stormwater Pond Maintenance', True),
+    ('Janitorial Cleaning Services - City Hall', False),
+    ('Carpet Cleaning for Public Library', False),
+    ('Window Cleaning at Municipal Buildings', False),
+    ('Custodial and Office Cleaning Services', False),
+    ('Uniform Rental and Cleaning', False),
+    ('HVAC Duct Cleaning', False),
+    ('Dental Cleaning Benefits Administrator', False)
+]
+
+
+def substring_match(text):
+    text = text.lower()
+    return any(k in text for k in KEYWORDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=50000)
+    args = parser.parse_args()
+
+    model = RelevanceModel()
+    bids = list(synthetic_bids(args.count))
+
+    for label, rows in (
+        ('links (titles)', [{'title': b['title']} for b in bids]),
+        ('full postings', [{'title': b['title'], 'description': b['description']} for b in bids])
+    ):
+        start = time.perf_counter()
+        ranked = model.rank(rows)
+        elapsed = time.perf_counter() - start
+        print(f"⚡ {len(rows)} {label}: {elapsed * 1000:.0f}ms, kept {len(ranked)}")
+
+    model.fit([b['title'] for b in bids[:5000]] + [t for t, _ in LABELLED])
+    scores = model.score([t for t, _ in LABELLED])
+    print(f"\n{'title':<44}{'relevant':>9}{'substring':>10}{'score':>9}")
+    model_correct = substring_correct = 0
+    for (title, relevant), score in zip(LABELLED, scores):
+        model_correct += (score > model.threshold) == relevant
+        substring_correct += substring_match(title) == relevant
+        print(f"{title:<44}{str(relevant):>9}{str(substring_match(title)):>10}{score:>9.2f}")
+    print(f"\n🎯 Correct: model {model_correct}/{len(LABELLED)}, substring {substring_correct}/{len(LABELLED)}")
+
+
+if __name__ == '__main__':
+    main()
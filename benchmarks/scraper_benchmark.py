@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Scraper Benchmark
+Offline benchmark of the scrape_* methods against replayed fixtures:
+pages/sec, parse time, keyword-match time and end-to-end refresh time,
+for each source and for synthetic listing pages of 10k+ links
+
+Usage:
+    python benchmarks/scraper_benchmark.py [--links 10000] [--runs 5]
+    python benchmarks/scraper_benchmark.py --fixtures fixtures/http
+    python benchmarks/scraper_benchmark.py --save-baseline bench.json
+    python benchmarks/scraper_benchmark.py --compare bench.json --tolerance 0.25
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+
+from bid_monitor_bot import BidMonitorBot
+from http_fixtures import ReplaySession
+
+SCRAPERS = {
+    'City of Cleveland': 'scrape_cleveland_city',
+    'Cuyahoga County': 'scrape_cuyahoga_county',
+    'State of Ohio': 'scrape_ohio_state'
+}
+
+MATCHING_TITLES = [
+    'Storm Sewer Cleaning Services', 'Catch Basin Maintenance', 'Vac Truck Rental',
+    'Sanitary Sewer Jetting', 'Street Cleaning - Zone {n}', 'Storm Drain Repair'
+]
+OTHER_TITLES = [
+    'Office Supplies', 'Fleet Fuel Cards', 'Janitorial Paper Products',
+    'IT Consulting', 'Road Salt Purchase', 'Annual Audit Services'
+]
+
+
+def synthetic_listing_page(links, match_ratio=0.05, seed=0):
+    """HTML listing page with `links` anchors, a share of them relevant"""
+    rng = random.Random(seed)
+    anchors = []
+    for n in range(links):
+        titles = MATCHING_TITLES if rng.random() < match_ratio else OTHER_TITLES
+        title = rng.choice(titles).format(n=n)
+        anchors.append(f'<li><a href="/bids/{n}">{title} #{n}</a></li>')
+    return f"<html><body><nav><a href='/'>Home</a></nav><ul>{''.join(anchors)}</ul></body></html>"
+
+
+def make_bot(session):
+    bot = BidMonitorBot()
+    bot.session = session
+    return bot
+
+
+def time_runs(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def bench_source(session, source, method, runs):
+    """Time the full scraper plus its parse and match phases in isolation"""
+    fixture = session.load(BidMonitorBot.SOURCE_URLS[source])
+    if fixture is None:
+        return None
+    body = fixture[1]
+    bot = make_bot(session)
+
+    def scrape():
+        bot.opportunities = []
+        getattr(bot, method)()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        scrape_seconds = time_runs(scrape, runs)
+    matches = len(bot.opportunities)
+
+    def parse():
+        return BeautifulSoup(body, 'html.parser').find_all('a', href=True)
+
+    parse_seconds = time_runs(parse, runs)
+    links = parse()
+
+    def match():
+        for link in links:
+            bot.contains_keywords(link.get_text(strip=True))
+
+    match_seconds = time_runs(match, runs)
+
+    return {
+        'links': len(links),
+        'matches': matches,
+        'bytes': len(body),
+        'pages_per_sec': 1 / scrape_seconds if scrape_seconds else float('inf'),
+        'scrape_ms': scrape_seconds * 1000,
+        'parse_ms': parse_seconds * 1000,
+        'match_ms': match_seconds * 1000
+    }
+
+
+def bench_refresh(session, runs):
+    """All sources back to back, as run_monitor does (without the sleeps)"""
+    def refresh():
+        bot = make_bot(session)
+        for method in SCRAPERS.values():
+            getattr(bot, method)()
+        bot.add_sample_opportunities()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return time_runs(refresh, runs) * 1000
+
+
+def build_session(args):
+    session = ReplaySession(
+        args.fixtures or os.path.join(ROOT, 'fixtures', 'http'),
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        seed=args.seed
+    )
+    if not args.fixtures:
+        for i, source in enumerate(SCRAPERS):
+            session.add(BidMonitorBot.SOURCE_URLS[source],
+                        synthetic_listing_page(args.links, args.match_ratio, seed=args.seed + i))
+    return session
+
+
+def compare(results, baseline_path, tolerance):
+    """Return the list of metrics that regressed beyond tolerance"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            if not metric.endswith('_ms'):
+                continue
+            old = baseline.get(name, {}).get(metric)
+            if old and value > old * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {old:.1f} -> {value:.1f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--links', type=int, default=10000, help='links per synthetic listing page')
+    parser.add_argument('--match-ratio', type=float, default=0.05)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--fixtures', help='replay recorded fixtures instead of synthetic pages')
+    parser.add_argument('--latency', type=float, default=0.0, help='simulated seconds per request')
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--save-baseline', metavar='PATH')
+    parser.add_argument('--compare', metavar='PATH', help='fail if slower than this baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    session = build_session(args)
+    results = {}
+    for source, method in SCRAPERS.items():
+        result = bench_source(session, source, method, args.runs)
+        if result is None:
+            print(f"⚠ No fixture for {source}, skipping")
+            continue
+        results[source] = result
+    results['refresh'] = {'end_to_end_ms': bench_refresh(session, args.runs)}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("=" * 78)
+        print(f"🏁 SCRAPER BENCHMARK ({'fixtures' if args.fixtures else f'{args.links} synthetic links/page'})")
+        print("=" * 78)
+        print(f"{'source':<20}{'links':>8}{'matches':>9}{'pages/s':>9}{'scrape ms':>11}{'parse ms':>10}{'match ms':>10}")
+        for source in SCRAPERS:
+            if source not in results:
+                continue
+            r = results[source]
+            print(f"{source:<20}{r['links']:>8}{r['matches']:>9}{r['pages_per_sec']:>9.2f}"
+                  f"{r['scrape_ms']:>11.1f}{r['parse_ms']:>10.1f}{r['match_ms']:>10.1f}")
+        print(f"\nEnd-to-end refresh: {results['refresh']['end_to_end_ms']:.1f} ms")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        if regressions:
+            print("\n❌ Regressions beyond tolerance:")
+            for line in regressions:
+                print(f"   {line}")
+            sys.exit(1)
+        print("\n✅ No regressions beyond tolerance")
+
+
+if __name__ == '__main__':
+    main()
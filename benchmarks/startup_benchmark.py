@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures cold import time of the web app and time until the server
+answers /api/health, in fast-start and (optionally) blocking mode
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--include-blocking]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from common import APP_FILE, ROOT, free_port
+
+IMPORT_PROBE = f"""
+import importlib.util, json, sys, time
+sys.path.insert(0, {ROOT!r})
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('app', {APP_FILE!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(json.dumps({{
+    'seconds': time.perf_counter() - start,
+    'scrapers_loaded': any(m in sys.modules for m in ('requests', 'bs4', 'lxml'))
+}}))
+"""
+
+
+def measure_import(env):
+    """Cold import of the app module in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, '-c', IMPORT_PROBE],
+        env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_first_response(env, timeout=300):
+    """Seconds from process launch until /api/health answers"""
+    port = free_port()
+    env = dict(env, PORT=str(port))
+    url = f'http://127.0.0.1:{port}/api/health'
+
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, APP_FILE], cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f'server exited with code {proc.returncode}')
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.05)
+        raise TimeoutError(f'no response within {timeout}s')
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def summarize(label, samples):
+    print(f"   {label:<28} median {statistics.median(samples) * 1000:8.1f} ms"
+          f"   min {min(samples) * 1000:8.1f} ms   max {max(samples) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--include-blocking', action='store_true',
+                        help='also time BID_MONITOR_FAST_START=0 (performs live scrapes)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, BID_MONITOR_DB=os.path.join(tmp, 'bids.db'))
+
+        print("=" * 70)
+        print("⏱  STARTUP BENCHMARK")
+        print("=" * 70)
+
+        imports = [measure_import(env) for _ in range(args.runs)]
+        summarize('module import', [r['seconds'] for r in imports])
+        print(f"   scraper libraries loaded at import: {imports[-1]['scrapers_loaded']}")
+
+        modes = [('fast start', '1')]
+        if args.include_blocking:
+            modes.append(('blocking start', '0'))
+
+        for label, flag in modes:
+            mode_env = dict(env, BID_MONITOR_FAST_START=flag)
+            samples = [measure_first_response(mode_env) for _ in range(args.runs)]
+            summarize(f'first response ({label})', samples)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Synthetic Bid Generator
+Fills a bids database with realistic synthetic opportunities for load
+testing (100k-1M rows in batched transactions)
+
+Usage:
+    python benchmarks/synthetic_bids.py --db /tmp/bids.db --count 100000
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+from datetime import date, timedelta
+
+from common import load_app
+
+SOURCES = [
+    ('City of Cleveland', 'Cleveland, OH', 'Municipal', 'https://www.clevelandohio.gov/bids/'),
+    ('City of Parma', 'Parma, OH', 'Municipal', 'https://www.cityofparma-oh.gov/bids/'),
+    ('City of Lakewood', 'Lakewood, OH', 'Municipal', 'https://www.lakewoodoh.gov/bids/'),
+    ('Village of Chagrin Falls', 'Chagrin Falls, OH', 'Municipal', 'https://www.chagrin-falls.org/bids/'),
+    ('Cuyahoga County', 'Cuyahoga County, OH', 'County', 'https://cuyahogacounty.us/business/procurement/'),
+    ('Lake County', 'Lake County, OH', 'County', 'https://www.lakecountyohio.gov/bids/'),
+    ('State of Ohio', 'Ohio (Statewide)', 'State', 'https://procure.ohio.gov/bids/'),
+    ('ODOT District 12', 'Region 3 (Northeast Ohio)', 'State', 'https://www.transportation.ohio.gov/bids/')
+]
+
+SERVICES = [
+    'Storm Sewer Cleaning', 'Catch Basin Cleaning', 'Sanitary Sewer Jetting',
+    'Vac Truck Services', 'Hydro Excavation', 'Street Sweeping',
+    'Storm Drain Maintenance', 'Stormwater Compliance', 'CCTV Pipe Inspection',
+    'Culvert Repair', 'Janitorial Services', 'Snow Removal', 'Road Resurfacing'
+]
+SCOPES = ['Annual Contract', 'Zone {zone}', 'Emergency Response', 'Phase {zone}', 'Multi-Year Agreement']
+DETAILS = [
+    'vacuum truck operations', 'hydro-jetting of sanitary lines', 'storm drain debris removal',
+    'regulatory reporting', 'video inspection with reporting', 'drainage system repair',
+    'street cleaning', 'catch basin rebuilding', 'emergency overflow response'
+]
+
+COLUMNS = (
+    'bid_number', 'title', 'source', 'location', 'type', 'url', 'description',
+    'posted_date', 'deadline', 'keywords', 'is_active', 'is_favorited'
+)
+
+
+def synthetic_bids(count, seed=0, start_index=0):
+    """Yield `count` synthetic bid dicts"""
+    rng = random.Random(seed)
+    today = date.today()
+
+    for i in range(start_index, start_index + count):
+        source, location, bid_type, base_url = rng.choice(SOURCES)
+        service = rng.choice(SERVICES)
+        scope = rng.choice(SCOPES).format(zone=rng.randint(1, 12))
+        posted = today - timedelta(days=rng.randint(0, 730))
+        deadline = posted + timedelta(days=rng.randint(7, 45))
+        details = rng.sample(DETAILS, 3)
+
+        yield {
+            'bid_number': f"SYN-{bid_type[0]}-{posted.year}-{i:07d}",
+            'title': f"{service} - {scope}",
+            'source': source,
+            'location': location,
+            'type': bid_type,
+            'url': f"{base_url}{i}",
+            'description': f"{service} including {', '.join(details)} for {location}",
+            'posted_date': posted.isoformat(),
+            'deadline': deadline.isoformat(),
+            'is_active': 1 if deadline >= today or rng.random() < 0.2 else 0,
+            'is_favorited': 1 if rng.random() < 0.02 else 0
+        }
+
+
+def populate(db, count, seed=0, batch_size=5000):
+    """Insert synthetic bids in batched transactions; returns rows inserted"""
+    conn = sqlite3.connect(db.db_path)
+    placeholders = ','.join('?' * len(COLUMNS))
+    sql = f"INSERT OR IGNORE INTO bids ({','.join(COLUMNS)}) VALUES ({placeholders})"
+
+    start_index = conn.execute('SELECT COUNT(*) FROM bids').fetchone()[0]
+    profile = db.keyword_profile()
+    inserted = 0
+    batch = []
+    for bid in synthetic_bids(count, seed, start_index):
+        bid['keywords'] = db._extract_keywords(bid, profile)
+        batch.append(tuple(bid[c] for c in COLUMNS))
+        if len(batch) >= batch_size:
+            inserted += conn.executemany(sql, batch).rowcount
+            conn.commit()
+            batch = []
+    if batch:
+        inserted += conn.executemany(sql, batch).rowcount
+        conn.commit()
+
+    conn.close()
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', required=True, help='database file to fill (created if missing)')
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    app = load_app(args.db)
+
+    start = time.perf_counter()
+    inserted = populate(app.db, args.count, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"💾 Inserted {inserted} synthetic bids into {args.db} in {elapsed:.1f}s "
+          f"({inserted / elapsed:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
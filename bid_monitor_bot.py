@@ -5,136 +5,325 @@ Monitors government procurement sites for stormwater, vac truck, and cleaning se
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
-import csv
 from datetime import datetime
 import re
 from typing import List, Dict
 import time
+import os
+
+from exports import iter_csv, iter_json_array, write_chunks
+from artifacts import ExportStage, fingerprint
+from http_fixtures import configure_session
+from discovery import HostRateLimiter, MemoryCrawlState, SiteDiscovery
+from enrichment import DetailEnricher, MemoryDetailCache, extract_details
+from profiles import DEFAULT_PROFILE, CompiledProfile
+from reports import render_report
+from parse_pool import ParsePool, parse_listing
+from metrics import (
+    SOURCE_FETCH_SECONDS, SOURCE_LAST_SUCCESS, SOURCE_MATCHES,
+    SOURCE_PARSE_SECONDS, SOURCE_RESPONSE_BYTES, SOURCE_RESPONSES
+)
+
+# Column order for CSV exports; scraped links only fill a subset
+OPPORTUNITY_FIELDS = [
+    'bid_number', 'title', 'source', 'location', 'type', 'url',
+    'description', 'posted_date', 'deadline', 'relevance'
+]
 
 class BidMonitorBot:
-    def __init__(self):
-        self.keywords = [
-            'stormwater', 'storm water', 'drainage', 'sewer',
-            'vac truck', 'vacuum truck', 'vactor', 'hydro excavation',
-            'cleaning', 'street cleaning', 'catch basin', 'storm drain',
-            'jetting', 'pipe cleaning', 'sanitary sewer'
-        ]
+    # Procurement landing page checked for each source
+    SOURCE_URLS = {
+        'City of Cleveland': 'https://www.clevelandohio.gov/city-hall/departments/city-finance/purchasing-department',
+        'Cuyahoga County': 'https://cuyahogacounty.us/business/procurement',
+        'State of Ohio': 'https://procure.ohio.gov/Home'
+    }
+    
+    # Discovery mode: sitemaps plus listing pages crawled incrementally
+    DISCOVERY_CONFIG = {
+        'City of Cleveland': {
+            'sitemaps': ['https://www.clevelandohio.gov/sitemap.xml'],
+            'listing_urls': [SOURCE_URLS['City of Cleveland']],
+            'listing_pattern': r'purchasing|bid|rfp|rfq|solicitation',
+            'location': 'Cleveland, OH',
+            'type': 'Municipal'
+        },
+        'Cuyahoga County': {
+            'sitemaps': ['https://cuyahogacounty.us/sitemap.xml'],
+            'listing_urls': [SOURCE_URLS['Cuyahoga County']],
+            'listing_pattern': r'procurement|bid|rfp|rfq|solicitation',
+            'location': 'Cuyahoga County, OH',
+            'type': 'County'
+        },
+        'State of Ohio': {
+            'sitemaps': [],
+            'listing_urls': [SOURCE_URLS['State of Ohio']],
+            'listing_pattern': r'opportunit|bid|rfp|rfq|solicitation',
+            'location': 'Ohio (Statewide)',
+            'type': 'State'
+        }
+    }
+    
+    # CSS selectors for detail pages; generic text patterns are the fallback
+    DETAIL_SELECTORS = {
+        'City of Cleveland': {
+            'deadline': ['.field--name-field-due-date', '.bid-due-date'],
+            'bid_number': ['.field--name-field-bid-number', '.bid-number'],
+            'description': ['.field--name-body p', '.bid-description']
+        },
+        'Cuyahoga County': {
+            'deadline': ['.bid-details .due-date', 'td.closing-date'],
+            'bid_number': ['.bid-details .bid-number', 'td.bid-number'],
+            'description': ['.bid-details .description', '.content-area p']
+        },
+        'State of Ohio': {
+            'deadline': ['#lblCloseDate', '.opportunity-close-date'],
+            'bid_number': ['#lblDocumentNumber', '.opportunity-number'],
+            'description': ['#lblDescription', '.opportunity-description']
+        }
+    }
+    
+    # How links on each landing page are matched and normalized
+    LISTING_RULES = {
+        'City of Cleveland': {
+            'base_url': 'https://www.clevelandohio.gov',
+            'match_href': True,
+            'location': 'Cleveland, OH',
+            'type': 'Municipal'
+        },
+        'Cuyahoga County': {
+            'base_url': 'https://cuyahogacounty.us',
+            'match_href': False,
+            'location': 'Cuyahoga County, OH',
+            'type': 'County'
+        },
+        'State of Ohio': {
+            'base_url': 'https://procure.ohio.gov',
+            'match_href': False,
+            'location': 'Ohio (Statewide)',
+            'type': 'State'
+        }
+    }
+    
+    # Landing-page scraper for each source
+    SCRAPE_METHODS = {
+        'City of Cleveland': 'scrape_cleveland_city',
+        'Cuyahoga County': 'scrape_cuyahoga_county',
+        'State of Ohio': 'scrape_ohio_state'
+    }
+    
+    def __init__(self, profile: CompiledProfile = None, parse_pool: ParsePool = None, output_dir: str = None):
+        # Keywords, tags and relevance weights (editable in the web app)
+        self.profile = profile or CompiledProfile(DEFAULT_PROFILE)
+        self.keywords = self.profile.keywords
+        
+        # Worker processes for page parsing (inline unless a pool is given)
+        self.parse_pool = parse_pool or ParsePool(0)
+        
+        # One per-host request budget shared by discovery and enrichment
+        self.rate_limiter = HostRateLimiter(min_interval=1.0)  # Be polite to servers
+        
+        # Where CSV/JSON/HTML exports are written
+        self.output_dir = output_dir or os.environ.get('BID_MONITOR_OUTPUT_DIR', '/mnt/user-data/outputs')
         
         self.opportunities = []
+        
+        # Per-source outcome of the landing-page scrapes (run history)
+        self.source_runs = {}
+        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        
+        # live / record / replay, see http_fixtures.py
+        self.session = configure_session(self.session)
     
     def contains_keywords(self, text: str) -> bool:
         """Check if text contains any of our target keywords"""
-        if not text:
-            return False
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.keywords)
+        return self.profile.matches(text)
+    
+    def fetch_page(self, source: str, url: str, headers: Dict = None):
+        """GET a source page, recording latency, bytes and status"""
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=10)
+        except Exception:
+            SOURCE_FETCH_SECONDS.labels(source=source).observe(time.perf_counter() - start)
+            SOURCE_RESPONSES.labels(source=source, status='error').inc()
+            raise
+        
+        SOURCE_FETCH_SECONDS.labels(source=source).observe(time.perf_counter() - start)
+        SOURCE_RESPONSES.labels(source=source, status=response.status_code).inc()
+        SOURCE_RESPONSE_BYTES.labels(source=source).inc(len(response.content))
+        return response
     
     def scrape_cleveland_city(self):
         """Scrape City of Cleveland procurement opportunities"""
-        print("🔍 Checking City of Cleveland...")
-        
-        try:
-            # City of Cleveland uses various platforms - checking main procurement page
-            url = "https://www.clevelandohio.gov/city-hall/departments/city-finance/purchasing-department"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for bid links and documents
-                links = soup.find_all('a', href=True)
-                for link in links:
-                    link_text = link.get_text(strip=True)
-                    href = link['href']
-                    
-                    if self.contains_keywords(link_text) or self.contains_keywords(href):
-                        self.opportunities.append({
-                            'source': 'City of Cleveland',
-                            'title': link_text[:200],
-                            'url': href if href.startswith('http') else f"https://www.clevelandohio.gov{href}",
-                            'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                            'location': 'Cleveland, OH',
-                            'type': 'Municipal'
-                        })
-                
-                print(f"   ✓ Found {len([o for o in self.opportunities if o['source'] == 'City of Cleveland'])} opportunities")
-            
-        except Exception as e:
-            print(f"   ⚠ Error scraping Cleveland: {str(e)}")
+        return self.scrape_sources(['City of Cleveland'])['City of Cleveland']
     
     def scrape_cuyahoga_county(self):
         """Scrape Cuyahoga County procurement opportunities"""
-        print("🔍 Checking Cuyahoga County...")
-        
-        try:
-            # Cuyahoga County procurement portal
-            url = "https://cuyahogacounty.us/business/procurement"
-            response = self.session.get(url, timeout=10)
+        return self.scrape_sources(['Cuyahoga County'])['Cuyahoga County']
+    
+    def scrape_ohio_state(self):
+        """Scrape Ohio State procurement (DAS eProcurement)"""
+        return self.scrape_sources(['State of Ohio'])['State of Ohio']
+    
+    def scrape_source(self, source: str) -> List[Dict]:
+        """Run one source's landing-page scraper and return what it found"""
+        return self.scrape_sources([source])[source]
+    
+    def scrape_sources(self, sources: List[str], pause: float = 0) -> Dict[str, List[Dict]]:
+        """Fetch each source's landing page and parse them all
+
+        Each body goes to the parse pool as soon as it arrives, so pages are
+        parsed in parallel with each other and with the remaining fetches.
+        Returns the new opportunities per source (also added to
+        self.opportunities); timings, bytes, status and errors for each
+        source are left in self.source_runs. A source that failed is
+        reported there (and returns []) rather than raising, so one bad
+        source does not lose the others' results.
+        """
+        pending = []
+        for i, source in enumerate(sources):
+            print(f"🔍 Checking {source}...")
+            if i and pause:
+                time.sleep(pause)  # Be polite to servers
+            
+            run = self.source_runs[source] = {
+                'source': source,
+                'duration_seconds': 0.0,
+                'bytes': 0,
+                'http_status': None,
+                'parse_seconds': None,
+                'matches': 0,
+                'error': None
+            }
+            start = time.perf_counter()
+            try:
+                response = self.fetch_page(source, self.SOURCE_URLS[source])
+            except Exception as e:
+                print(f"   ⚠ Error scraping {source}: {str(e)}")
+                run['duration_seconds'] = time.perf_counter() - start
+                run['error'] = str(e)
+                continue
             
+            run['duration_seconds'] = time.perf_counter() - start
+            run['bytes'] = len(response.content)
+            run['http_status'] = response.status_code
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find bid opportunities
-                content = soup.get_text()
-                links = soup.find_all('a', href=True)
-                
-                for link in links:
-                    link_text = link.get_text(strip=True)
-                    href = link['href']
-                    
-                    if self.contains_keywords(link_text):
-                        self.opportunities.append({
-                            'source': 'Cuyahoga County',
-                            'title': link_text[:200],
-                            'url': href if href.startswith('http') else f"https://cuyahogacounty.us{href}",
-                            'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                            'location': 'Cuyahoga County, OH',
-                            'type': 'County'
-                        })
-                
-                print(f"   ✓ Found {len([o for o in self.opportunities if o['source'] == 'Cuyahoga County'])} opportunities")
+                rules = self.LISTING_RULES[source]
+                args = (response.content, self.profile.keyword_pattern.pattern,
+                        rules['base_url'], rules['match_href'])
+                pending.append((source, args, self.parse_pool.submit(parse_listing, *args)))
+            else:
+                run['error'] = f"HTTP {response.status_code}"
+        
+        found = {source: [] for source in sources}
+        for source, args, future in pending:
+            run = self.source_runs[source]
+            try:
+                # A crashed worker rebuilds the pool and parses this page inline
+                links, parse_seconds = self.parse_pool.result(future, parse_listing, *args)
+            except Exception as e:
+                print(f"   ⚠ Error parsing {source}: {str(e)}")
+                run['error'] = str(e)
+                continue
             
-        except Exception as e:
-            print(f"   ⚠ Error scraping Cuyahoga County: {str(e)}")
+            rules = self.LISTING_RULES[source]
+            posted_date = datetime.now().strftime('%Y-%m-%d')
+            found[source] = [{
+                'source': source,
+                'title': title,
+                'url': url,
+                'posted_date': posted_date,
+                'location': rules['location'],
+                'type': rules['type']
+            } for title, url in links]
+            self.opportunities.extend(found[source])
+            
+            run['parse_seconds'] = parse_seconds
+            run['duration_seconds'] += parse_seconds
+            run['matches'] = len(links)
+            SOURCE_PARSE_SECONDS.labels(source=source).observe(parse_seconds)
+            SOURCE_MATCHES.labels(source=source).inc(len(links))
+            SOURCE_LAST_SUCCESS.labels(source=source).set_to_current_time()
+            print(f"   ✓ Found {len([o for o in self.opportunities if o['source'] == source])} opportunities")
+        
+        return found
     
-    def scrape_ohio_state(self):
-        """Scrape Ohio State procurement (DAS eProcurement)"""
-        print("🔍 Checking Ohio State Procurement...")
+    def discover(self, state=None, sources: List[str] = None):
+        """Incrementally crawl sitemaps and listing pages for each source
+
+        `state` keeps per-URL validators between cycles (the web app passes
+        its BidDatabase); only new or changed pages are fetched and parsed.
+        Returns discovery stats per source.
+        """
+        state = state or MemoryCrawlState()
+        seen_urls = {o['url'] for o in self.opportunities}
+        stats = {}
         
-        try:
-            # Ohio's procurement system - checking publicly accessible pages
-            url = "https://procure.ohio.gov/Home"
-            response = self.session.get(url, timeout=10)
+        for source in sources or self.DISCOVERY_CONFIG:
+            print(f"🧭 Discovering {source}...")
+            crawler = SiteDiscovery(
+                source,
+                self.DISCOVERY_CONFIG[source],
+                fetch=lambda url, headers, source=source: self.fetch_page(source, url, headers),
+                state=state,
+                is_relevant=self.contains_keywords,
+                rate_limiter=self.rate_limiter
+            )
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for opportunities
-                links = soup.find_all('a', href=True)
-                for link in links:
-                    link_text = link.get_text(strip=True)
-                    href = link['href']
-                    
-                    if self.contains_keywords(link_text):
-                        self.opportunities.append({
-                            'source': 'State of Ohio',
-                            'title': link_text[:200],
-                            'url': href if href.startswith('http') else f"https://procure.ohio.gov{href}",
-                            'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                            'location': 'Ohio (Statewide)',
-                            'type': 'State'
-                        })
-                
-                print(f"   ✓ Found {len([o for o in self.opportunities if o['source'] == 'State of Ohio'])} opportunities")
+            # Errors propagate so the crawl queue can retry the source
+            found = crawler.crawl()
             
-        except Exception as e:
-            print(f"   ⚠ Error scraping Ohio State: {str(e)}")
+            new = [o for o in found if o['url'] not in seen_urls]
+            seen_urls.update(o['url'] for o in new)
+            self.opportunities.extend(new)
+            stats[source] = crawler.stats
+            print(f"   ✓ {len(new)} opportunities from {crawler.stats['fetched']} fetches "
+                  f"({crawler.stats['new']} new, {crawler.stats['changed']} changed pages)")
+        
+        return stats
+    
+    def enrich_opportunities(self, cache=None, max_workers: int = 8):
+        """Fetch detail pages concurrently and fill deadline, bid_number and description
+
+        `cache` keeps extracted details per URL between cycles (the web app
+        passes its BidDatabase), so each page is fetched once.
+        """
+        print("🔎 Enriching opportunities from detail pages...")
+        enricher = DetailEnricher(
+            fetch=self.fetch_page,
+            cache=cache or MemoryDetailCache(),
+            selectors=self.DETAIL_SELECTORS,
+            max_workers=max_workers,
+            rate_limiter=self.rate_limiter,
+            parse=lambda html, selectors: self.parse_pool.run(extract_details, html, selectors)
+        )
+        enricher.enrich(self.opportunities)
+        
+        stats = enricher.stats
+        print(f"   ✓ Enriched {stats['enriched']} opportunities "
+              f"({stats['fetched']} fetched, {stats['cache_hits']} cached, {stats['errors']} errors)")
+        return stats
+    
+    def rank_opportunities(self, model=None, corpus=(), min_relevance=None):
+        """Score all keyword matches in one batch, best first
+
+        Keyword hits are cheap candidates ("cleaning" also matches janitorial
+        work); the relevance model weighs every term, including negative ones.
+        Every match is kept with its score unless `min_relevance` is set.
+        """
+        model = model or self.profile.relevance
+        candidates = len(self.opportunities)
+        self.opportunities = model.rank(self.opportunities, corpus=corpus, min_relevance=min_relevance)
+        if min_relevance is None:
+            print(f"🎯 Ranked {candidates} candidates by relevance")
+        else:
+            print(f"🎯 Kept {len(self.opportunities)} of {candidates} candidates "
+                  f"scoring at least {min_relevance:g}")
+        return self.opportunities
     
     def add_sample_opportunities(self):
         """Add sample opportunities for demo purposes"""
@@ -207,18 +396,9 @@ class BidMonitorBot:
             print("⚠ No opportunities to save")
             return
         
-        filepath = f"/mnt/user-data/outputs/{filename}"
-        
-        # Get all unique keys from opportunities
-        fieldnames = set()
-        for opp in self.opportunities:
-            fieldnames.update(opp.keys())
-        fieldnames = sorted(list(fieldnames))
+        filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.opportunities)
+        write_chunks(filepath, iter_csv(self.opportunities, fieldnames=OPPORTUNITY_FIELDS))
         
         print(f"💾 Saved {len(self.opportunities)} opportunities to {filepath}")
         return filepath
@@ -229,10 +409,9 @@ class BidMonitorBot:
             print("⚠ No opportunities to save")
             return
         
-        filepath = f"/mnt/user-data/outputs/{filename}"
+        filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.opportunities, f, indent=2, ensure_ascii=False)
+        write_chunks(filepath, iter_json_array(self.opportunities))
         
         print(f"💾 Saved {len(self.opportunities)} opportunities to {filepath}")
         return filepath
@@ -243,195 +422,21 @@ class BidMonitorBot:
             print("⚠ No opportunities to report")
             return
         
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Bid Monitoring Report - Cleveland, OH</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{
-            margin: 0 0 10px 0;
-            font-size: 32px;
-        }}
-        .header p {{
-            margin: 5px 0;
-            opacity: 0.9;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .stat-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        .stat-card h3 {{
-            margin: 0 0 10px 0;
-            color: #667eea;
-            font-size: 36px;
-        }}
-        .stat-card p {{
-            margin: 0;
-            color: #666;
-            font-size: 14px;
-        }}
-        .opportunity {{
-            background: white;
-            padding: 25px;
-            margin-bottom: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            border-left: 4px solid #667eea;
-        }}
-        .opportunity h3 {{
-            margin: 0 0 15px 0;
-            color: #333;
-            font-size: 20px;
-        }}
-        .meta {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 15px;
-            margin-bottom: 15px;
-        }}
-        .badge {{
-            display: inline-block;
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            background-color: #e0e7ff;
-            color: #4338ca;
-        }}
-        .badge.municipal {{
-            background-color: #dbeafe;
-            color: #1e40af;
-        }}
-        .badge.county {{
-            background-color: #d1fae5;
-            color: #065f46;
-        }}
-        .badge.state {{
-            background-color: #fef3c7;
-            color: #92400e;
-        }}
-        .description {{
-            color: #666;
-            line-height: 1.6;
-            margin-bottom: 15px;
-        }}
-        .link {{
-            display: inline-block;
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-            padding: 10px 20px;
-            border: 2px solid #667eea;
-            border-radius: 5px;
-            transition: all 0.3s;
-        }}
-        .link:hover {{
-            background-color: #667eea;
-            color: white;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding: 20px;
-            color: #666;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🚛 Public Bidding Opportunities</h1>
-        <p><strong>Location:</strong> Cleveland, Ohio & Northeast Ohio Region</p>
-        <p><strong>Services:</strong> Stormwater Compliance, Vac Truck Services, Cleaning</p>
-        <p><strong>Generated:</strong> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-    </div>
-    
-    <div class="stats">
-        <div class="stat-card">
-            <h3>{len(self.opportunities)}</h3>
-            <p>Total Opportunities</p>
-        </div>
-        <div class="stat-card">
-            <h3>{len([o for o in self.opportunities if o['type'] == 'Municipal'])}</h3>
-            <p>Municipal Bids</p>
-        </div>
-        <div class="stat-card">
-            <h3>{len([o for o in self.opportunities if o['type'] == 'County'])}</h3>
-            <p>County Bids</p>
-        </div>
-        <div class="stat-card">
-            <h3>{len([o for o in self.opportunities if o['type'] == 'State'])}</h3>
-            <p>State Bids</p>
-        </div>
-    </div>
-    
-    <h2 style="color: #333; margin-bottom: 20px;">📋 Active Opportunities</h2>
-"""
-        
-        for opp in self.opportunities:
-            badge_class = opp['type'].lower()
-            html_content += f"""
-    <div class="opportunity">
-        <h3>{opp['title']}</h3>
-        <div class="meta">
-            <span class="badge {badge_class}">{opp['type']}</span>
-            <span class="badge">📍 {opp['location']}</span>
-            <span class="badge">📅 Posted: {opp['posted_date']}</span>
-            {f"<span class='badge'>⏰ Due: {opp['deadline']}</span>" if 'deadline' in opp else ""}
-            {f"<span class='badge'>🔢 {opp['bid_number']}</span>" if 'bid_number' in opp else ""}
-        </div>
-        {f"<div class='description'>{opp['description']}</div>" if 'description' in opp else ""}
-        <div>
-            <strong>Source:</strong> {opp['source']}
-        </div>
-        <div style="margin-top: 15px;">
-            <a href="{opp['url']}" class="link" target="_blank">View Opportunity →</a>
-        </div>
-    </div>
-"""
-        
-        html_content += """
-    <div class="footer">
-        <p>🤖 Automated Bid Monitoring Bot - Cleveland, Ohio Demo</p>
-        <p>This report is automatically generated. Always verify details on official procurement websites.</p>
-    </div>
-</body>
-</html>
-"""
-        
-        filepath = "/mnt/user-data/outputs/bid_report.html"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        filepath = os.path.join(self.output_dir, 'bid_report.html')
+        write_chunks(filepath, render_report(self.opportunities))
         
         print(f"📊 Generated HTML report: {filepath}")
         return filepath
     
+    def export(self):
+        """Publish the CSV, JSON and HTML exports unless they already hold these opportunities"""
+        if not self.opportunities:
+            print("⚠ No opportunities to save")
+            return
+        
+        stage = ExportStage(self.output_dir, fieldnames=OPPORTUNITY_FIELDS)
+        return stage.export(fingerprint(self.opportunities), lambda: self.opportunities)
+    
     def run(self):
         """Main execution method"""
         print("=" * 60)
@@ -441,17 +446,11 @@ class BidMonitorBot:
         print()
         
         # Scrape real sources
-        self.scrape_cleveland_city()
-        time.sleep(1)  # Be polite to servers
-        
-        self.scrape_cuyahoga_county()
-        time.sleep(1)
-        
-        self.scrape_ohio_state()
-        time.sleep(1)
+        self.scrape_sources(list(self.SCRAPE_METHODS), pause=1)  # Be polite to servers
         
         # Add sample data for demo
         self.add_sample_opportunities()
+        self.rank_opportunities()
         
         print()
         print("=" * 60)
@@ -459,10 +458,8 @@ class BidMonitorBot:
         print("=" * 60)
         print()
         
-        # Save results
-        self.save_to_csv()
-        self.save_to_json()
-        self.generate_report()
+        # Save results (skipped when nothing changed since the last run)
+        self.export()
         
         print()
         print("🎉 Demo complete! Check the output files above.")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Response Compression
+Negotiated gzip/brotli for API responses, plus content-hashed,
+precompressed dashboard assets with long-lived cache headers
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import zlib
+
+from flask import Response, abort, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Responses smaller than this are not worth the CPU
+MIN_COMPRESS_SIZE = 1024
+
+COMPRESSIBLE_TYPES = (
+    'application/json',
+    'application/javascript',
+    'application/x-ndjson',
+    'image/svg+xml',
+    'text/'
+)
+
+# Never buffer or transform the live event stream
+UNCOMPRESSIBLE_TYPES = ('text/event-stream',)
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+
+def choose_encoding(accept_encodings, allow_brotli=True):
+    """Pick the best supported encoding the client accepts (or None)"""
+    if allow_brotli and brotli is not None and accept_encodings.quality('br') > 0:
+        return 'br'
+    if accept_encodings.quality('gzip') > 0:
+        return 'gzip'
+    return None
+
+
+def compress(data, encoding, level=6):
+    """Compress bytes with the given content encoding"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=min(level, 11))
+    return gzip.compress(data, compresslevel=min(level, 9), mtime=0)
+
+
+def _is_compressible(mimetype):
+    if not mimetype or mimetype in UNCOMPRESSIBLE_TYPES:
+        return False
+    return mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def _gzip_stream(chunks, level=6):
+    """Incrementally gzip a streamed body, flushing after every chunk"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def init_compression(app, min_size=MIN_COMPRESS_SIZE):
+    """Register negotiated compression for dynamic responses"""
+
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or not _is_compressible(response.mimetype)):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        if response.is_streamed:
+            # Streamed exports: gzip incrementally so the first byte
+            # still goes out immediately
+            if choose_encoding(request.accept_encodings, allow_brotli=False):
+                response.response = _gzip_stream(response.iter_encoded())
+                response.headers['Content-Encoding'] = 'gzip'
+                response.headers.pop('Content-Length', None)
+            return response
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        encoding = choose_encoding(request.accept_encodings)
+        if encoding:
+            response.set_data(compress(data, encoding))
+            response.headers['Content-Encoding'] = encoding
+        return response
+
+
+class StaticAsset:
+    """A dashboard file served under a content-hashed name"""
+
+    def __init__(self, root, name):
+        with open(os.path.join(root, name), 'rb') as f:
+            self.data = f.read()
+
+        self.name = name
+        self.digest = hashlib.sha256(self.data).hexdigest()[:12]
+        stem, ext = os.path.splitext(name)
+        self.hashed_name = f"{stem}.{self.digest}{ext}"
+        self.mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        self._encoded = {}
+
+    def encoded(self, encoding):
+        """Return the body for an encoding, compressing once at max level"""
+        if encoding is None:
+            return self.data
+        if encoding not in self._encoded:
+            self._encoded[encoding] = compress(self.data, encoding, level=11)
+        return self._encoded[encoding]
+
+
+class StaticAssets:
+    """Content-hashed, precompressed dashboard assets
+
+    Every asset referenced by index.html is fingerprinted at startup, so it
+    can be cached forever; index.html itself is rewritten to point at the
+    hashed URLs and revalidated on each load.
+    """
+
+    ASSET_PATTERN = re.compile(r'(?:href|src)="((?:css|js)/[^"]+)"')
+
+    def __init__(self, root, index_name='index.html', url_prefix='/assets/'):
+        self.root = root
+        self.url_prefix = url_prefix
+        self.assets = {}
+
+        with open(os.path.join(root, index_name), encoding='utf-8') as f:
+            index_html = f.read()
+
+        for name in self.ASSET_PATTERN.findall(index_html):
+            asset = StaticAsset(root, name)
+            self.assets[asset.hashed_name] = asset
+            index_html = index_html.replace(f'"{name}"', f'"{url_prefix}{asset.hashed_name}"')
+
+        self.index_html = index_html
+        self.index_etag = hashlib.sha256(index_html.encode('utf-8')).hexdigest()[:16]
+
+    def warm(self):
+        """Precompress every asset ahead of the first request"""
+        encodings = ['gzip'] + (['br'] if brotli is not None else [])
+        for asset in self.assets.values():
+            for encoding in encodings:
+                asset.encoded(encoding)
+
+    def url_for(self, name):
+        """Hashed URL for a logical asset name"""
+        for asset in self.assets.values():
+            if asset.name == name:
+                return self.url_prefix + asset.hashed_name
+        return None
+
+    def index_response(self):
+        """index.html with hashed asset URLs (always revalidated)"""
+        response = Response(self.index_html, mimetype='text/html')
+        response.set_etag(self.index_etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+
+    def asset_response(self, hashed_name):
+        """Serve a fingerprinted asset, precompressed when accepted"""
+        asset = self.assets.get(hashed_name)
+        if asset is None:
+            abort(404)
+
+        encoding = choose_encoding(request.accept_encodings)
+        response = Response(asset.encoded(encoding), mimetype=asset.mimetype)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE
+        response.set_etag(f"{asset.digest}-{encoding or 'identity'}")
+        return response.make_conditional(request)
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Crawl Queue
+Durable work queue in SQLite for source scrapes and detail fetches, with
+leases and retry counts so a killed worker's run resumes where it stopped
+and several processes can share the work
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+# Task kinds, in the order a run processes them
+SOURCE_TASK = 'source'
+DISCOVER_TASK = 'discover'
+DETAIL_TASK = 'detail'
+
+# Lease length per task kind (renewed while a worker is busy with the task);
+# a discovery crawl walks up to max_pages rate-limited pages
+LEASE_SECONDS = {SOURCE_TASK: 120, DISCOVER_TASK: 900, DETAIL_TASK: 300}
+
+# How long a run stays claimed by the process ingesting it without any
+# lease activity (a claimant that died is replaced after this)
+RUN_CLAIM_SECONDS = 1800
+
+
+def worker_id():
+    """Identify this process/thread as a lease owner"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def retryable(http_status):
+    """Whether a failed fetch is worth retrying (network errors, 5xx, 408, 429)"""
+    return http_status is None or http_status >= 500 or http_status in (408, 429)
+
+
+class CrawlQueue:
+    """Persistent queue of crawl tasks grouped into runs"""
+
+    def __init__(self, db_path, lease_seconds=None, max_attempts=3, retry_backoff=30,
+                 max_run_attempts=3, max_run_hours=24, run_claim_seconds=RUN_CLAIM_SECONDS):
+        self.db_path = db_path
+        # One number for every kind, or a dict overriding LEASE_SECONDS
+        if isinstance(lease_seconds, (int, float)):
+            lease_seconds = dict.fromkeys(LEASE_SECONDS, lease_seconds)
+        self.lease_seconds = dict(LEASE_SECONDS, **(lease_seconds or {}))
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_run_attempts = max_run_attempts
+        self.max_run_hours = max_run_hours
+        self.run_claim_seconds = run_claim_seconds
+        self.init_tables()
+
+    def get_connection(self):
+        # Autocommit mode; lease() opens its own IMMEDIATE transaction
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init_tables(self):
+        conn = self.get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_runs (
+                run_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'running',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        ''')
+        # Columns added after the first release
+        columns = {row['name'] for row in conn.execute('PRAGMA table_info(crawl_runs)')}
+        if 'attempts' not in columns:
+            conn.execute('ALTER TABLE crawl_runs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+        if 'last_error' not in columns:
+            conn.execute('ALTER TABLE crawl_runs ADD COLUMN last_error TEXT')
+        if 'owner' not in columns:
+            conn.execute('ALTER TABLE crawl_runs ADD COLUMN owner TEXT')
+        if 'claim_expires' not in columns:
+            conn.execute('ALTER TABLE crawl_runs ADD COLUMN claim_expires REAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_queue (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                source TEXT NOT NULL,
+                url TEXT NOT NULL DEFAULT '',
+                payload TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                available_at REAL NOT NULL DEFAULT 0,
+                result TEXT,
+                last_error TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(run_id, kind, source, url)
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_crawl_queue_run ON crawl_queue(run_id, status)')
+        conn.close()
+
+    # Runs
+
+    def start_run(self, owner=None):
+        """Create a new run (claimed by `owner`, if given) and return its id"""
+        run_id = datetime.now().strftime('%Y%m%d%H%M%S-') + uuid.uuid4().hex[:6]
+        conn = self.get_connection()
+        conn.execute(
+            'INSERT INTO crawl_runs (run_id, owner, claim_expires) VALUES (?, ?, ?)',
+            (run_id, owner, time.time() + self.run_claim_seconds if owner else None)
+        )
+        conn.close()
+        return run_id
+
+    def _expire_runs(self, conn):
+        # Runs that keep killing their process are not resumed forever
+        conn.execute('''
+            UPDATE crawl_runs
+            SET status = 'failed', finished_at = CURRENT_TIMESTAMP,
+                last_error = COALESCE(last_error, 'expired before ingest')
+            WHERE status = 'running' AND created_at < datetime('now', ?)
+        ''', (f'-{int(self.max_run_hours)} hours',))
+
+    def unfinished_run(self):
+        """Most recent run that was never ingested (None if all finished)
+
+        Runs older than max_run_hours are given up first. This only looks;
+        use claim_run() to take a run over.
+        """
+        conn = self.get_connection()
+        self._expire_runs(conn)
+        row = conn.execute('''
+            SELECT run_id FROM crawl_runs WHERE status = 'running'
+            ORDER BY created_at DESC, run_id DESC LIMIT 1
+        ''').fetchone()
+        conn.close()
+        return row['run_id'] if row else None
+
+    def claim_run(self, owner):
+        """Take over the most recent unfinished run for `owner`
+
+        Returns its id, or None if there is no unfinished run or another
+        owner still holds a live claim on it (that owner is ingesting it;
+        its claim is extended whenever it leases or renews tasks).
+        """
+        now = time.time()
+        conn = self.get_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            self._expire_runs(conn)
+            row = conn.execute('''
+                SELECT run_id, owner, claim_expires FROM crawl_runs WHERE status = 'running'
+                ORDER BY created_at DESC, run_id DESC LIMIT 1
+            ''').fetchone()
+            if row is None or (row['owner'] not in (None, owner) and (row['claim_expires'] or 0) > now):
+                conn.execute('COMMIT')
+                return None
+            conn.execute(
+                'UPDATE crawl_runs SET owner = ?, claim_expires = ? WHERE run_id = ?',
+                (owner, now + self.run_claim_seconds, row['run_id'])
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return row['run_id']
+
+    def _extend_claim(self, conn, run_id, owner):
+        conn.execute(
+            'UPDATE crawl_runs SET claim_expires = ? WHERE run_id = ? AND owner = ?',
+            (time.time() + self.run_claim_seconds, run_id, owner)
+        )
+
+    def finish_run(self, run_id, status='ingested'):
+        conn = self.get_connection()
+        conn.execute('''
+            UPDATE crawl_runs SET status = ?, finished_at = CURRENT_TIMESTAMP
+            WHERE run_id = ?
+        ''', (status, run_id))
+        conn.close()
+
+    def fail_run(self, run_id, error):
+        """Count a failed ingest of a run; gives the run up after max_run_attempts
+
+        Returns True if the run was marked failed (it will not be resumed).
+        """
+        conn = self.get_connection()
+        conn.execute('''
+            UPDATE crawl_runs
+            SET attempts = attempts + 1, last_error = ?, claim_expires = NULL,
+                status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE status END,
+                finished_at = CASE WHEN attempts + 1 >= ? THEN CURRENT_TIMESTAMP ELSE finished_at END
+            WHERE run_id = ? AND status = 'running'
+        ''', (str(error)[:500], self.max_run_attempts, self.max_run_attempts, run_id))
+        row = conn.execute('SELECT status FROM crawl_runs WHERE run_id = ?', (run_id,)).fetchone()
+        conn.close()
+        return row is not None and row['status'] == 'failed'
+
+    def run_status(self, run_id):
+        """Task counts by status for a run"""
+        conn = self.get_connection()
+        rows = conn.execute('''
+            SELECT status, COUNT(*) AS n FROM crawl_queue WHERE run_id = ? GROUP BY status
+        ''', (run_id,)).fetchall()
+        conn.close()
+        return {row['status']: row['n'] for row in rows}
+
+    def purge(self, keep_days=7):
+        """Delete tasks and runs finished more than keep_days ago"""
+        conn = self.get_connection()
+        conn.execute('BEGIN IMMEDIATE')
+        stale = f'-{int(keep_days)} days'
+        conn.execute('''
+            DELETE FROM crawl_queue WHERE run_id IN (
+                SELECT run_id FROM crawl_runs
+                WHERE status != 'running' AND finished_at < datetime('now', ?)
+            )
+        ''', (stale,))
+        conn.execute('''
+            DELETE FROM crawl_runs WHERE status != 'running' AND finished_at < datetime('now', ?)
+        ''', (stale,))
+        conn.execute('COMMIT')
+        conn.close()
+
+    # Tasks
+
+    def enqueue(self, run_id, kind, source, url='', payload=None):
+        """Add a task (ignored if the same task already exists in the run)"""
+        conn = self.get_connection()
+        conn.execute('''
+            INSERT OR IGNORE INTO crawl_queue (run_id, kind, source, url, payload)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (run_id, kind, source, url or '', json.dumps(payload) if payload is not None else None))
+        conn.close()
+
+    def lease(self, run_id, kind, owner, limit=1):
+        """Atomically claim up to `limit` ready tasks of one kind
+
+        Ready means pending and past its retry backoff, or leased by a
+        worker whose lease has expired (crashed or killed mid-task).
+        """
+        now = time.time()
+        conn = self.get_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # Tasks that keep killing their worker eventually give up
+            conn.execute('''
+                UPDATE crawl_queue
+                SET status = 'failed', last_error = 'lease expired', lease_owner = NULL
+                WHERE run_id = ? AND kind = ? AND status = 'leased'
+                    AND lease_expires < ? AND attempts >= ?
+            ''', (run_id, kind, now, self.max_attempts))
+            rows = conn.execute('''
+                SELECT * FROM crawl_queue
+                WHERE run_id = ? AND kind = ? AND (
+                    (status = 'pending' AND available_at <= ?)
+                    OR (status = 'leased' AND lease_expires < ?)
+                )
+                ORDER BY id LIMIT ?
+            ''', (run_id, kind, now, now, limit)).fetchall()
+
+            for row in rows:
+                conn.execute('''
+                    UPDATE crawl_queue
+                    SET status = 'leased', lease_owner = ?, lease_expires = ?,
+                        attempts = attempts + 1, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (owner, now + self.lease_seconds[kind], row['id']))
+            self._extend_claim(conn, run_id, owner)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+        tasks = []
+        for row in rows:
+            task = dict(row)
+            task['payload'] = json.loads(task['payload']) if task['payload'] else None
+            task['attempts'] += 1
+            tasks.append(task)
+        return tasks
+
+    def renew(self, tasks, owner):
+        """Extend the leases of tasks this owner is still working on"""
+        now = time.time()
+        conn = self.get_connection()
+        conn.executemany('''
+            UPDATE crawl_queue SET lease_expires = ?
+            WHERE id = ? AND lease_owner = ? AND status = 'leased'
+        ''', [(now + self.lease_seconds[task['kind']], task['id'], owner) for task in tasks])
+        for run_id in {task['run_id'] for task in tasks}:
+            self._extend_claim(conn, run_id, owner)
+        conn.close()
+
+    def complete(self, task, owner, result=None):
+        """Mark a leased task done and store its result"""
+        conn = self.get_connection()
+        conn.execute('''
+            UPDATE crawl_queue
+            SET status = 'done', result = ?, lease_owner = NULL, lease_expires = NULL,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND lease_owner = ?
+        ''', (json.dumps(result), task['id'], owner))
+        conn.close()
+
+    def fail(self, task, owner, error, retry=True):
+        """Release a task for retry with backoff, or mark it failed
+
+        `retry=False` fails it straight away (errors that will not go away,
+        e.g. a 404).
+        """
+        if not retry or task['attempts'] >= self.max_attempts:
+            status, available_at = 'failed', 0
+        else:
+            status = 'pending'
+            available_at = time.time() + self.retry_backoff * 2 ** (task['attempts'] - 1)
+
+        conn = self.get_connection()
+        conn.execute('''
+            UPDATE crawl_queue
+            SET status = ?, available_at = ?, last_error = ?, lease_owner = NULL,
+                lease_expires = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND lease_owner = ?
+        ''', (status, available_at, str(error)[:500], task['id'], owner))
+        conn.close()
+
+    def outstanding(self, run_id, kinds=None):
+        """Number of tasks not yet done or failed"""
+        query = "SELECT COUNT(*) AS n FROM crawl_queue WHERE run_id = ? AND status IN ('pending', 'leased')"
+        params = [run_id]
+        if kinds:
+            query += f" AND kind IN ({','.join('?' * len(kinds))})"
+            params.extend(kinds)
+        conn = self.get_connection()
+        row = conn.execute(query, params).fetchone()
+        conn.close()
+        return row['n']
+
+    def failed_sources(self, run_id, kinds):
+        """Sources with a task of one of `kinds` that failed for good"""
+        conn = self.get_connection()
+        rows = conn.execute(f'''
+            SELECT DISTINCT source FROM crawl_queue
+            WHERE run_id = ? AND status = 'failed' AND kind IN ({','.join('?' * len(kinds))})
+        ''', [run_id] + list(kinds)).fetchall()
+        conn.close()
+        return {row['source'] for row in rows}
+
+    def results(self, run_id, kind):
+        """Results of completed tasks of one kind, in queue order"""
+        conn = self.get_connection()
+        rows = conn.execute('''
+            SELECT source, url, result FROM crawl_queue
+            WHERE run_id = ? AND kind = ? AND status = 'done' ORDER BY id
+        ''', (run_id, kind)).fetchall()
+        conn.close()
+        return [(row['source'], row['url'], json.loads(row['result'])) for row in rows]
+
+
+class CrawlWorker:
+    """Pulls tasks for a run from the queue and executes them
+
+    `bot_factory` builds a BidMonitorBot; `store` persists crawl state, the
+    detail cache and per-source run history (the web app passes its
+    BidDatabase). Any number of workers (threads or processes) can drain
+    the same run.
+    """
+
+    def __init__(self, queue, bot_factory, store=None, enrich=True,
+                 pause=1.0, detail_batch=16, source_batch=1, on_progress=None):
+        self.queue = queue
+        self.bot_factory = bot_factory
+        self.store = store
+        self.enrich = enrich
+        self.pause = pause
+        self.detail_batch = detail_batch
+        self.source_batch = source_batch  # >1 lets a parse pool work on several pages
+        self.on_progress = on_progress
+        self.owner = worker_id()
+
+    def drain(self, run_id, idle_wait=2.0):
+        """Process the run until no task is outstanding"""
+        bot = self.bot_factory()
+
+        for kind in (SOURCE_TASK, DISCOVER_TASK, DETAIL_TASK):
+            while True:
+                limit = {DETAIL_TASK: self.detail_batch, SOURCE_TASK: self.source_batch}.get(kind, 1)
+                tasks = self.queue.lease(run_id, kind, self.owner, limit=limit)
+                if tasks:
+                    self._execute(bot, kind, tasks, run_id)
+                    continue
+                if not self.queue.outstanding(run_id, [kind]):
+                    break
+                # Tasks leased elsewhere or waiting out a retry backoff
+                time.sleep(idle_wait)
+
+    def _execute(self, bot, kind, tasks, run_id):
+        with self._keep_leased(kind, tasks):
+            if kind == DETAIL_TASK:
+                self._execute_details(bot, tasks)
+                return
+
+            try:
+                bot.opportunities = []
+                if kind == SOURCE_TASK:
+                    bot.source_runs = {}
+                    found = bot.scrape_sources([task['source'] for task in tasks], pause=self.pause)
+                else:
+                    bot.discover(state=self.store, sources=[tasks[0]['source']])
+                    found = {tasks[0]['source']: list(bot.opportunities)}
+            except Exception as e:
+                for task in tasks:
+                    self.queue.fail(task, self.owner, e)
+                return
+
+            if kind == SOURCE_TASK and self.store is not None:
+                self.store.log_source_runs(run_id, bot.source_runs.values())
+            for task in tasks:
+                run = bot.source_runs.get(task['source'], {}) if kind == SOURCE_TASK else {}
+                if run.get('error'):
+                    # Retry/backoff instead of completing with an empty result
+                    self.queue.fail(task, self.owner, run['error'], retry=retryable(run.get('http_status')))
+                else:
+                    self._complete(task, kind, run_id, found.get(task['source'], []))
+        time.sleep(self.pause)  # Be polite to servers
+
+    @contextmanager
+    def _keep_leased(self, kind, tasks):
+        """Renew the tasks' leases while they run so a slow crawl is not re-leased"""
+        done = threading.Event()
+        interval = self.queue.lease_seconds[kind] / 3
+
+        def renew():
+            while not done.wait(interval):
+                self.queue.renew(tasks, self.owner)
+
+        thread = threading.Thread(target=renew, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def _complete(self, task, kind, run_id, found):
+        self.queue.complete(task, self.owner, found)
+        if self.enrich:
+            for opp in found:
+                if not (opp.get('deadline') and opp.get('bid_number') and opp.get('description')):
+                    self.queue.enqueue(run_id, DETAIL_TASK, opp['source'], opp['url'], opp)
+
+        if self.on_progress:
+            self.on_progress(kind, task['source'], len(found))
+
+    def _execute_details(self, bot, tasks):
+        opportunities = [dict(task['payload']) for task in tasks]
+        try:
+            bot.opportunities = opportunities
+            bot.enrich_opportunities(cache=self.store)
+        except Exception as e:
+            for task in tasks:
+                self.queue.fail(task, self.owner, e)
+            return
+
+        for task, opp in zip(tasks, opportunities):
+            self.queue.complete(task, self.owner, opp)
+
+
+def collect_opportunities(queue, run_id):
+    """Merge a run's source/discovery results with their enriched details"""
+    details = {(source, url): opp for source, url, opp in queue.results(run_id, DETAIL_TASK)}
+
+    opportunities = []
+    for kind in (SOURCE_TASK, DISCOVER_TASK):
+        for source, _, found in queue.results(run_id, kind):
+            for opp in found:
+                opportunities.append(details.get((opp['source'], opp['url']), opp))
+    return opportunities
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Near-Duplicate Detection
+MinHash signatures over character shingles of title + description, with
+locality-sensitive hashing (banding) so a new posting is compared only
+against the few earlier postings that share a band bucket, never pairwise
+against the whole history
+"""
+
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+NUM_PERM = 64
+BANDS = 16  # 16 bands x 4 rows: pairs above ~0.5 Jaccard almost always collide
+SHINGLE_SIZE = 5
+THRESHOLD = 0.6  # Estimated Jaccard at or above which postings are duplicates
+
+NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_text(text):
+    return NON_WORD.sub(' ', (text or '').lower()).strip()
+
+
+class MinHasher:
+    """Fixed family of NUM_PERM multiply-shift hash functions"""
+
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS, shingle_size=SHINGLE_SIZE, seed=1):
+        if num_perm % bands:
+            raise ValueError('num_perm must be a multiple of bands')
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self.b = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+    def shingles(self, text):
+        text = normalize_text(text)
+        k = self.shingle_size
+        if len(text) <= k:
+            return {zlib.crc32(text.encode())} if text else set()
+        return {zlib.crc32(text[i:i + k].encode()) for i in range(len(text) - k + 1)}
+
+    def signature(self, text):
+        """uint32 MinHash signature (None for empty text)"""
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        # (a*x + b) mod 2^64, top 32 bits; uint64 arithmetic wraps as intended
+        with np.errstate(over='ignore'):
+            hashed = (np.outer(values, self.a) + self.b) >> np.uint64(32)
+        return hashed.min(axis=0).astype(np.uint32)
+
+    def band_keys(self, signature):
+        """One signed 64-bit bucket key per band (band index mixed in)"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(bytes([band]) + chunk, digest_size=8).digest()
+            keys.append(int.from_bytes(digest, 'big', signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        """Estimated Jaccard similarity of the underlying shingle sets"""
+        return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+    @staticmethod
+    def to_blob(signature):
+        return signature.tobytes()
+
+    @staticmethod
+    def from_blob(blob):
+        return np.frombuffer(blob, dtype=np.uint32)
+
+
+def bid_text(bid):
+    return f"{bid.get('title', '')} {bid.get('description', '') or ''}"
+
+
+class MinHashLSH:
+    """In-memory LSH index (the web app keeps the same buckets in SQLite)"""
+
+    def __init__(self, hasher=None, threshold=THRESHOLD):
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self.buckets = {}
+        self.signatures = {}
+
+    def insert(self, key, signature):
+        self.signatures[key] = signature
+        for bucket in self.hasher.band_keys(signature):
+            self.buckets.setdefault(bucket, []).append(key)
+
+    def query(self, signature):
+        """Keys of indexed items at or above the threshold, most similar first"""
+        candidates = set()
+        for bucket in self.hasher.band_keys(signature):
+            candidates.update(self.buckets.get(bucket, ()))
+        scored = [(self.hasher.similarity(signature, self.signatures[k]), k) for k in candidates]
+        return [k for score, k in sorted(scored, key=lambda s: -s[0]) if score >= self.threshold]
+
+    def __len__(self):
+        return len(self.signatures)
+
+
+def collapse_repeats(opportunities):
+    """Drop exact repeats (same bid number, or same URL) within one batch
+
+    Scraped pages often link the same posting several times; the first
+    occurrence is kept and filled in with fields only later copies have.
+    A shared URL with different bid numbers is a listing page naming
+    several bids, so those are kept. Near-duplicates with their own URL and
+    bid number are distinct postings too; the duplicate index labels them
+    with a shared cluster.
+    """
+    by_number = {}
+    by_url = {}
+    kept = []
+    for opp in opportunities:
+        number = opp.get('bid_number')
+        url = opp.get('url')
+        original = by_number.get(number) if number else None
+        if original is None and url:
+            original = next((o for o in by_url.get(url, ())
+                             if not (number and o.get('bid_number') and o['bid_number'] != number)), None)
+
+        if original is None:
+            kept.append(opp)
+            original = opp
+            if url:
+                by_url.setdefault(url, []).append(opp)
+        else:
+            for field, value in opp.items():
+                if value and not original.get(field):
+                    original[field] = value
+        if original.get('bid_number'):
+            by_number.setdefault(original['bid_number'], original)
+    return kept
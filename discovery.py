@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Discovery
+Incremental crawl of procurement sites: reads sitemaps (honoring lastmod),
+follows paginated listing pages through a bounded frontier, and only
+fetches pages that are new or changed since the last crawl
+"""
+
+import gzip
+import hashlib
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+# Query parameters that never change page content
+TRACKING_PARAMS = re.compile(r'^(utm_.*|fbclid|gclid|sessionid|sid)$', re.IGNORECASE)
+
+PAGINATION_TEXT = re.compile(r'^(next|next page|older|more|›|»|>|\d{1,3})$', re.IGNORECASE)
+PAGINATION_QUERY = re.compile(r'(^|&)(page|pg|p|start|offset)=\d+', re.IGNORECASE)
+
+
+def normalize_url(url, base=None):
+    """Canonical form of a URL for de-duplication (None if not http/https)"""
+    if base:
+        url = urljoin(base, url)
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https'):
+        return None
+
+    host = (parts.hostname or '').lower()
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(k)
+    ))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+def url_bid_number(url):
+    """Stable stand-in bid number for a posting that shows none (from its URL)"""
+    key = normalize_url(url) if url else None
+    key = key or (url or '').strip()
+    return f"URL-{hashlib.sha1(key.encode()).hexdigest()[:16]}" if key else ''
+
+
+class HostRateLimiter:
+    """Enforces a minimum delay between requests to the same host"""
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CrawlFrontier:
+    """Bounded FIFO of URLs to visit, de-duplicated on normalized URL"""
+
+    def __init__(self, allowed_hosts, max_pages=50, max_depth=3):
+        self.allowed_hosts = {h.lower() for h in allowed_hosts}
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.queue = deque()
+        self.seen = set()
+
+    def add(self, url, depth=0, lastmod=None):
+        """Queue a URL; returns False if it is out of bounds or already seen"""
+        if url is None or depth > self.max_depth or url in self.seen:
+            return False
+        if urlsplit(url).hostname not in self.allowed_hosts:
+            return False
+        if len(self.seen) >= self.max_pages:
+            return False
+        self.seen.add(url)
+        self.queue.append((url, depth, lastmod))
+        return True
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def __len__(self):
+        return len(self.queue)
+
+
+class MemoryCrawlState:
+    """In-process crawl state (the web app persists it in BidDatabase)"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def get_crawl_state(self, url):
+        return self.rows.get(url)
+
+    def save_crawl_state(self, url, source, changed=True, **fields):
+        row = self.rows.setdefault(url, {'url': url})
+        row.update({k: v for k, v in fields.items() if v is not None},
+                   source=source, last_crawled=datetime.now().isoformat())
+        if changed:
+            row['last_changed'] = row['last_crawled']
+
+
+def parse_sitemap(content):
+    """Parse a sitemap or sitemap index
+
+    Returns (child sitemaps, pages); both are lists of (loc, lastmod).
+    """
+    if content[:2] == b'\x1f\x8b':
+        content = gzip.decompress(content)
+
+    root = ET.fromstring(content)
+    sitemaps, pages = [], []
+    for entry in root:
+        tag = entry.tag.rsplit('}', 1)[-1]
+        fields = {child.tag.rsplit('}', 1)[-1]: (child.text or '').strip() for child in entry}
+        if not fields.get('loc'):
+            continue
+        target = sitemaps if tag == 'sitemap' else pages
+        target.append((fields['loc'], fields.get('lastmod') or None))
+    return sitemaps, pages
+
+
+class SiteDiscovery:
+    """Incremental discovery for one source
+
+    `fetch(url, headers)` performs the GET (the bot passes its instrumented
+    fetch_page), `state` stores per-URL validators, and `is_relevant(text)`
+    decides whether a link is an opportunity.
+    """
+
+    def __init__(self, source, config, fetch, state, is_relevant,
+                 rate_limiter=None, max_sitemaps=10):
+        self.source = source
+        self.config = config
+        self.fetch = fetch
+        self.state = state
+        self.is_relevant = is_relevant
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.max_sitemaps = max_sitemaps
+        self.listing_pattern = re.compile(config.get('listing_pattern', r'bid|rfp|rfq|solicitation|procurement'), re.IGNORECASE)
+        self.stats = {
+            'requests': 0, 'fetched': 0, 'not_modified': 0, 'unchanged': 0, 'new': 0, 'changed': 0,
+            'skipped_by_lastmod': 0, 'errors': 0, 'matches': 0
+        }
+
+    def crawl(self):
+        """Run one discovery cycle and return opportunity dicts
+
+        Raises RuntimeError when every request failed, so an unreachable
+        site is reported as a failed crawl rather than an unchanged one.
+        """
+        start_urls = [normalize_url(u) for u in self.config.get('listing_urls', [])]
+        hosts = {urlsplit(u).hostname for u in start_urls + self.config.get('sitemaps', [])}
+        frontier = CrawlFrontier(
+            hosts,
+            max_pages=self.config.get('max_pages', 50),
+            max_depth=self.config.get('max_depth', 3)
+        )
+
+        for url in start_urls:
+            frontier.add(url)
+        self._seed_from_sitemaps(frontier)
+
+        opportunities = {}
+        while frontier:
+            url, depth, lastmod = frontier.pop()
+            soup = self._fetch_if_changed(url, lastmod)
+            if soup is not None:
+                self._expand(soup, url, depth, frontier, opportunities)
+            else:
+                # Unchanged (or failed) page: its own links were ingested
+                # before, but pages it leads to may have changed since
+                state = self.state.get_crawl_state(url)
+                for link in (state or {}).get('links') or ():
+                    frontier.add(link, depth + 1)
+
+        self.stats['matches'] = len(opportunities)
+        if self.stats['requests'] and self.stats['errors'] == self.stats['requests']:
+            raise RuntimeError(f"Discovery for {self.source} failed: all {self.stats['requests']} requests errored")
+        return list(opportunities.values())
+
+    def _seed_from_sitemaps(self, frontier):
+        pending = [(url, None) for url in self.config.get('sitemaps', [])]
+        visited = 0
+        while pending and visited < self.max_sitemaps:
+            sitemap_url, sitemap_lastmod = pending.pop(0)
+            visited += 1
+            self.stats['requests'] += 1
+            try:
+                self.rate_limiter.wait(sitemap_url)
+                response = self.fetch(sitemap_url, {})
+                if response.status_code != 200:
+                    raise RuntimeError(f'HTTP {response.status_code}')
+                sitemaps, pages = parse_sitemap(response.content)
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"   ⚠ Sitemap error {sitemap_url}: {e}")
+                continue
+            if sitemap_lastmod:
+                # Lets the parent index skip this sitemap until its lastmod moves
+                self.state.save_crawl_state(sitemap_url, self.source, sitemap_lastmod=sitemap_lastmod)
+
+            for loc, lastmod in sitemaps:
+                if self._lastmod_changed(loc, lastmod):
+                    pending.append((loc, lastmod))
+
+            for loc, lastmod in pages:
+                url = normalize_url(loc)
+                if url is None or not (self.listing_pattern.search(url) or self.is_relevant(url)):
+                    continue
+                if self._lastmod_changed(url, lastmod):
+                    frontier.add(url, 0, lastmod)
+
+    def _lastmod_changed(self, url, lastmod):
+        if not lastmod:
+            return True
+        state = self.state.get_crawl_state(url)
+        if state and state.get('sitemap_lastmod') == lastmod:
+            self.stats['skipped_by_lastmod'] += 1
+            return False
+        return True
+
+    def _fetch_if_changed(self, url, lastmod):
+        """Conditional GET; returns parsed HTML only for new/changed pages"""
+        state = self.state.get_crawl_state(url)
+        headers = {}
+        if state:
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+
+        self.stats['requests'] += 1
+        try:
+            self.rate_limiter.wait(url)
+            response = self.fetch(url, headers)
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"   ⚠ Discovery error {url}: {e}")
+            return None
+
+        self.stats['fetched'] += 1
+        if response.status_code == 304:
+            self.stats['not_modified'] += 1
+            self.state.save_crawl_state(url, self.source, changed=False, sitemap_lastmod=lastmod)
+            return None
+        if response.status_code != 200:
+            self.stats['errors'] += 1
+            print(f"   ⚠ Discovery error {url}: HTTP {response.status_code}")
+            return None
+
+        content_hash = hashlib.sha1(response.content).hexdigest()
+        changed = not state or state.get('content_hash') != content_hash
+        self.state.save_crawl_state(
+            url, self.source, changed=changed,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            content_hash=content_hash,
+            sitemap_lastmod=lastmod
+        )
+        if not changed:
+            self.stats['unchanged'] += 1
+            return None
+
+        self.stats['changed' if state else 'new'] += 1
+        from bs4 import BeautifulSoup  # Deferred like the other scraper imports
+        return BeautifulSoup(response.content, 'html.parser')
+
+    def _expand(self, soup, page_url, depth, frontier, opportunities):
+        listing_links = []
+        for link in soup.find_all('a', href=True):
+            url = normalize_url(link['href'], page_url)
+            if url is None:
+                continue
+            text = link.get_text(strip=True)
+
+            if self.is_relevant(text):
+                if url not in opportunities:
+                    opportunities[url] = {
+                        'source': self.source,
+                        'title': text[:200],
+                        'url': url,
+                        'posted_date': datetime.now().strftime('%Y-%m-%d'),
+                        'location': self.config['location'],
+                        'type': self.config['type']
+                    }
+            elif self._is_listing_link(link, text, url):
+                listing_links.append(url)
+                frontier.add(url, depth + 1)
+
+        # Kept so the page can be expanded again while it stays unchanged
+        self.state.save_crawl_state(page_url, self.source, changed=False, links=list(dict.fromkeys(listing_links)))
+
+    def _is_listing_link(self, link, text, url):
+        if 'next' in (link.get('rel') or []):
+            return True
+        if PAGINATION_TEXT.match(text) and PAGINATION_QUERY.search(urlsplit(url).query):
+            return True
+        return bool(self.listing_pattern.search(urlsplit(url).path))
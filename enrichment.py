@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Detail Enrichment
+Fetches matched opportunities' detail pages concurrently (bounded per
+host) and extracts deadline, bid number and description, caching the
+result per URL so each page is fetched once rather than every cycle
+"""
+
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+from discovery import HostRateLimiter
+
+ENRICHED_FIELDS = ('deadline', 'bid_number', 'description')
+
+# Generic fallbacks when a source has no selector or it finds nothing
+BID_NUMBER_PATTERN = re.compile(
+    r'(?:bid|rfp|rfq|ifb|solicitation|project|contract)\s*(?:no\.?|number|#)\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-_/.]{2,40})',
+    re.IGNORECASE
+)
+DEADLINE_PATTERN = re.compile(
+    r'(?:due date|deadline|closing date|bids? due|proposals? due|closes|opening date)\s*[:\-]?\s*'
+    r'([A-Za-z]{3,9}\.? \d{1,2},? \d{4}|\d{1,2}/\d{1,2}/\d{2,4}|\d{4}-\d{2}-\d{2})',
+    re.IGNORECASE
+)
+DATE_FORMATS = ('%B %d, %Y', '%B %d %Y', '%b %d, %Y', '%b %d %Y', '%b. %d, %Y',
+                '%m/%d/%Y', '%m/%d/%y', '%Y-%m-%d')
+
+
+def normalize_date(text):
+    """Parse a human date into YYYY-MM-DD (None if unrecognized)"""
+    text = ' '.join(text.split())
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return None
+
+
+def extract_details(html, selectors=None):
+    """Pull deadline / bid_number / description out of a detail page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    selectors = selectors or {}
+    details = {}
+
+    for field in ENRICHED_FIELDS:
+        for selector in selectors.get(field, []):
+            node = soup.select_one(selector)
+            if node and node.get_text(strip=True):
+                details[field] = node.get_text(' ', strip=True)
+                break
+
+    text = soup.get_text(' ', strip=True)
+    if 'bid_number' not in details:
+        match = BID_NUMBER_PATTERN.search(text)
+        if match:
+            details['bid_number'] = match.group(1).rstrip('.')
+    if 'deadline' not in details:
+        match = DEADLINE_PATTERN.search(text)
+        if match:
+            details['deadline'] = match.group(1)
+    if 'description' not in details:
+        meta = soup.find('meta', attrs={'name': 'description'})
+        if meta and meta.get('content'):
+            details['description'] = meta['content'].strip()
+        else:
+            paragraph = next((p.get_text(' ', strip=True) for p in soup.find_all('p')
+                              if len(p.get_text(strip=True)) >= 60), None)
+            if paragraph:
+                details['description'] = paragraph
+
+    if 'deadline' in details:
+        details['deadline'] = normalize_date(details['deadline']) or details['deadline']
+    if 'description' in details:
+        details['description'] = details['description'][:1000]
+    return details
+
+
+class MemoryDetailCache:
+    """In-process detail cache (the web app persists it in BidDatabase)"""
+
+    def __init__(self):
+        self.rows = {}
+        self._lock = threading.Lock()
+
+    def get_detail_cache(self, url):
+        return self.rows.get(url)
+
+    def save_detail_cache(self, url, details, etag=None, last_modified=None):
+        with self._lock:
+            self.rows[url] = {
+                'url': url, 'details': details, 'etag': etag,
+                'last_modified': last_modified, 'fetched_at': datetime.now().isoformat()
+            }
+
+
+class DetailEnricher:
+    """Concurrent detail-page fetcher with per-host limits and a URL cache
+
+    Cached entries younger than `revalidate_after` are used without any
+    request; older ones are revalidated with If-None-Match/If-Modified-Since.
+    """
+
+    def __init__(self, fetch, cache, selectors=None, max_workers=8, per_host=2,
+                 rate_limiter=None, revalidate_after=timedelta(days=7), parse=extract_details):
+        self.fetch = fetch
+        self.parse = parse  # e.g. handed to a process pool by the bot
+        self.cache = cache
+        self.selectors = selectors or {}
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or HostRateLimiter(min_interval=0.5)
+        self.revalidate_after = revalidate_after
+        self._host_slots = defaultdict(lambda: threading.BoundedSemaphore(per_host))
+        self._slots_lock = threading.Lock()
+        self.stats = {'cache_hits': 0, 'fetched': 0, 'not_modified': 0, 'errors': 0, 'enriched': 0}
+        self._stats_lock = threading.Lock()
+
+    def enrich(self, opportunities):
+        """Fill missing detail fields in place; returns the enriched count"""
+        by_url = defaultdict(list)
+        for opp in opportunities:
+            if opp.get('url') and any(not opp.get(f) for f in ENRICHED_FIELDS):
+                by_url[opp['url']].append(opp)
+
+        if not by_url:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(self._details_for, by_url.items())
+            for (url, opps), details in zip(by_url.items(), results):
+                if not details:
+                    continue
+                for opp in opps:
+                    for field in ENRICHED_FIELDS:
+                        if details.get(field) and not opp.get(field):
+                            opp[field] = details[field]
+                self._count('enriched', len(opps))
+
+        return self.stats['enriched']
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _host_slot(self, url):
+        with self._slots_lock:
+            return self._host_slots[urlsplit(url).netloc]
+
+    def _details_for(self, item):
+        url, opps = item
+        cached = self.cache.get_detail_cache(url)
+        if cached and self._is_fresh(cached):
+            self._count('cache_hits')
+            return cached['details']
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            with self._host_slot(url):
+                self.rate_limiter.wait(url)
+                response = self.fetch(opps[0]['source'], url, headers)
+        except Exception as e:
+            self._count('errors')
+            print(f"   ⚠ Detail fetch failed {url}: {e}")
+            return cached['details'] if cached else None
+
+        self._count('fetched')
+        if response.status_code == 304 and cached:
+            self._count('not_modified')
+            self.cache.save_detail_cache(url, cached['details'], cached.get('etag'), cached.get('last_modified'))
+            return cached['details']
+        if response.status_code != 200:
+            return cached['details'] if cached else None
+
+        details = self.parse(response.content, self.selectors.get(opps[0]['source']))
+        self.cache.save_detail_cache(
+            url, details,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        return details
+
+    def _is_fresh(self, cached):
+        fetched_at = cached.get('fetched_at')
+        if not fetched_at:
+            return False
+        try:
+            fetched = datetime.fromisoformat(str(fetched_at))
+        except ValueError:
+            return False
+        return datetime.now() - fetched < self.revalidate_after
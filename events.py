@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Event Broker
+Pushes new/changed bids and refresh progress to connected dashboards
+via Server-Sent Events, with a long-poll fallback
+"""
+
+import json
+import threading
+import time
+from collections import deque
+
+# How long an idle stream waits before sending a keepalive comment
+HEARTBEAT_SECONDS = 15
+
+# Client reconnect delay advertised to EventSource
+RETRY_MS = 5000
+
+
+def format_sse(event):
+    """Format a stored event as an SSE message"""
+    return f"id: {event['id']}\nevent: {event['event_type']}\ndata: {json.dumps(event['payload'])}\n\n"
+
+
+class EventBroker:
+    """Fans out persisted change events to every connected client
+
+    Events are written to the `events` table in the same transaction as the
+    change they describe, so every gunicorn worker sees them. One poller
+    thread per process reads new rows and wakes all waiting clients through
+    a shared condition - clients hold no queue of their own, which keeps
+    hundreds of idle connections cheap.
+    """
+
+    def __init__(self, db, poll_interval=1.0, backlog=500):
+        self.db = db
+        self.poll_interval = poll_interval
+        self.last_event_id = None
+        self.running = False
+        self.thread = None
+        self._recent = deque(maxlen=backlog)
+        self._cond = threading.Condition()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+
+        # Wake the poller as soon as this process commits a change
+        db.change_listeners.append(self.notify)
+
+    def start(self):
+        """Start the event poller (idempotent)"""
+        with self._lock:
+            if self.running:
+                return
+            self.last_event_id = self.db.get_latest_event_id()
+            self.running = True
+            self.thread = threading.Thread(target=self._poll_loop, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Stop the event poller"""
+        self.running = False
+        self._wakeup.set()
+
+    def notify(self):
+        """Signal that new events may have been committed"""
+        self._wakeup.set()
+
+    def publish(self, event_type, payload):
+        """Persist an event and wake subscribers"""
+        event_id = self.db.record_event(event_type, payload)
+        self.notify()
+        return event_id
+
+    def _poll_loop(self):
+        """Pick up events committed by any process"""
+        while self.running:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                self._fetch_new_events()
+            except Exception as e:
+                print(f"⚠ Event poller error: {e}")
+                time.sleep(self.poll_interval)
+
+    def _fetch_new_events(self):
+        events = self.db.get_events_since(self.last_event_id or 0, limit=self._recent.maxlen)
+        if not events:
+            return
+
+        with self._cond:
+            self._recent.extend(events)
+            self.last_event_id = events[-1]['id']
+            self._cond.notify_all()
+
+    def wait_for_events(self, since, timeout):
+        """Block until events newer than `since` exist, or timeout
+
+        Returns a list of events (possibly empty on timeout).
+        """
+        self.start()
+        deadline = time.monotonic() + timeout
+
+        with self._cond:
+            while (self.last_event_id or 0) <= since:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running:
+                    return []
+                self._cond.wait(remaining)
+
+            # Serve from the in-memory backlog when it covers the gap
+            if self._recent and self._recent[0]['id'] <= since + 1:
+                return [e for e in self._recent if e['id'] > since]
+
+        # Client is further behind than the backlog - read from the table
+        return self.db.get_events_since(since, limit=self._recent.maxlen)
+
+    def stream(self, last_event_id=None):
+        """Generate an SSE stream, resuming after `last_event_id` if given"""
+        self.start()
+        cursor = (self.last_event_id or 0) if last_event_id is None else last_event_id
+
+        yield f"retry: {RETRY_MS}\n\n"
+        while self.running:
+            events = self.wait_for_events(cursor, HEARTBEAT_SECONDS)
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+
+            for event in events:
+                cursor = event['id']
+                yield format_sse(event)
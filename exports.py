@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Streaming Exports
+Turns row iterators into CSV / NDJSON / JSON chunks without
+materializing the full result set
+"""
+
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+
+# Flush buffered rows once a chunk reaches this size
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_csv(rows, fieldnames=None, chunk_size=CHUNK_SIZE):
+    """Yield CSV text chunks for an iterable of dicts
+
+    Field names come from `fieldnames` or the first row; the header is
+    yielded on its own so the first byte goes out immediately.
+    """
+    rows = iter(rows)
+    first = None
+    if fieldnames is None:
+        first = next(rows, None)
+        if first is None:
+            return
+        fieldnames = list(first.keys())
+
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, restval='', extrasaction='ignore')
+    writer.writeheader()
+    yield _drain(buffer)
+
+    if first is not None:
+        writer.writerow(first)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield _drain(buffer)
+
+    if buffer.tell():
+        yield _drain(buffer)
+
+
+def iter_ndjson(rows, chunk_size=CHUNK_SIZE):
+    """Yield newline-delimited JSON chunks for an iterable of dicts"""
+    parts = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row, ensure_ascii=False) + '\n'
+        parts.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield ''.join(parts)
+            parts = []
+            size = 0
+
+    if parts:
+        yield ''.join(parts)
+
+
+def iter_json_array(rows, indent=2):
+    """Yield a pretty-printed JSON array one element at a time"""
+    pad = ' ' * indent
+    first = True
+    yield '['
+    for row in rows:
+        item = json.dumps(row, indent=indent, ensure_ascii=False).replace('\n', '\n' + pad)
+        yield ('\n' if first else ',\n') + pad + item
+        first = False
+    yield '\n]' if not first else ']'
+
+
+def write_chunks(filepath, chunks):
+    """Write an iterable of text chunks to a file
+
+    The chunks go to a temporary file in the same directory that replaces
+    `filepath` only once complete, so readers see the old file or the new
+    one, never a truncated one.
+    """
+    directory, name = os.path.split(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files; keep the mode readers expect
+        os.chmod(tmp_path, os.stat(filepath).st_mode & 0o777 if os.path.exists(filepath) else 0o644)
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return filepath
+
+
+def _drain(buffer):
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
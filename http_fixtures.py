@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor HTTP Fixtures
+Record live scraper responses to fixture files and replay them offline,
+with configurable latency and failure injection
+
+Modes are selected with BID_MONITOR_HTTP_MODE (live | record | replay)
+and BID_MONITOR_FIXTURES (fixture directory).
+"""
+
+import hashlib
+import json
+import os
+import random
+import time
+
+import requests
+
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'http')
+
+
+def fixture_key(url):
+    """Stable file-name key for a URL"""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+
+def build_response(url, status_code, body, headers=None):
+    """Build a requests.Response without touching the network"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.reason = 'OK' if status_code < 400 else 'Error'
+    return response
+
+
+class RecordingSession:
+    """Wraps a live session and saves every response as a fixture"""
+
+    # Headers worth keeping for replay; the rest are noise
+    KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+    def __init__(self, session, fixture_dir=DEFAULT_FIXTURE_DIR):
+        self.session = session
+        self.headers = session.headers
+        self.fixture_dir = fixture_dir
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    def get(self, url, **kwargs):
+        response = self.session.get(url, **kwargs)
+        self.save(url, response)
+        return response
+
+    def save(self, url, response):
+        key = fixture_key(url)
+        with open(os.path.join(self.fixture_dir, f'{key}.body'), 'wb') as f:
+            f.write(response.content)
+        with open(os.path.join(self.fixture_dir, f'{key}.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'url': url,
+                'status': response.status_code,
+                'headers': {h: response.headers[h] for h in self.KEPT_HEADERS if h in response.headers},
+                'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }, f, indent=2)
+
+
+class ReplaySession:
+    """Local stand-in for requests.Session that serves recorded fixtures
+
+    latency/jitter add a simulated round-trip in seconds; failure_rate is
+    the share of requests that raise a connection error and error_rate the
+    share answered with HTTP 503. URLs without a fixture get a 404.
+    """
+
+    def __init__(self, fixture_dir=DEFAULT_FIXTURE_DIR, latency=0.0, jitter=0.0,
+                 failure_rate=0.0, error_rate=0.0, seed=None):
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.error_rate = error_rate
+        self.headers = {}
+        self.requests_made = 0
+        self._random = random.Random(seed)
+        self._memory = {}
+
+    def add(self, url, body, status=200, headers=None):
+        """Register an in-memory fixture (e.g. a synthetic page)"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self._memory[url] = (status, body, headers or {'Content-Type': 'text/html; charset=utf-8'})
+
+    def load(self, url):
+        """Return (status, body, headers) for a URL, or None"""
+        if url in self._memory:
+            return self._memory[url]
+
+        key = fixture_key(url)
+        meta_path = os.path.join(self.fixture_dir, f'{key}.json')
+        if not os.path.exists(meta_path):
+            return None
+
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(os.path.join(self.fixture_dir, f'{key}.body'), 'rb') as f:
+            body = f.read()
+        return meta['status'], body, meta.get('headers', {})
+
+    def get(self, url, timeout=None, **kwargs):
+        self.requests_made += 1
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            raise requests.ConnectionError(f'Injected failure for {url}')
+        if self.error_rate and self._random.random() < self.error_rate:
+            return build_response(url, 503, b'Service Unavailable')
+
+        fixture = self.load(url)
+        if fixture is None:
+            return build_response(url, 404, b'No fixture recorded')
+
+        status, body, headers = fixture
+        return build_response(url, status, body, headers)
+
+
+def configure_session(session, mode=None, fixture_dir=None):
+    """Wrap a live session according to the configured HTTP mode"""
+    mode = mode or os.environ.get('BID_MONITOR_HTTP_MODE', 'live')
+    fixture_dir = fixture_dir or os.environ.get('BID_MONITOR_FIXTURES', DEFAULT_FIXTURE_DIR)
+
+    if mode == 'record':
+        return RecordingSession(session, fixture_dir)
+    if mode == 'replay':
+        return ReplaySession(
+            fixture_dir,
+            latency=float(os.environ.get('BID_MONITOR_REPLAY_LATENCY', 0)),
+            failure_rate=float(os.environ.get('BID_MONITOR_REPLAY_FAILURE_RATE', 0))
+        )
+    return session
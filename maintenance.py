@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Database Maintenance
+Keeps the SQLite file healthy from a background thread: refreshes
+optimizer statistics, checkpoints the WAL, returns free pages to the
+filesystem with incremental vacuum and takes online backups with the
+sqlite3 backup API. All work is done in small slices with pauses in
+between so API reads and the monitor's writes are never held up for long
+
+Run one pass by hand:
+    python maintenance.py /path/to/bids.db --backup-dir /path/to/backups
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from metrics import MAINTENANCE_SECONDS
+
+MAINTENANCE_TASKS = ('checkpoint', 'analyze', 'vacuum', 'backup')
+
+# Existing databases are switched to incremental auto-vacuum (which takes a
+# one-off full VACUUM) only while they are small enough for that to be quick
+CONVERT_LIMIT_BYTES = 64 * 1024 * 1024
+
+
+class DatabaseMaintenance:
+    """Scheduled maintenance passes over one SQLite database
+
+    Each task has its own period; a pass runs the tasks that are due and
+    records how long each took in `last_report`. Backups are only taken
+    when `backup_dir` is set.
+    """
+
+    def __init__(self, db_path, backup_dir=None, interval=6 * 3600, analyze_every=24 * 3600,
+                 backup_every=24 * 3600, keep_backups=3, vacuum_pages=256, max_vacuum_slices=64,
+                 backup_pages=256, analysis_limit=1000, pause=0.05, initial_delay=600):
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self.interval = interval
+        self.periods = {
+            'checkpoint': interval,
+            'vacuum': interval,
+            'analyze': analyze_every,
+            'backup': backup_every
+        }
+        self.keep_backups = keep_backups
+        self.vacuum_pages = vacuum_pages
+        self.max_vacuum_slices = max_vacuum_slices
+        self.backup_pages = backup_pages
+        self.analysis_limit = analysis_limit
+        self.pause = pause
+        self.initial_delay = initial_delay
+
+        self.last_run = {}
+        self.last_report = None
+        self.running = False
+        self.thread = None
+        self._wake = threading.Event()
+        self._pass_lock = threading.Lock()
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def start(self):
+        if not self.running:
+            self.running = True
+            self.thread = threading.Thread(target=self._loop, daemon=True)
+            self.thread.start()
+            print(f"✅ Database maintenance scheduled (every {self.interval / 3600:g}h)")
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+
+    def _loop(self):
+        # Stay out of the way of the startup scrape
+        self._wake.wait(self.initial_delay)
+        while self.running:
+            try:
+                self.run_pass()
+            except Exception as e:
+                print(f"❌ Database maintenance error: {e}")
+            self._wake.wait(self.interval)
+
+    def due_tasks(self, now=None):
+        now = now or time.time()
+        return [
+            task for task in MAINTENANCE_TASKS
+            if now - self.last_run.get(task, 0) >= self.periods[task]
+            and (task != 'backup' or self.backup_dir)
+        ]
+
+    def run_pass(self, tasks=None):
+        """Run the given (default: due) tasks; returns the timing report"""
+        with self._pass_lock:
+            wanted = tasks or self.due_tasks()
+            tasks = [task for task in MAINTENANCE_TASKS if task in wanted]
+            report = {'started_at': datetime.now().isoformat(timespec='seconds'), 'tasks': {}}
+            start = time.perf_counter()
+
+            for task in tasks:
+                task_start = time.perf_counter()
+                try:
+                    result = getattr(self, task)()
+                    status = 'ok'
+                except Exception as e:
+                    result = {'error': str(e)}
+                    status = 'error'
+                seconds = time.perf_counter() - task_start
+                MAINTENANCE_SECONDS.labels(task=task, status=status).observe(seconds)
+                report['tasks'][task] = {'status': status, 'ms': round(seconds * 1000, 1), **result}
+                self.last_run[task] = time.time()
+
+            report['ms'] = round((time.perf_counter() - start) * 1000, 1)
+            self.last_report = report
+            if tasks:
+                summary = ', '.join(f"{task} {r['ms']:.0f}ms" for task, r in report['tasks'].items())
+                print(f"🧹 Database maintenance: {summary}")
+            return report
+
+    def checkpoint(self):
+        """Copy committed WAL frames into the database without waiting on readers"""
+        conn = self.get_connection()
+        try:
+            busy, log_frames, checkpointed = conn.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchone()
+        finally:
+            conn.close()
+        return {'busy': bool(busy), 'wal_frames': log_frames, 'checkpointed': checkpointed}
+
+    def analyze(self):
+        """Refresh planner statistics one table at a time (sampled via analysis_limit)"""
+        conn = self.get_connection()
+        try:
+            conn.execute(f'PRAGMA analysis_limit={int(self.analysis_limit)}')
+            tables = [row['name'] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            )]
+            for table in tables:
+                conn.execute(f'ANALYZE "{table}"')
+                conn.commit()
+                time.sleep(self.pause)
+            conn.execute('PRAGMA optimize')
+        finally:
+            conn.close()
+        return {'tables': len(tables)}
+
+    def vacuum(self):
+        """Give free pages back to the filesystem, `vacuum_pages` per transaction"""
+        conn = self.get_connection()
+        try:
+            result = {'converted': False}
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                if os.path.getsize(self.db_path) > CONVERT_LIMIT_BYTES:
+                    result['skipped'] = 'auto_vacuum is not incremental; run a one-off VACUUM to enable it'
+                    return result
+                # Takes effect with one full VACUUM; cheap while the file is small
+                conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                conn.execute('VACUUM')
+                result['converted'] = True
+
+            free_before = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            slices = 0
+            while slices < self.max_vacuum_slices and conn.execute('PRAGMA freelist_count').fetchone()[0]:
+                # execute() steps this pragma once, which frees a single page;
+                # executescript() runs it to completion
+                conn.executescript(f'PRAGMA incremental_vacuum({int(self.vacuum_pages)});')
+                conn.commit()
+                slices += 1
+                time.sleep(self.pause)
+            free_after = conn.execute('PRAGMA freelist_count').fetchone()[0]
+        finally:
+            conn.close()
+        result.update({'pages_freed': free_before - free_after, 'free_pages': free_after, 'slices': slices})
+        return result
+
+    def backup(self):
+        """Online copy via the backup API, `backup_pages` pages per step"""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        name = f"{os.path.splitext(os.path.basename(self.db_path))[0]}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.db"
+        path = os.path.join(self.backup_dir, name)
+        tmp_path = path + '.tmp'
+
+        source = self.get_connection()
+        target = sqlite3.connect(tmp_path)
+        try:
+            source.backup(target, pages=self.backup_pages, sleep=self.pause)
+        finally:
+            target.close()
+            source.close()
+        os.replace(tmp_path, path)
+
+        backups = sorted(
+            f for f in os.listdir(self.backup_dir)
+            if f.startswith(name.rsplit('-', 2)[0] + '-') and f.endswith('.db')
+        )
+        for old in backups[:-self.keep_backups] if self.keep_backups else []:
+            os.remove(os.path.join(self.backup_dir, old))
+        return {'path': path, 'bytes': os.path.getsize(path)}
+
+    def status(self):
+        return {
+            'running': self.running,
+            'interval_seconds': self.interval,
+            'backups_enabled': bool(self.backup_dir),
+            'last_run': {
+                task: datetime.fromtimestamp(ts).isoformat(timespec='seconds')
+                for task, ts in self.last_run.items()
+            },
+            'last_report': self.last_report
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('db_path')
+    parser.add_argument('--backup-dir')
+    parser.add_argument('--tasks', nargs='+', choices=MAINTENANCE_TASKS, default=list(MAINTENANCE_TASKS))
+    args = parser.parse_args()
+
+    maintenance = DatabaseMaintenance(args.db_path, backup_dir=args.backup_dir)
+    tasks = [t for t in args.tasks if t != 'backup' or args.backup_dir]
+    report = maintenance.run_pass(tasks)
+    for task, result in report['tasks'].items():
+        details = ', '.join(f"{k}={v}" for k, v in result.items() if k not in ('status', 'ms'))
+        print(f"   {task:<11}{result['ms']:>9.1f} ms  {details}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Metrics
+Minimal Prometheus-style registry (counters, gauges, histograms) with
+text exposition for the /metrics endpoint
+
+Metrics are per process; with several gunicorn workers each worker
+reports its own series.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self.metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Render all metrics in the Prometheus text format"""
+        lines = []
+        for metric in list(self.metrics):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def labels(self, **labels):
+        """Get the child series for a label set"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        return self.labels()
+
+    def samples(self):
+        for key, child in sorted(self._children.items()):
+            yield from child.samples(self.name, list(zip(self.labelnames, key)))
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name, pairs):
+        yield f"{name}{_format_labels(pairs)} {_format_value(self.value)}"
+
+
+class _GaugeChild(_CounterChild):
+    def set(self, value):
+        with self._lock:
+            self.value = value
+
+    def set_to_current_time(self):
+        self.set(time.time())
+
+
+class _HistogramChild:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self, name, pairs):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f"{name}_bucket{_format_labels(pairs + [('le', _format_value(bound))])} {cumulative}"
+        yield f"{name}_bucket{_format_labels(pairs + [('le', '+Inf')])} {self.count}"
+        yield f"{name}_sum{_format_labels(pairs)} {_format_value(self.sum)}"
+        yield f"{name}_count{_format_labels(pairs)} {self.count}"
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value):
+        self._default().set(value)
+
+    def set_to_current_time(self):
+        self._default().set_to_current_time()
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=REGISTRY):
+        self.bucket_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramChild(self.bucket_bounds)
+
+    def observe(self, value):
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+
+def instrument_methods(histogram, label='method'):
+    """Class decorator timing every public method into `histogram`
+
+    Generator methods are timed until the caller finishes iterating.
+    """
+    def decorate(cls):
+        for attr, func in list(vars(cls).items()):
+            if attr.startswith('_') or not inspect.isfunction(func):
+                continue
+            setattr(cls, attr, _timed(func, histogram.labels(**{label: attr})))
+        return cls
+    return decorate
+
+
+def _timed(func, child):
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            with child.time():
+                yield from func(*args, **kwargs)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with child.time():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+# Web API
+HTTP_REQUEST_SECONDS = Histogram(
+    'bid_monitor_http_request_duration_seconds',
+    'Time to produce an API response (streams: until headers)',
+    ['endpoint', 'method', 'status']
+)
+
+# Database
+DB_QUERY_SECONDS = Histogram(
+    'bid_monitor_db_query_duration_seconds',
+    'Time spent in each BidDatabase method',
+    ['method']
+)
+
+# Scrapers
+SOURCE_FETCH_SECONDS = Histogram(
+    'bid_monitor_source_fetch_duration_seconds',
+    'HTTP fetch latency per source',
+    ['source']
+)
+SOURCE_RESPONSE_BYTES = Counter(
+    'bid_monitor_source_response_bytes_total',
+    'Response bytes downloaded per source',
+    ['source']
+)
+SOURCE_RESPONSES = Counter(
+    'bid_monitor_source_responses_total',
+    'Fetches per source by HTTP status (or "error")',
+    ['source', 'status']
+)
+SOURCE_PARSE_SECONDS = Histogram(
+    'bid_monitor_source_parse_duration_seconds',
+    'HTML parse and keyword matching time per source',
+    ['source']
+)
+SOURCE_MATCHES = Counter(
+    'bid_monitor_source_matches_total',
+    'Opportunities matched per source',
+    ['source']
+)
+SOURCE_LAST_SUCCESS = Gauge(
+    'bid_monitor_source_last_success_timestamp_seconds',
+    'Unix time of the last successful scrape per source',
+    ['source']
+)
+
+# Refresh jobs
+REFRESH_SECONDS = Histogram(
+    'bid_monitor_refresh_duration_seconds',
+    'Duration of a full monitoring run',
+    ['status'],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600)
+)
+REFRESH_LAST_SUCCESS = Gauge(
+    'bid_monitor_refresh_last_success_timestamp_seconds',
+    'Unix time of the last successful monitoring run'
+)
+
+# Notifications
+NOTIFICATION_DIGESTS = Counter(
+    'bid_monitor_notification_digests_total',
+    'Digest emails by delivery outcome',
+    ['status']
+)
+NOTIFICATION_SEND_SECONDS = Histogram(
+    'bid_monitor_notification_send_duration_seconds',
+    'Time to hand one digest to the SMTP server'
+)
+
+# Database maintenance
+MAINTENANCE_SECONDS = Histogram(
+    'bid_monitor_maintenance_duration_seconds',
+    'Duration of each database maintenance task',
+    ['task', 'status'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+)
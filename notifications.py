@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Notifications
+Delivers saved-search alerts from the database outbox as one digest per
+recipient, over a small pool of reused SMTP connections, from a background
+worker so ingestion and API threads never wait on mail
+
+Run a local debugging SMTP server that prints what it receives:
+    python notifications.py --debug-server --port 1025
+"""
+
+import argparse
+import queue
+import smtplib
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email import message_from_bytes
+from email.message import EmailMessage
+
+from metrics import NOTIFICATION_DIGESTS, NOTIFICATION_SEND_SECONDS
+
+# Bids listed in one digest before it switches to "and N more"
+DIGEST_MAX_ITEMS = 100
+
+
+class SMTPPool:
+    """Up to `size` SMTP connections, kept open and reused between sends
+
+    Connections idle for longer than `max_idle` seconds are checked with
+    NOOP before reuse; dropped connections are replaced transparently.
+    """
+
+    def __init__(self, host, port=25, username=None, password=None, starttls=False,
+                 size=2, timeout=30, max_idle=60):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self.stats = {'connects': 0, 'sent': 0}
+
+    def _connect(self):
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            conn.starttls()
+        if self.username:
+            conn.login(self.username, self.password or '')
+        self.stats['connects'] += 1
+        return conn
+
+    def _checkout(self):
+        while True:
+            try:
+                conn, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if time.monotonic() - last_used < self.max_idle:
+                return conn
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except smtplib.SMTPException:
+                pass
+            _close(conn)
+
+    @contextmanager
+    def connection(self):
+        with self._slots:
+            conn = self._checkout()
+            try:
+                yield conn
+            except smtplib.SMTPResponseException:
+                # The server answered (e.g. refused a recipient); the session is still good
+                self._idle.put((conn, time.monotonic()))
+                raise
+            except OSError:
+                # Includes SMTPServerDisconnected and timeouts
+                _close(conn)
+                raise
+            self._idle.put((conn, time.monotonic()))
+
+    def send(self, message):
+        """Send one message, reconnecting once if a pooled connection went stale"""
+        for attempt in (1, 2):
+            try:
+                with self.connection() as conn:
+                    conn.send_message(message)
+                self.stats['sent'] += 1
+                return
+            except smtplib.SMTPServerDisconnected:
+                if attempt == 2:
+                    raise
+
+    def close(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close(conn)
+
+
+def _close(conn):
+    try:
+        conn.quit()
+    except (smtplib.SMTPException, OSError):
+        conn.close()
+
+
+def build_digest(sender, recipient, alerts, max_items=DIGEST_MAX_ITEMS):
+    """One email summarizing every alert pending for a recipient"""
+    bids = OrderedDict()
+    for alert in alerts:
+        bid = alert['payload']['bid']
+        entry = bids.setdefault(bid.get('id') or bid.get('url'), {'bid': bid, 'searches': []})
+        entry['searches'].append(alert['payload']['search_name'])
+
+    count = len(bids)
+    message = EmailMessage()
+    message['From'] = sender
+    message['To'] = recipient
+    message['Subject'] = f"{count} new bid opportunit{'y' if count == 1 else 'ies'} matching your searches"
+
+    lines = [f"{count} bid opportunit{'y' if count == 1 else 'ies'} matched your saved searches:", '']
+    for entry in list(bids.values())[:max_items]:
+        bid = entry['bid']
+        lines.append(f"• {bid.get('title')}")
+        lines.append(f"  {bid.get('source')} — {bid.get('location')}"
+                     + (f" — due {bid['deadline']}" if bid.get('deadline') else ''))
+        lines.append(f"  Matched: {', '.join(entry['searches'])}")
+        lines.append(f"  {bid.get('url')}")
+        lines.append('')
+    if count > max_items:
+        lines.append(f"…and {count - max_items} more. Open the dashboard to see them all.")
+
+    message.set_content('\n'.join(lines))
+    return message
+
+
+class NotificationWorker:
+    """Background delivery of the notification outbox
+
+    Every `interval` seconds (or sooner after `wake()`) it claims the
+    pending outbox rows of a batch of recipients, builds one digest per
+    recipient and sends the digests concurrently over the pool. Failed digests are retried with
+    exponential backoff up to `max_attempts`.
+    """
+
+    def __init__(self, store, pool, sender, interval=300, recipients_per_batch=200,
+                 max_attempts=5, retry_backoff=60):
+        self.store = store
+        self.pool = pool
+        self.sender = sender
+        self.interval = interval
+        self.recipients_per_batch = recipients_per_batch
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.running = False
+        self.thread = None
+        self._wake = threading.Event()
+
+    def start(self):
+        if not self.running:
+            self.running = True
+            self.thread = threading.Thread(target=self._loop, daemon=True)
+            self.thread.start()
+            print(f"✅ Notification worker started (digests every {self.interval}s via {self.pool.host}:{self.pool.port})")
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+
+    def wake(self):
+        """Deliver now instead of at the next interval"""
+        self._wake.set()
+
+    def _loop(self):
+        while self.running:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.deliver()
+                self.store.prune_notifications()
+            except Exception as e:
+                print(f"❌ Notification delivery error: {e}")
+        self.pool.close()
+
+    def deliver(self):
+        """Send everything currently due; returns counts by outcome"""
+        totals = {'sent': 0, 'failed': 0, 'skipped': 0, 'alerts': 0}
+
+        while True:
+            rows = self.store.claim_notifications(max_recipients=self.recipients_per_batch)
+            if not rows:
+                break
+            totals['alerts'] += len(rows)
+
+            if not self.store.notifications_enabled():
+                self.store.finish_notifications([r['id'] for r in rows], 'skipped')
+                totals['skipped'] += len(rows)
+                continue
+
+            by_recipient = OrderedDict()
+            for row in rows:
+                by_recipient.setdefault(row['recipient'], []).append(row)
+
+            with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+                outcomes = executor.map(self._send_digest, by_recipient.items())
+                for (recipient, alerts), error in zip(by_recipient.items(), outcomes):
+                    ids = [a['id'] for a in alerts]
+                    if error is None:
+                        self.store.finish_notifications(ids, 'sent')
+                        totals['sent'] += 1
+                    else:
+                        attempts = max(a['attempts'] for a in alerts)
+                        self.store.retry_notifications(
+                            ids, error,
+                            give_up=attempts >= self.max_attempts,
+                            delay=self.retry_backoff * 2 ** (attempts - 1)
+                        )
+                        totals['failed'] += 1
+
+        if totals['alerts']:
+            print(f"📧 Notifications: {totals['sent']} digests sent, {totals['failed']} failed, "
+                  f"{totals['skipped']} alerts skipped")
+        return totals
+
+    def _send_digest(self, item):
+        recipient, alerts = item
+        start = time.perf_counter()
+        try:
+            self.pool.send(build_digest(self.sender, recipient, alerts))
+        except (smtplib.SMTPException, OSError) as e:
+            NOTIFICATION_DIGESTS.labels(status='error').inc()
+            print(f"   ⚠ Digest to {recipient} failed: {e}")
+            return str(e)
+        NOTIFICATION_SEND_SECONDS.observe(time.perf_counter() - start)
+        NOTIFICATION_DIGESTS.labels(status='sent').inc()
+        return None
+
+
+class _DebugSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept messages from smtplib"""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        self.reply('220 bid-monitor debug SMTP')
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command[:4].upper()
+
+            if verb == 'EHLO':
+                self.wfile.write(b'250-bid-monitor\r\n250 8BITMIME\r\n')
+            elif verb == 'HELO':
+                self.reply('250 bid-monitor')
+            elif verb == 'MAIL':
+                sender, recipients = command.split(':', 1)[1].strip(), []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command.split(':', 1)[1].strip())
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if not chunk or chunk in (b'.\r\n', b'.\n'):
+                        break
+                    data.append(chunk[1:] if chunk.startswith(b'..') else chunk)
+                self.server.received(sender, recipients, b''.join(data))
+                self.reply('250 OK: queued')
+            elif verb in ('RSET', 'NOOP'):
+                if verb == 'RSET':
+                    sender, recipients = None, []
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+class DebugSMTPServer(socketserver.ThreadingTCPServer):
+    """Local SMTP sink for development: keeps (and optionally prints) messages"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host='127.0.0.1', port=1025, echo=True):
+        super().__init__((host, port), _DebugSMTPHandler)
+        self.echo = echo
+        self.messages = []
+        self._lock = threading.Lock()
+
+    def received(self, sender, recipients, data):
+        message = message_from_bytes(data)
+        with self._lock:
+            self.messages.append({'from': sender, 'to': recipients, 'message': message})
+        if self.echo:
+            print(f"{'-' * 60}\n📨 {sender} → {', '.join(recipients)}\n{data.decode('utf-8', 'replace')}")
+
+    def start(self):
+        """Serve from a daemon thread (handy for tests and benchmarks)"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--debug-server', action='store_true', help='run the local SMTP sink')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=1025)
+    args = parser.parse_args()
+
+    if not args.debug_server:
+        parser.print_help()
+        return
+
+    server = DebugSMTPServer(args.host, args.port)
+    print(f"📬 Debug SMTP server listening on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
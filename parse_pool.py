@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Parse Pool
+Runs page parsing (BeautifulSoup, keyword matching, URL normalization) in
+worker processes so a refresh is not limited to one core by the GIL. The
+parent only fetches; raw bodies go to the workers and compact tuples come
+back, which keeps pickling cheap
+"""
+
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+# Longer link texts are cut to this length (as the scrapers always did)
+TITLE_LENGTH = 200
+
+
+@lru_cache(maxsize=16)
+def _compiled(pattern):
+    # Workers see the same few keyword patterns over and over
+    return re.compile(pattern)
+
+
+def parse_listing(body, keyword_pattern, base_url, match_href=False):
+    """Relevant links of a landing page as ((title, url), ...) plus parse seconds
+
+    A link is relevant if its text (or, with `match_href`, its href) contains
+    a keyword; relative hrefs are resolved against `base_url`.
+    """
+    # Deferred so importing the app does not load the scraper stack
+    from bs4 import BeautifulSoup
+
+    start = time.perf_counter()
+    pattern = _compiled(keyword_pattern)
+    soup = BeautifulSoup(body, 'html.parser')
+
+    links = []
+    for link in soup.find_all('a', href=True):
+        text = link.get_text(strip=True)
+        href = link['href']
+        if pattern.search(text.lower()) or (match_href and pattern.search(href.lower())):
+            links.append((text[:TITLE_LENGTH], href if href.startswith('http') else f"{base_url}{href}"))
+    return tuple(links), time.perf_counter() - start
+
+
+def configured_workers(value):
+    """Pool size from a setting: 0/'' = parse in-process, 'auto' = one per core"""
+    value = str(value or '0').strip().lower()
+    if value == 'auto':
+        return os.cpu_count() or 1
+    return max(0, int(value))
+
+
+def _start_method():
+    """'spawn' under gevent monkey-patching, else the platform default
+
+    A forked child would inherit the gevent hub and patched modules of the
+    web worker (the Procfile runs gunicorn with the gevent worker class);
+    spawned workers start clean and only import this module.
+    """
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_anything_patched():
+        return 'spawn'
+    return None
+
+
+class ParsePool:
+    """Process pool for CPU-bound parsing (workers=0 runs everything inline)
+
+    The executor is created on first use and rebuilt if a worker dies; calls
+    that hit the broken pool (including futures already handed out, via
+    result()) are retried inline. `start_method` picks the multiprocessing
+    context (default: see _start_method).
+    """
+
+    def __init__(self, workers=0, start_method=None):
+        self.workers = workers
+        self.start_method = start_method
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        """Schedule fn(*args); inline mode returns an already-completed Future"""
+        if self.workers:
+            try:
+                return self._get_executor().submit(fn, *args)
+            except (BrokenProcessPool, RuntimeError):
+                self._reset()
+
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def run(self, fn, *args):
+        """fn(*args) in a worker, blocking the calling thread only"""
+        return self.result(self.submit(fn, *args), fn, *args)
+
+    def result(self, future, fn, *args):
+        """Result of a future from submit(fn, *args)
+
+        If the pool broke while it was pending (a worker crashed), the pool
+        is rebuilt for later calls and fn(*args) is run inline instead.
+        """
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            self._reset()
+            return fn(*args)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                method = self.start_method or _start_method()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(method) if method else None
+                )
+            return self._executor
+
+    def _reset(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        self._reset()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Adaptive Polling
+Tracks how often each source's content actually changes and schedules
+the next poll per source from that rate, within min/max bounds and with
+a priority bump while the source has bids close to their deadline
+"""
+
+import hashlib
+import time
+
+HOUR = 3600
+
+
+def results_signature(opportunities, pages=()):
+    """Order-independent fingerprint of what a source currently lists
+
+    `pages` are (url, content_hash) pairs of the source's discovered pages.
+    Discovery only returns matches from pages that changed in this cycle,
+    so its stored page state, not its results, is what gets signed.
+    """
+    lines = sorted(f"{o.get('url', '')}|{o.get('title', '')}" for o in opportunities)
+    lines += sorted(f"page:{url}|{content_hash}" for url, content_hash in pages)
+    return hashlib.sha1('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+class AdaptiveScheduler:
+    """Per-source poll intervals driven by an EWMA of the change rate
+
+    After each poll the observed rate (1 change / hours since the last
+    poll, or 0) is folded into an exponentially weighted estimate. The next
+    interval aims for `polls_per_change` polls per expected change, clamped
+    to [min_interval, max_interval]; sources with a bid due within
+    `deadline_days` are capped at `deadline_interval`.
+    """
+
+    def __init__(self, store, min_interval=1 * HOUR, max_interval=72 * HOUR,
+                 default_interval=6 * HOUR, deadline_interval=2 * HOUR,
+                 deadline_days=3, polls_per_change=2.0, alpha=0.3):
+        self.store = store
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.deadline_interval = deadline_interval
+        self.deadline_days = deadline_days
+        self.polls_per_change = polls_per_change
+        self.alpha = alpha
+
+    def due_sources(self, sources, now=None):
+        """Sources whose next poll time has passed (never-polled ones included)"""
+        now = now or time.time()
+        due = []
+        for source in sources:
+            state = self.store.get_source_schedule(source)
+            if state is None or state['next_poll_at'] <= now:
+                due.append(source)
+        return due
+
+    def seconds_until_next(self, sources, now=None):
+        """Time until the earliest scheduled poll across sources"""
+        now = now or time.time()
+        next_times = []
+        for source in sources:
+            state = self.store.get_source_schedule(source)
+            next_times.append(state['next_poll_at'] if state else now)
+        return max(0.0, min(next_times) - now) if next_times else self.default_interval
+
+    def record_poll(self, source, signature, now=None):
+        """Fold one poll's outcome into the source's rate and reschedule it"""
+        now = now or time.time()
+        state = self.store.get_source_schedule(source)
+
+        if state is None or state['last_polled_at'] is None:
+            # First observation: no history to compare against yet
+            changed = False
+            rate = 1.0 / self.default_interval * HOUR / self.polls_per_change
+            polls, changes = 1, 0
+            last_changed_at = now
+        else:
+            changed = signature != state['signature']
+            elapsed_hours = max((now - state['last_polled_at']) / HOUR, 1 / 60)
+            observed = (1.0 / elapsed_hours) if changed else 0.0
+            rate = self.alpha * observed + (1 - self.alpha) * state['change_rate']
+            polls = state['polls'] + 1
+            changes = state['changes'] + (1 if changed else 0)
+            last_changed_at = now if changed else state['last_changed_at']
+
+        interval = self._interval_for(source, rate)
+        self.store.save_source_schedule(
+            source,
+            signature=signature,
+            change_rate=rate,
+            interval_seconds=interval,
+            last_polled_at=now,
+            last_changed_at=last_changed_at,
+            next_poll_at=now + interval,
+            polls=polls,
+            changes=changes
+        )
+        return changed, interval
+
+    def record_failure(self, source, now=None):
+        """Retry a source whose poll failed after min_interval, leaving its rate alone"""
+        now = now or time.time()
+        self.store.save_source_schedule(source, next_poll_at=now + self.min_interval)
+
+    def _interval_for(self, source, rate):
+        if rate > 0:
+            interval = HOUR / (rate * self.polls_per_change)
+        else:
+            interval = self.max_interval
+        interval = min(self.max_interval, max(self.min_interval, interval))
+
+        if self.store.has_upcoming_deadline(source, self.deadline_days):
+            interval = min(interval, self.deadline_interval)
+        return interval
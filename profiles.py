@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Keyword Profiles
+The keyword list (which links are candidates), the tag map (which tags a
+bid gets) and the relevance weights, editable at runtime and stored in the
+settings table. Compiled matchers are cached per profile version, and a
+background job can re-apply a changed profile to stored bids in batches
+"""
+
+import re
+import threading
+import time
+from datetime import datetime
+
+from relevance import DEFAULT_WEIGHTS, RelevanceModel
+
+DEFAULT_PROFILE = {
+    'keywords': [
+        'stormwater', 'storm water', 'drainage', 'sewer',
+        'vac truck', 'vacuum truck', 'vactor', 'hydro excavation',
+        'cleaning', 'street cleaning', 'catch basin', 'storm drain',
+        'jetting', 'pipe cleaning', 'sanitary sewer'
+    ],
+    'tags': {
+        'stormwater': ['stormwater', 'storm water', 'drainage'],
+        'vac-truck': ['vac truck', 'vacuum truck', 'vactor'],
+        'cleaning': ['cleaning', 'sweeping'],
+        'sewer': ['sewer', 'sanitary'],
+        'maintenance': ['maintenance', 'repair'],
+        'catch-basin': ['catch basin', 'storm drain']
+    },
+    'weights': DEFAULT_WEIGHTS
+}
+
+
+def validate_profile(profile):
+    """Normalized copy of a profile; raises ValueError if malformed"""
+    if not isinstance(profile, dict):
+        raise ValueError('profile must be an object')
+
+    keywords = profile.get('keywords')
+    if not isinstance(keywords, list):
+        raise ValueError('keywords must be a non-empty list')
+    keywords = [str(k).strip().lower() for k in keywords if str(k).strip()]
+    # Checked after stripping: an empty alternation would match every link
+    if not keywords:
+        raise ValueError('keywords must be a non-empty list')
+
+    tags = profile.get('tags', {})
+    if not isinstance(tags, dict) or not all(isinstance(v, list) for v in tags.values()):
+        raise ValueError('tags must map each tag to a list of terms')
+    tags = {
+        str(tag).strip(): [str(t).strip().lower() for t in terms if str(t).strip()]
+        for tag, terms in tags.items() if str(tag).strip()
+    }
+
+    weights = profile.get('weights', DEFAULT_WEIGHTS)
+    if not isinstance(weights, dict):
+        raise ValueError('weights must map terms to numbers')
+    try:
+        weights = {str(term).strip().lower(): float(w) for term, w in weights.items() if str(term).strip()}
+    except (TypeError, ValueError):
+        raise ValueError('weights must map terms to numbers')
+    if not weights:
+        raise ValueError('weights must map terms to numbers')
+
+    return {'keywords': keywords, 'tags': tags, 'weights': weights}
+
+
+def _alternation(terms):
+    # Longest first so "storm drain" wins over "storm"
+    return '|'.join(re.escape(t) for t in sorted(set(terms), key=len, reverse=True))
+
+
+class CompiledProfile:
+    """Regexes and relevance model built once per profile version"""
+
+    def __init__(self, profile, version=0):
+        self.profile = profile
+        self.version = version
+        self.keywords = list(profile['keywords'])
+        self.keyword_pattern = re.compile(_alternation(self.keywords))
+
+        # term -> tag, tried in one pass; tags come out in profile order
+        self.tag_order = {tag: i for i, tag in enumerate(profile['tags'])}
+        self.term_tags = {}
+        for tag, terms in profile['tags'].items():
+            for term in terms:
+                self.term_tags.setdefault(term, []).append(tag)
+        # Lookahead so overlapping terms ("storm drainage": "storm drain", "drainage") all count
+        self.tag_pattern = re.compile(f'(?=({_alternation(self.term_tags)}))') if self.term_tags else None
+
+        self._relevance = None
+        self._statistics = None
+        self._lock = threading.Lock()
+
+    def matches(self, text):
+        """Whether text contains any keyword (substring, like the original check)"""
+        return bool(text) and self.keyword_pattern.search(text.lower()) is not None
+
+    def tag(self, text):
+        """Comma-joined tags whose terms occur in text"""
+        if not self.tag_pattern or not text:
+            return ''
+        tags = {tag for term in self.tag_pattern.findall(text.lower()) for tag in self.term_tags[term]}
+        return ','.join(sorted(tags, key=self.tag_order.get))
+
+    @property
+    def relevance(self):
+        if self._relevance is None:
+            with self._lock:
+                if self._relevance is None:
+                    self._relevance = RelevanceModel(self.profile['weights'])
+        return self._relevance
+
+    def relevance_statistics(self, load_corpus):
+        """(idf, avgdl) for scoring stored bids, computed once per profile version
+
+        Kept here rather than fitted onto the shared model, which threads
+        ranking new batches use at the same time.
+        """
+        if self._statistics is None:
+            statistics = self.relevance.statistics(load_corpus())
+            with self._lock:
+                if self._statistics is None:
+                    self._statistics = statistics
+        return self._statistics
+
+
+class ProfileCache:
+    """Keeps the CompiledProfile for the stored profile version
+
+    `load()` returns (profile, version) and is only called when the version
+    read from the store differs from the cached one.
+    """
+
+    def __init__(self):
+        self.compiled = CompiledProfile(DEFAULT_PROFILE, version=None)
+        self._lock = threading.Lock()
+
+    def current(self, version, load):
+        if self.compiled.version != version:
+            with self._lock:
+                if self.compiled.version != version:
+                    profile, version = load()
+                    self.compiled = CompiledProfile(profile, version)
+        return self.compiled
+
+
+class RetagJob:
+    """Re-applies the current profile (tags and relevance) to stored bids
+
+    Runs on its own thread in short batches (keyset-paginated by id, one
+    small transaction each, with a pause between) so API requests keep
+    being served while it works.
+    """
+
+    def __init__(self, store, batch_size=1000, pause=0.05):
+        self.store = store
+        self.batch_size = batch_size
+        self.pause = pause
+        self.thread = None
+        self.status = {'state': 'idle'}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start a run; returns False if one is already in progress"""
+        with self._lock:
+            if self.thread and self.thread.is_alive():
+                return False
+            self.status = {
+                'state': 'running', 'processed': 0, 'updated': 0,
+                'version': None, 'started_at': datetime.now().isoformat(timespec='seconds')
+            }
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            return True
+
+    def _run(self):
+        last_id = 0
+        try:
+            while True:
+                # Re-read every batch so an edit mid-run is picked up
+                profile = self.store.keyword_profile()
+                last_id, processed, updated = self.store.retag_bids(profile, last_id, self.batch_size)
+                self.status['processed'] += processed
+                self.status['updated'] += updated
+                self.status['version'] = profile.version
+                if processed < self.batch_size:
+                    break
+                time.sleep(self.pause)
+            self.status['state'] = 'finished'
+            print(f"🏷  Re-tagged history: {self.status['updated']} of {self.status['processed']} bids changed")
+        except Exception as e:
+            self.status['state'] = 'failed'
+            self.status['error'] = str(e)
+            print(f"❌ Re-tag failed: {e}")
+        self.status['finished_at'] = datetime.now().isoformat(timespec='seconds')
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Profiling
+Opt-in cProfile capture for API requests and monitor runs; profiles are
+saved as pstats files for offline analysis (snakeviz, flameprof, etc.)
+"""
+
+import cProfile
+import os
+import random
+import re
+import threading
+import time
+import uuid
+
+from flask import g, request
+
+# Header that forces profiling of a single request
+PROFILE_HEADER = 'X-Profile'
+
+
+class Profiler:
+    """Samples requests (or profiles flagged ones) with cProfile
+
+    When the sample rate is 0 and no request is flagged, the only cost is
+    one header lookup per request.
+
+    cProfile hooks the whole OS thread, not a request. Under the gevent
+    worker in the Procfile every greenlet shares that thread, so only one
+    capture runs per process at a time; requests that would overlap it go
+    unprofiled. A capture still includes whatever other greenlets ran while
+    it was active. For clean per-request profiles, run a sync worker
+    (`gunicorn --worker-class sync`).
+    """
+
+    def __init__(self, output_dir, sample_rate=0.0, max_profiles=50):
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.max_profiles = max_profiles
+        self._lock = threading.Lock()
+        self._active = threading.Lock()  # Held while a capture is running
+
+    def init_app(self, app):
+        """Register request hooks on a Flask app"""
+        app.before_request(self._start_request)
+        app.teardown_request(self._finish_request)
+
+    def should_profile(self):
+        if request.headers.get(PROFILE_HEADER) == '1':
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _begin(self):
+        """Start a capture, or return None if one is already running"""
+        if not self._active.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (or debugger) owns the thread's hook
+            self._active.release()
+            return None
+        return profile
+
+    def _end(self, profile):
+        profile.disable()
+        self._active.release()
+
+    def _start_request(self):
+        if self.should_profile():
+            profile = self._begin()
+            if profile is not None:
+                g.profile = profile
+
+    def _finish_request(self, exc=None):
+        profile = g.pop('profile', None)
+        if profile is not None:
+            self._end(profile)
+            self.save(profile, f"{request.method}-{request.endpoint or 'unmatched'}")
+
+    def profile_call(self, label, func, *args, **kwargs):
+        """Run func under cProfile and save the result
+
+        Returns (result, profile filename); the filename is None when
+        another capture was running and func ran unprofiled.
+        """
+        profile = self._begin()
+        if profile is None:
+            return func(*args, **kwargs), None
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            self._end(profile)
+            name = self.save(profile, label)
+        return result, name
+
+    def save(self, profile, label):
+        """Write a profile to disk and return its filename"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        label = re.sub(r'[^A-Za-z0-9_.-]+', '_', label)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{label}-{uuid.uuid4().hex[:6]}.prof"
+        profile.dump_stats(os.path.join(self.output_dir, name))
+        self._prune()
+        return name
+
+    def _prune(self):
+        with self._lock:
+            profiles = self.list_profiles()
+            for stale in profiles[self.max_profiles:]:
+                try:
+                    os.remove(os.path.join(self.output_dir, stale['name']))
+                except OSError:
+                    pass
+
+    def list_profiles(self):
+        """Saved profiles, newest first"""
+        if not os.path.isdir(self.output_dir):
+            return []
+
+        profiles = []
+        for entry in os.scandir(self.output_dir):
+            if entry.name.endswith('.prof'):
+                stat = entry.stat()
+                profiles.append({
+                    'name': entry.name,
+                    'size': stat.st_size,
+                    'created': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(stat.st_mtime))
+                })
+        profiles.sort(key=lambda p: p['name'], reverse=True)
+        return profiles
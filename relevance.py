@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor Relevance Scoring
+BM25-weighted term model over titles and descriptions, scored for a whole
+batch at once with NumPy: positive terms describe the services we bid on,
+negative terms push out look-alikes such as janitorial "cleaning" contracts
+"""
+
+import re
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Term (or phrase) -> weight; negative weights penalize
+DEFAULT_WEIGHTS = {
+    'stormwater': 3.0, 'storm water': 3.0, 'storm sewer': 3.0, 'storm drain': 2.5,
+    'catch basin': 3.0, 'catch basins': 3.0, 'vac truck': 3.0, 'vacuum truck': 3.0,
+    'vactor': 3.0, 'hydro excavation': 3.0, 'hydroexcavation': 3.0, 'jetting': 2.5,
+    'jet cleaning': 2.5, 'sanitary sewer': 2.5, 'sewer': 2.0, 'drainage': 2.0,
+    'culvert': 1.5, 'culverts': 1.5, 'cctv': 1.5, 'televising': 1.5,
+    'street sweeping': 2.0, 'sweeping': 1.0, 'pipe cleaning': 2.0, 'pipe': 0.5,
+    'cleaning': 0.5, 'inspection': 0.3, 'maintenance': 0.3,
+    'janitorial': -4.0, 'custodial': -4.0, 'carpet': -3.0, 'window cleaning': -3.0,
+    'office cleaning': -3.0, 'building cleaning': -3.0, 'laundry': -3.0, 'uniform': -2.0,
+    'uniforms': -2.0, 'dental': -4.0, 'chimney': -3.0, 'duct cleaning': -2.0,
+    'pressure washing': -1.0, 'software': -3.0, 'vehicle wash': -2.0
+}
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall((text or '').lower())
+
+
+class RelevanceModel:
+    """Weighted BM25 over a fixed vocabulary of (multi-word) terms
+
+    `statistics()` estimates IDF and average document length from a
+    reference corpus without touching the model, so callers that share one
+    model keep their own; `fit()` stores them as the model's defaults.
+    `score()` returns one float per document.
+    """
+
+    def __init__(self, weights=None, k1=1.2, b=0.75, threshold=0.0):
+        weights = weights or DEFAULT_WEIGHTS
+        self.terms = [' '.join(tokenize(t)) for t in weights]
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.weights = np.array(list(weights.values()), dtype=np.float64)
+        self.k1 = k1
+        self.b = b
+        self.threshold = threshold  # Scores above this count as on-topic
+
+        # One alternation over the whole vocabulary, longest terms first, so
+        # "sanitary sewer" is counted as the phrase rather than as "sewer"
+        alternation = '|'.join(re.escape(t) for t in sorted(self.term_index, key=len, reverse=True))
+        self.pattern = re.compile(rf'(?<![a-z0-9])(?:{alternation})(?![a-z0-9])')
+
+        self.idf = np.ones(len(self.terms))
+        self.avgdl = None
+
+    def vectorize(self, texts):
+        """Term-count matrix (documents x terms) and document lengths"""
+        term_index = self.term_index
+        vocabulary = len(self.terms)
+        lengths = np.empty(len(texts), dtype=np.float64)
+        cells = []
+
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            lengths[row] = len(tokens)
+            offset = row * vocabulary
+            cells.extend(offset + term_index[term] for term in self.pattern.findall(' '.join(tokens)))
+
+        counts = np.bincount(
+            np.asarray(cells, dtype=np.int64),
+            minlength=len(texts) * vocabulary
+        ).reshape(len(texts), vocabulary).astype(np.float64)
+        return counts, lengths
+
+    def statistics(self, texts):
+        """(idf, avgdl) of a reference corpus, for score()"""
+        if not texts:
+            return np.ones(len(self.terms)), None
+        return self._fit_counts(*self.vectorize(texts))
+
+    def fit(self, texts):
+        """Estimate IDF and average length from a reference corpus"""
+        if texts:
+            self.idf, self.avgdl = self.statistics(texts)
+        return self
+
+    @staticmethod
+    def _fit_counts(counts, lengths):
+        """(idf, avgdl) for a corpus; leaves the model untouched"""
+        documents = len(lengths)
+        df = np.count_nonzero(counts, axis=0)
+        idf = np.log1p((documents - df + 0.5) / (df + 0.5))
+        return idf, max(float(lengths.mean()), 1.0)
+
+    def score(self, texts, statistics=None):
+        """BM25 relevance per document (negative = looks off-topic)
+
+        `statistics` is an (idf, avgdl) pair from statistics(); the model's
+        own fitted values are used when it is omitted.
+        """
+        if not texts:
+            return np.zeros(0)
+        idf, avgdl = statistics or (self.idf, self.avgdl)
+        return self._score_counts(*self.vectorize(texts), idf, avgdl)
+
+    def _score_counts(self, counts, lengths, idf, avgdl):
+        avgdl = avgdl or max(float(lengths.mean()), 1.0)
+        norm = self.k1 * (1 - self.b + self.b * lengths / avgdl)
+        saturated = counts * (self.k1 + 1) / (counts + norm[:, None])
+        return saturated @ (self.weights * idf)
+
+    def rank(self, opportunities, corpus=(), min_relevance=None):
+        """Score opportunities in one batch; returns them best first
+
+        IDF is fit on `corpus` plus the batch itself, for this call only, so
+        one shared model can rank from several threads at once. Each
+        opportunity gets a 'relevance' field. All are kept (keyword matching
+        already chose them) unless `min_relevance` is given, in which case
+        those scoring below it are dropped.
+        """
+        if not opportunities:
+            return []
+        texts = [f"{o.get('title', '')} {o.get('description', '') or ''}" for o in opportunities]
+        counts, lengths = self.vectorize(list(corpus) + texts)
+        idf, avgdl = self._fit_counts(counts, lengths)
+        scores = self._score_counts(counts[-len(texts):], lengths[-len(texts):], idf, avgdl)
+
+        ranked = []
+        for opp, score in zip(opportunities, scores.tolist()):
+            opp['relevance'] = round(score, 4)
+            if min_relevance is None or opp['relevance'] >= min_relevance:
+                ranked.append(opp)
+        ranked.sort(key=lambda o: -o['relevance'])
+        return ranked
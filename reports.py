@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Bid Monitor HTML Reports
+Renders the opportunities report from a template compiled once at import,
+with every field HTML-escaped, as a stream of chunks that can go to a file
+or straight into an HTTP response. Rendered reports are cached on disk per
+data version and filters so unchanged bids are never rendered twice
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import Counter
+from datetime import datetime, timezone
+
+from jinja2 import Environment
+
+from exports import CHUNK_SIZE
+
+# Filters relative to today (the database compares with date('now'), UTC);
+# reports using them are also keyed by date
+RELATIVE_FILTERS = ('deadline_within',)
+
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Bid Monitoring Report - Cleveland, OH</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .header h1 {
+            margin: 0 0 10px 0;
+            font-size: 32px;
+        }
+        .header p {
+            margin: 5px 0;
+            opacity: 0.9;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .stat-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            text-align: center;
+        }
+        .stat-card h3 {
+            margin: 0 0 10px 0;
+            color: #667eea;
+            font-size: 36px;
+        }
+        .stat-card p {
+            margin: 0;
+            color: #666;
+            font-size: 14px;
+        }
+        .opportunity {
+            background: white;
+            padding: 25px;
+            margin-bottom: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            border-left: 4px solid #667eea;
+        }
+        .opportunity h3 {
+            margin: 0 0 15px 0;
+            color: #333;
+            font-size: 20px;
+        }
+        .meta {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 15px;
+            margin-bottom: 15px;
+        }
+        .badge {
+            display: inline-block;
+            padding: 6px 12px;
+            border-radius: 20px;
+            font-size: 12px;
+            font-weight: 600;
+            background-color: #e0e7ff;
+            color: #4338ca;
+        }
+        .badge.municipal {
+            background-color: #dbeafe;
+            color: #1e40af;
+        }
+        .badge.county {
+            background-color: #d1fae5;
+            color: #065f46;
+        }
+        .badge.state {
+            background-color: #fef3c7;
+            color: #92400e;
+        }
+        .description {
+            color: #666;
+            line-height: 1.6;
+            margin-bottom: 15px;
+        }
+        .link {
+            display: inline-block;
+            color: #667eea;
+            text-decoration: none;
+            font-weight: 600;
+            padding: 10px 20px;
+            border: 2px solid #667eea;
+            border-radius: 5px;
+            transition: all 0.3s;
+        }
+        .link:hover {
+            background-color: #667eea;
+            color: white;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 40px;
+            padding: 20px;
+            color: #666;
+            font-size: 14px;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🚛 Public Bidding Opportunities</h1>
+        <p><strong>Location:</strong> Cleveland, Ohio & Northeast Ohio Region</p>
+        <p><strong>Services:</strong> Stormwater Compliance, Vac Truck Services, Cleaning</p>
+        <p><strong>Generated:</strong> {{ generated_at.strftime('%B %d, %Y at %I:%M %p') }}</p>
+    </div>
+
+    <div class="stats">
+        <div class="stat-card">
+            <h3>{{ total }}</h3>
+            <p>Total Opportunities</p>
+        </div>
+        {% for type in ('Municipal', 'County', 'State') %}
+        <div class="stat-card">
+            <h3>{{ counts[type] or 0 }}</h3>
+            <p>{{ type }} Bids</p>
+        </div>
+        {% endfor %}
+    </div>
+
+    <h2 style="color: #333; margin-bottom: 20px;">📋 Active Opportunities</h2>
+{% for opp in opportunities %}
+    <div class="opportunity">
+        <h3>{{ opp.title }}</h3>
+        <div class="meta">
+            <span class="badge {{ (opp.type or '')|lower }}">{{ opp.type }}</span>
+            <span class="badge">📍 {{ opp.location }}</span>
+            <span class="badge">📅 Posted: {{ opp.posted_date }}</span>
+            {% if opp.deadline %}
+            <span class="badge">⏰ Due: {{ opp.deadline }}</span>
+            {% endif %}
+            {% if opp.bid_number %}
+            <span class="badge">🔢 {{ opp.bid_number }}</span>
+            {% endif %}
+        </div>
+        {% if opp.description %}
+        <div class="description">{{ opp.description }}</div>
+        {% endif %}
+        <div>
+            <strong>Source:</strong> {{ opp.source }}
+        </div>
+        <div style="margin-top: 15px;">
+            <a href="{{ opp.url|safe_url }}" class="link" target="_blank" rel="noopener">View Opportunity →</a>
+        </div>
+    </div>
+{% endfor %}
+    <div class="footer">
+        <p>🤖 Automated Bid Monitoring Bot - Cleveland, Ohio Demo</p>
+        <p>This report is automatically generated. Always verify details on official procurement websites.</p>
+    </div>
+</body>
+</html>
+"""
+
+
+def safe_url(url):
+    """Only http(s) links are rendered; anything else (javascript: etc.) becomes '#'"""
+    url = (url or '').strip()
+    return url if url.lower().startswith(('http://', 'https://')) else '#'
+
+
+_environment = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+_environment.filters['safe_url'] = safe_url
+_template = _environment.from_string(REPORT_TEMPLATE)
+
+
+def count_types(opportunities):
+    """Opportunities per type, counted in one pass"""
+    return Counter(opp.get('type') for opp in opportunities)
+
+
+def render_report(opportunities, counts=None, total=None, generated_at=None, chunk_size=CHUNK_SIZE):
+    """Yield the HTML report in chunks of about `chunk_size` characters
+
+    `opportunities` may be any iterable (e.g. a database cursor); pass
+    `counts` (type -> count) when it cannot be iterated twice.
+    """
+    if counts is None:
+        opportunities = list(opportunities)
+        counts = count_types(opportunities)
+    if total is None:
+        total = sum(counts.values())
+
+    parts = []
+    size = 0
+    for part in _template.generate(
+        opportunities=opportunities,
+        counts=counts,
+        total=total,
+        generated_at=generated_at or datetime.now()
+    ):
+        parts.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield ''.join(parts)
+            parts = []
+            size = 0
+
+    if parts:
+        yield ''.join(parts)
+
+
+class ReportCache:
+    """Rendered reports on disk, one file per (data version, filters) key
+
+    Filters relative to today add the date to the key, so "due within 7
+    days" is re-rendered daily even when no bid changed. A report being
+    streamed is written to a temporary file alongside and renamed into
+    place only once complete, so readers never see a partial file. Only
+    the `keep` most recently written reports are kept, whatever their
+    version.
+    """
+
+    def __init__(self, directory, keep=8):
+        self.directory = directory
+        self.keep = keep
+
+    @staticmethod
+    def key(version, filters=None, today=None):
+        filters = filters or {}
+        digest = hashlib.sha1(json.dumps(filters, sort_keys=True).encode()).hexdigest()[:12]
+        key = f"{version}-{digest}"
+        if any(filters.get(name) is not None for name in RELATIVE_FILTERS):
+            key += f"-{(today or datetime.now(timezone.utc).date()).strftime('%Y%m%d')}"
+        return key
+
+    def path(self, key):
+        return os.path.join(self.directory, f"report-{key}.html")
+
+    def get(self, key):
+        """Path of the cached report for `key`, or None"""
+        path = self.path(key)
+        return path if os.path.exists(path) else None
+
+    def stream(self, key, chunks):
+        """Pass chunks through while saving them; cached only if fully consumed"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            os.replace(tmp_path, self.path(key))
+            self._prune()
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _prune(self):
+        reports = [
+            os.path.join(self.directory, name) for name in os.listdir(self.directory)
+            if name.startswith('report-') and name.endswith('.html')
+        ]
+        reports.sort(key=os.path.getmtime, reverse=True)
+        for path in reports[self.keep:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
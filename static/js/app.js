@@ -1,5 +1,6 @@
 // Application State
 let filteredOpportunities = [];
+let opportunityGrid = null;
 let activeFilters = {
     location: ['cleveland', 'cuyahoga', 'ohio'],
     type: ['municipal', 'county', 'state'],
@@ -12,8 +13,12 @@ let activeFilters = {
 document.addEventListener('DOMContentLoaded', function() {
     initializeApp();
     setupEventListeners();
-    renderOpportunities();
-    updateStatistics();
+    startSearchIndex();
+    if (searchWorker) {
+        indexOpportunities();
+        applyFilters();
+    }
+    loadOpportunities();
 });
 
 // Initialize Application
@@ -21,18 +26,146 @@ function initializeApp() {
     filteredOpportunities = window.bidOpportunities;
     updateLastUpdated();
     
-    // Auto-refresh every 5 minutes
-    setInterval(() => {
-        updateLastUpdated();
-        simulateRefresh();
-    }, 300000);
+    // Only cards near the viewport are in the DOM
+    opportunityGrid = new VirtualGrid(document.getElementById('opportunitiesContainer'), {
+        key: opp => opp.id,
+        create: createCard,
+        update: updateCard
+    });
+    
+    // Live updates pushed by the server
+    connectEventStream();
+}
+
+// Load bids from the API (the sample data in data.js stays as a fallback
+// when the dashboard is opened without the backend)
+function loadOpportunities() {
+    fetch('/api/bids')
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) throw new Error(data.error);
+            window.bidOpportunities = data.bids.map(normalizeBid);
+            indexOpportunities();
+            applyFilters();
+            updateLastUpdated();
+        })
+        .catch(() => showToast('Could not reach the server, showing sample data', 'info'));
+}
+
+// Live Updates
+const LIVE_EVENT_TYPES = [
+    'bid.created', 'bid.updated', 'alert.matched',
+    'refresh.started', 'refresh.progress', 'refresh.completed', 'refresh.failed'
+];
+
+function connectEventStream() {
+    if (!window.EventSource) {
+        pollEvents();
+        return;
+    }
+    
+    // EventSource reconnects on its own and resumes via Last-Event-ID
+    const source = new EventSource('/api/events');
+    LIVE_EVENT_TYPES.forEach(type => {
+        source.addEventListener(type, e => handleLiveEvent(type, JSON.parse(e.data)));
+    });
+}
+
+// Long-poll fallback for browsers without EventSource
+function pollEvents(since) {
+    const url = since === undefined ? '/api/events/poll' : `/api/events/poll?since=${since}`;
+    
+    fetch(url)
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) throw new Error(data.error);
+            data.events.forEach(event => handleLiveEvent(event.event_type, event.payload));
+            pollEvents(data.last_event_id);
+        })
+        .catch(() => setTimeout(() => pollEvents(since), 5000));
+}
+
+function handleLiveEvent(type, payload) {
+    const icon = document.querySelector('#refreshBtn i');
+    
+    switch (type) {
+        case 'bid.created':
+        case 'bid.updated': {
+            const bid = normalizeBid(payload);
+            reindexOpportunities([upsertOpportunity(bid)]);
+            scheduleApplyFilters();
+            updateLastUpdated();
+            if (type === 'bid.created') {
+                showToast(`New bid: ${bid.title}`, 'success');
+            }
+            break;
+        }
+        case 'alert.matched':
+            addNotification(
+                `Matches ${payload.searches.map(s => s.name).join(', ')}`,
+                payload.bid.title
+            );
+            break;
+        case 'refresh.started':
+            icon.classList.add('rotating');
+            break;
+        case 'refresh.progress':
+            document.getElementById('refreshBtn').title =
+                `Checked ${payload.source} (${payload.step}/${payload.total_steps})`;
+            break;
+        case 'refresh.completed':
+            icon.classList.remove('rotating');
+            updateLastUpdated();
+            showToast(`Refresh complete: ${payload.new_opportunities} new`, 'success');
+            break;
+        case 'refresh.failed':
+            icon.classList.remove('rotating');
+            showToast('Refresh failed', 'error');
+            break;
+    }
+}
+
+// Convert an API bid row into the dashboard's opportunity shape
+function normalizeBid(row) {
+    const deadline = row.deadline || '';
+    const daysUntilDeadline = deadline
+        ? Math.ceil((new Date(deadline) - new Date()) / 86400000)
+        : Infinity;
+    
+    return {
+        id: row.id,
+        title: row.title,
+        description: row.description || '',
+        location: row.location,
+        type: (row.type || '').toLowerCase(),
+        source: row.source,
+        bidNumber: row.bid_number || '',
+        postedDate: row.posted_date,
+        deadline: deadline,
+        url: row.url,
+        tags: row.keywords ? row.keywords.split(',') : [],
+        favorited: Boolean(row.is_favorited),
+        daysUntilDeadline: daysUntilDeadline
+    };
+}
+
+// Replace (never mutate) opportunity objects so the grid sees the change
+function upsertOpportunity(bid) {
+    const index = window.bidOpportunities.findIndex(opp => opp.id === bid.id);
+    
+    if (index === -1) {
+        window.bidOpportunities.unshift(bid);
+        return bid;
+    }
+    window.bidOpportunities[index] = { ...window.bidOpportunities[index], ...bid };
+    return window.bidOpportunities[index];
 }
 
 // Setup Event Listeners
 function setupEventListeners() {
     // Search input
     const searchInput = document.getElementById('searchInput');
-    searchInput.addEventListener('input', debounce(handleSearch, 300));
+    searchInput.addEventListener('input', debounce(handleSearch, 100));
     
     // Filter checkboxes
     const filterCheckboxes = document.querySelectorAll('.filter-checkbox');
@@ -63,9 +196,25 @@ function setupEventListeners() {
     
     // Close notifications
     document.getElementById('closeNotifications').addEventListener('click', toggleNotificationPanel);
+    
+    // Card buttons (one delegated listener; cards come and go while scrolling)
+    document.getElementById('opportunitiesContainer').addEventListener('click', handleCardClick);
 }
 
-// Handle Search
+function handleCardClick(e) {
+    const card = e.target.closest('.opportunity-card');
+    if (!card) return;
+    const opp = window.bidOpportunities.find(o => String(o.id) === card.dataset.id);
+    if (!opp) return;
+    
+    if (e.target.closest('.favorite-btn')) {
+        toggleFavorite(opp);
+    } else if (e.target.closest('.btn-view')) {
+        viewOpportunity(opp.url);
+    }
+}
+
+// Handle Search (the index answers off the main thread, so a short debounce is enough)
 function handleSearch(e) {
     activeFilters.search = e.target.value.toLowerCase();
     applyFilters();
@@ -129,59 +278,82 @@ function clearAllFilters() {
     applyFilters();
 }
 
+// Coalesce bursts of live updates into one filter pass per frame
+let filterFrame = null;
+function scheduleApplyFilters() {
+    if (filterFrame === null) {
+        filterFrame = requestAnimationFrame(() => {
+            filterFrame = null;
+            applyFilters();
+        });
+    }
+}
+
+// Search Index
+// Token/facet index built once per data load, queried off the main thread
+let searchWorker = null;
+let localIndex = null;
+let queryId = 0;
+
+function startSearchIndex() {
+    try {
+        searchWorker = new Worker(document.querySelector('script[src*="search-index"]').src);
+        searchWorker.onmessage = e => showResults(e.data);
+        searchWorker.onerror = () => {
+            searchWorker.terminate();
+            useLocalIndex();
+        };
+    } catch (e) {
+        useLocalIndex();
+    }
+}
+
+// Same index on the main thread (e.g. dashboard opened from disk)
+function useLocalIndex() {
+    searchWorker = null;
+    localIndex = new SearchIndex();
+    indexOpportunities();
+    applyFilters();
+}
+
+function indexOpportunities() {
+    if (searchWorker) {
+        searchWorker.postMessage({ type: 'load', opportunities: window.bidOpportunities });
+    } else {
+        localIndex.load(window.bidOpportunities);
+    }
+}
+
+function reindexOpportunities(opportunities) {
+    if (searchWorker) {
+        searchWorker.postMessage({ type: 'upsert', opportunities: opportunities });
+    } else {
+        localIndex.upsert(opportunities);
+    }
+}
+
 // Apply Filters
 function applyFilters() {
-    filteredOpportunities = window.bidOpportunities.filter(opp => {
-        // Search filter
-        if (activeFilters.search) {
-            const searchText = `${opp.title} ${opp.description} ${opp.location}`.toLowerCase();
-            if (!searchText.includes(activeFilters.search)) {
-                return false;
-            }
-        }
-        
-        // Location filter
-        if (activeFilters.location.length > 0) {
-            const locationMatch = activeFilters.location.some(loc => {
-                if (loc === 'cleveland') return opp.location.toLowerCase().includes('cleveland');
-                if (loc === 'cuyahoga') return opp.location.toLowerCase().includes('cuyahoga');
-                if (loc === 'ohio') return opp.type === 'state' || opp.location.toLowerCase().includes('ohio');
-                return false;
-            });
-            if (!locationMatch) return false;
-        }
-        
-        // Type filter
-        if (activeFilters.type.length > 0) {
-            if (!activeFilters.type.includes(opp.type)) {
-                return false;
-            }
-        }
-        
-        // Deadline filter
-        if (activeFilters.deadline.length > 0) {
-            const deadlineMatch = activeFilters.deadline.some(dl => {
-                if (dl === 'urgent') return opp.daysUntilDeadline <= 7;
-                if (dl === 'soon') return opp.daysUntilDeadline <= 14;
-                if (dl === 'later') return opp.daysUntilDeadline > 14;
-                return false;
-            });
-            if (!deadlineMatch) return false;
-        }
-        
-        // Keywords filter
-        if (activeFilters.keywords.length > 0) {
-            const keywordMatch = activeFilters.keywords.some(keyword => 
-                opp.tags.includes(keyword)
-            );
-            if (!keywordMatch) return false;
-        }
-        
-        return true;
-    });
+    const requestId = ++queryId;
+    const filters = { ...activeFilters };
+    
+    if (searchWorker) {
+        searchWorker.postMessage({ type: 'query', requestId: requestId, filters: filters });
+    } else {
+        showResults({ requestId: requestId, ...localIndex.query(filters) });
+    }
+}
+
+function showResults(results) {
+    // Drop answers to queries that have since been superseded
+    if (results.requestId !== queryId) return;
+    
+    const matched = new Set(results.ids);
+    filteredOpportunities = window.bidOpportunities.filter(opp => matched.has(opp.id));
     
     renderOpportunities();
-    updateStatistics();
+    updateStatistics(results.counts);
+    updateFacetCounts(results.facets);
 }
 
 // Render Opportunities
@@ -192,95 +364,129 @@ function renderOpportunities() {
     if (filteredOpportunities.length === 0) {
         container.style.display = 'none';
         emptyState.style.display = 'block';
-        return;
+    } else {
+        container.style.display = 'grid';
+        emptyState.style.display = 'none';
     }
     
-    container.style.display = 'grid';
-    emptyState.style.display = 'none';
-    
-    container.innerHTML = filteredOpportunities.map(opp => {
-        const isUrgent = opp.daysUntilDeadline <= 7;
-        const deadlineClass = isUrgent ? 'deadline-meta' : 'deadline-meta normal';
+    // Keyed, incremental: only visible cards are created or patched
+    opportunityGrid.setItems(filteredOpportunities);
+}
+
+const cardTemplate = document.createElement('template');
+cardTemplate.innerHTML = `
+    <div class="opportunity-card">
+        <div class="opportunity-header">
+            <h3 class="opportunity-title"></h3>
+            <button class="favorite-btn">
+                <i class="far fa-heart"></i>
+            </button>
+        </div>
         
-        return `
-            <div class="opportunity-card" data-id="${opp.id}">
-                <div class="opportunity-header">
-                    <h3 class="opportunity-title">${opp.title}</h3>
-                    <button class="favorite-btn" onclick="toggleFavorite(${opp.id})">
-                        <i class="far fa-heart"></i>
-                    </button>
-                </div>
-                
-                <div class="opportunity-meta">
-                    <span class="meta-badge type-badge ${opp.type}">
-                        ${getTypeIcon(opp.type)} ${capitalize(opp.type)}
-                    </span>
-                    <span class="meta-badge location-meta">
-                        <i class="fas fa-map-marker-alt"></i> ${opp.location}
-                    </span>
-                    <span class="meta-badge ${deadlineClass}">
-                        <i class="fas fa-calendar-alt"></i> Due: ${formatDate(opp.deadline)}
-                    </span>
-                </div>
-                
-                <p class="opportunity-description">${opp.description}</p>
-                
-                <div class="opportunity-tags">
-                    ${opp.tags.map(tag => `
-                        <span class="tag">
-                            <i class="${getTagIcon(tag)}"></i> ${capitalize(tag)}
-                        </span>
-                    `).join('')}
-                </div>
-                
-                <div class="opportunity-footer">
-                    <div>
-                        <div class="source-info">
-                            <strong>Source:</strong> ${opp.source}
-                        </div>
-                        <div class="bid-number">${opp.bidNumber}</div>
-                    </div>
-                </div>
-                
-                <div class="opportunity-actions">
-                    <button class="btn-view" onclick="viewOpportunity('${opp.url}')">
-                        View Opportunity <i class="fas fa-arrow-right"></i>
-                    </button>
+        <div class="opportunity-meta">
+            <span class="meta-badge type-badge"></span>
+            <span class="meta-badge location-meta">
+                <i class="fas fa-map-marker-alt"></i> <span class="location"></span>
+            </span>
+            <span class="meta-badge deadline-meta">
+                <i class="fas fa-calendar-alt"></i> Due: <span class="deadline"></span>
+            </span>
+        </div>
+        
+        <p class="opportunity-description"></p>
+        
+        <div class="opportunity-tags"></div>
+        
+        <div class="opportunity-footer">
+            <div>
+                <div class="source-info">
+                    <strong>Source:</strong> <span class="source"></span>
                 </div>
+                <div class="bid-number"></div>
             </div>
-        `;
-    }).join('');
+        </div>
+        
+        <div class="opportunity-actions">
+            <button class="btn-view">
+                View Opportunity <i class="fas fa-arrow-right"></i>
+            </button>
+        </div>
+    </div>
+`;
+
+function createCard(opp) {
+    const card = cardTemplate.content.firstElementChild.cloneNode(true);
+    updateCard(card, opp);
+    return card;
 }
 
-// Update Statistics
-function updateStatistics() {
-    const total = filteredOpportunities.length;
-    const municipal = filteredOpportunities.filter(o => o.type === 'municipal').length;
-    const county = filteredOpportunities.filter(o => o.type === 'county').length;
-    const state = filteredOpportunities.filter(o => o.type === 'state').length;
-    
-    document.getElementById('totalCount').textContent = total;
-    document.getElementById('municipalCount').textContent = municipal;
-    document.getElementById('countyCount').textContent = county;
-    document.getElementById('stateCount').textContent = state;
+// Fill a card from an opportunity; scraped text only goes in via textContent
+function updateCard(card, opp) {
+    card.dataset.id = opp.id;
+    card.querySelector('.opportunity-title').textContent = opp.title;
+    
+    const favorite = card.querySelector('.favorite-btn');
+    favorite.classList.toggle('active', Boolean(opp.favorited));
+    favorite.querySelector('i').className = `${opp.favorited ? 'fas' : 'far'} fa-heart`;
+    
+    const typeBadge = card.querySelector('.type-badge');
+    typeBadge.className = `meta-badge type-badge ${opp.type}`;
+    typeBadge.innerHTML = getTypeIcon(opp.type);
+    typeBadge.append(` ${capitalize(opp.type)}`);
+    
+    card.querySelector('.location').textContent = opp.location;
+    card.querySelector('.deadline-meta').classList.toggle('normal', !(opp.daysUntilDeadline <= 7));
+    card.querySelector('.deadline').textContent = formatDate(opp.deadline);
+    card.querySelector('.opportunity-description').textContent = opp.description;
+    
+    const tags = card.querySelector('.opportunity-tags');
+    tags.replaceChildren(...opp.tags.map(tag => {
+        const span = document.createElement('span');
+        span.className = 'tag';
+        const icon = document.createElement('i');
+        icon.className = getTagIcon(tag);
+        span.append(icon, ` ${capitalize(tag)}`);
+        return span;
+    }));
+    
+    card.querySelector('.source').textContent = opp.source;
+    card.querySelector('.bid-number').textContent = opp.bidNumber;
+}
+
+// Update Statistics (counts precomputed by the search index)
+function updateStatistics(counts) {
+    document.getElementById('totalCount').textContent = counts.total;
+    document.getElementById('municipalCount').textContent = counts.municipal;
+    document.getElementById('countyCount').textContent = counts.county;
+    document.getElementById('stateCount').textContent = counts.state;
+}
+
+// Sidebar counts: matches per option given the other filters
+function updateFacetCounts(facets) {
+    document.querySelectorAll('.filter-checkbox').forEach(checkbox => {
+        const count = checkbox.parentElement.querySelector('.count');
+        const group = facets[checkbox.dataset.filter] || {};
+        if (count) count.textContent = group[checkbox.value] || 0;
+    });
 }
 
 // Toggle Favorite
-function toggleFavorite(id) {
-    const btn = event.currentTarget;
-    const icon = btn.querySelector('i');
-    
-    if (btn.classList.contains('active')) {
-        btn.classList.remove('active');
-        icon.classList.remove('fas');
-        icon.classList.add('far');
-        showToast('Removed from favorites', 'info');
-    } else {
-        btn.classList.add('active');
-        icon.classList.remove('far');
-        icon.classList.add('fas');
-        showToast('Added to favorites', 'success');
-    }
+function toggleFavorite(opp) {
+    const favorited = !opp.favorited;
+    upsertOpportunity({ ...opp, favorited });
+    applyFilters();
+    showToast(favorited ? 'Added to favorites' : 'Removed from favorites', favorited ? 'success' : 'info');
+    
+    fetch(`/api/bids/${opp.id}/favorite`, { method: 'POST' })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) throw new Error(data.error);
+        })
+        .catch(() => {
+            upsertOpportunity({ ...opp, favorited: !favorited });
+            applyFilters();
+            showToast('Could not update favorite', 'error');
+        });
 }
 
 // View Opportunity
@@ -294,19 +500,20 @@ function handleRefresh() {
     const icon = btn.querySelector('i');
     
     icon.classList.add('rotating');
-    
-    // Simulate refresh
-    setTimeout(() => {
-        icon.classList.remove('rotating');
-        updateLastUpdated();
-        showToast('Data refreshed successfully', 'success');
-    }, 1500);
-}
-
-// Simulate Refresh (for auto-refresh)
-function simulateRefresh() {
-    console.log('Auto-refreshing data...');
-    // In a real application, this would fetch new data from an API
+    btn.disabled = true;
+    
+    // New and changed bids arrive through the live event stream
+    fetch('/api/refresh', { method: 'POST' })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) throw new Error(data.message || data.error);
+            updateLastUpdated();
+        })
+        .catch(() => showToast('Refresh failed', 'error'))
+        .finally(() => {
+            icon.classList.remove('rotating');
+            btn.disabled = false;
+        });
 }
 
 // Export to CSV
@@ -342,9 +549,22 @@ function exportToCSV() {
 // Handle Email Toggle
 function handleEmailToggle(e) {
     const isEnabled = e.target.checked;
-    const message = isEnabled ? 'Email notifications enabled' : 'Email notifications disabled';
-    const type = isEnabled ? 'success' : 'info';
-    showToast(message, type);
+    
+    fetch('/api/notifications', {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ enabled: isEnabled })
+    })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) throw new Error(data.error);
+            const message = isEnabled ? 'Email notifications enabled' : 'Email notifications disabled';
+            showToast(data.configured ? message : `${message} (no mail server configured)`, isEnabled ? 'success' : 'info');
+        })
+        .catch(() => {
+            e.target.checked = !isEnabled;
+            showToast('Could not update email notifications', 'error');
+        });
 }
 
 // Toggle Notification Panel
@@ -353,6 +573,28 @@ function toggleNotificationPanel() {
     panel.classList.toggle('active');
 }
 
+// Prepend a saved-search alert to the notification panel
+function addNotification(heading, text) {
+    const item = document.createElement('div');
+    item.className = 'notification-item unread';
+    item.innerHTML = `
+        <div class="notification-icon new">
+            <i class="fas fa-bell"></i>
+        </div>
+        <div class="notification-content">
+            <h4></h4>
+            <p></p>
+            <span class="notification-time">Just now</span>
+        </div>
+    `;
+    // Text from the server goes in via textContent, never as markup
+    item.querySelector('h4').textContent = heading;
+    item.querySelector('p').textContent = text;
+    
+    const list = document.querySelector('#notificationPanel .notification-list');
+    list.insertBefore(item, list.firstChild);
+}
+
 // Update Last Updated Timestamp
 function updateLastUpdated() {
     const now = new Date();
@@ -392,8 +634,10 @@ function showToast(message, type = 'info') {
     
     toast.innerHTML = `
         <i class="fas ${icon}" style="color: ${color}; font-size: 1.25rem;"></i>
-        <span style="color: #1e293b; font-weight: 500;">${message}</span>
+        <span style="color: #1e293b; font-weight: 500;"></span>
     `;
+    // Messages can carry scraped text (bid titles), so never as markup
+    toast.querySelector('span').textContent = message;
     
     document.body.appendChild(toast);
     
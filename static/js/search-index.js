@@ -0,0 +1,302 @@
+// Client-side search and facet index
+//
+// Built once per data load: every opportunity gets a slot, each facet value
+// (location, type, deadline window, keyword tag) is a bitset over slots, and
+// the search text is indexed by trigrams so a query only verifies the
+// opportunities that contain its rarest trigram. Loaded as a Web Worker by
+// app.js; the same file also runs on the main thread when workers are
+// unavailable (e.g. the dashboard opened from disk).
+
+const FACETS = {
+    location: {
+        cleveland: opp => (opp.location || '').toLowerCase().includes('cleveland'),
+        cuyahoga: opp => (opp.location || '').toLowerCase().includes('cuyahoga'),
+        ohio: opp => opp.type === 'state' || (opp.location || '').toLowerCase().includes('ohio')
+    },
+    type: {
+        municipal: opp => opp.type === 'municipal',
+        county: opp => opp.type === 'county',
+        state: opp => opp.type === 'state'
+    },
+    deadline: {
+        urgent: opp => opp.daysUntilDeadline <= 7,
+        soon: opp => opp.daysUntilDeadline <= 14,
+        later: opp => opp.daysUntilDeadline > 14
+    }
+};
+
+class BitSet {
+    constructor(size = 0) {
+        this.words = new Uint32Array(Math.max(1, Math.ceil(size / 32)));
+    }
+
+    static full(size) {
+        const bits = new BitSet(size);
+        if (!size) return bits;
+        bits.words.fill(0xffffffff);
+        const extra = bits.words.length * 32 - size;
+        if (extra) bits.words[bits.words.length - 1] >>>= extra;
+        return bits;
+    }
+
+    grow(size) {
+        const length = Math.ceil(size / 32);
+        if (length > this.words.length) {
+            const words = new Uint32Array(Math.max(length, this.words.length * 2));
+            words.set(this.words);
+            this.words = words;
+        }
+    }
+
+    set(i) {
+        this.grow(i + 1);
+        this.words[i >>> 5] |= 1 << (i & 31);
+    }
+
+    clear(i) {
+        if ((i >>> 5) < this.words.length) this.words[i >>> 5] &= ~(1 << (i & 31));
+    }
+
+    has(i) {
+        return (i >>> 5) < this.words.length && (this.words[i >>> 5] & (1 << (i & 31))) !== 0;
+    }
+
+    copy() {
+        const bits = new BitSet();
+        bits.words = this.words.slice();
+        return bits;
+    }
+
+    and(other) {
+        const words = this.words;
+        for (let w = 0; w < words.length; w++) {
+            words[w] &= w < other.words.length ? other.words[w] : 0;
+        }
+        return this;
+    }
+
+    or(other) {
+        this.grow(other.words.length * 32);
+        for (let w = 0; w < other.words.length; w++) {
+            this.words[w] |= other.words[w];
+        }
+        return this;
+    }
+
+    count() {
+        let total = 0;
+        for (let w = 0; w < this.words.length; w++) {
+            let v = this.words[w];
+            v -= (v >>> 1) & 0x55555555;
+            v = (v & 0x33333333) + ((v >>> 2) & 0x33333333);
+            total += (((v + (v >>> 4)) & 0x0f0f0f0f) * 0x01010101) >>> 24;
+        }
+        return total;
+    }
+
+    andCount(other) {
+        return this.copy().and(other).count();
+    }
+
+    *indices() {
+        for (let w = 0; w < this.words.length; w++) {
+            let v = this.words[w];
+            while (v) {
+                const low = v & -v;
+                yield (w << 5) + (31 - Math.clz32(low));
+                v ^= low;
+            }
+        }
+    }
+}
+
+function trigrams(text) {
+    const grams = new Set();
+    for (let i = 0; i + 3 <= text.length; i++) {
+        grams.add(text.slice(i, i + 3));
+    }
+    return grams;
+}
+
+class SearchIndex {
+    constructor() {
+        this.load([]);
+    }
+
+    load(opportunities) {
+        this.ids = [];               // slot -> opportunity id
+        this.texts = [];             // slot -> lowercase search text
+        this.slots = new Map();      // opportunity id -> slot
+        this.live = new BitSet();
+        this.facets = { location: {}, type: {}, deadline: {}, keywords: {} };
+        for (const group of Object.keys(FACETS)) {
+            for (const value of Object.keys(FACETS[group])) {
+                this.facets[group][value] = new BitSet();
+            }
+        }
+        this.postings = new Map();   // trigram -> ascending slots
+        opportunities.forEach(opp => this.add(opp));
+    }
+
+    add(opp) {
+        const slot = this.ids.length;
+        // Same text the dashboard always searched
+        const text = `${opp.title} ${opp.description} ${opp.location}`.toLowerCase();
+        this.ids.push(opp.id);
+        this.texts.push(text);
+        this.slots.set(opp.id, slot);
+        this.live.set(slot);
+
+        for (const group of Object.keys(FACETS)) {
+            for (const [value, test] of Object.entries(FACETS[group])) {
+                if (test(opp)) this.facets[group][value].set(slot);
+            }
+        }
+        for (const tag of opp.tags) {
+            (this.facets.keywords[tag] = this.facets.keywords[tag] || new BitSet()).set(slot);
+        }
+        for (const gram of trigrams(text)) {
+            const list = this.postings.get(gram);
+            if (list) list.push(slot);
+            else this.postings.set(gram, [slot]);
+        }
+    }
+
+    // Changed opportunities get a new slot; the old one is tombstoned
+    upsert(opportunities) {
+        for (const opp of opportunities) {
+            const slot = this.slots.get(opp.id);
+            if (slot !== undefined) {
+                this.live.clear(slot);
+                this.texts[slot] = null;
+            }
+            this.add(opp);
+        }
+        if (this.ids.length > 2 * this.slots.size + 1024) {
+            this.compact();
+        }
+    }
+
+    compact() {
+        const kept = [];
+        for (const slot of this.live.indices()) kept.push(slot);
+        const remap = new Map(kept.map((slot, i) => [slot, i]));
+        const rebuild = bits => {
+            const next = new BitSet(kept.length);
+            for (const slot of bits.indices()) {
+                if (remap.has(slot)) next.set(remap.get(slot));
+            }
+            return next;
+        };
+
+        this.ids = kept.map(slot => this.ids[slot]);
+        this.texts = kept.map(slot => this.texts[slot]);
+        this.slots = new Map(this.ids.map((id, slot) => [id, slot]));
+        this.live = BitSet.full(kept.length);
+        for (const group of Object.values(this.facets)) {
+            for (const value of Object.keys(group)) group[value] = rebuild(group[value]);
+        }
+        for (const [gram, list] of this.postings) {
+            const next = list.filter(slot => remap.has(slot)).map(slot => remap.get(slot));
+            if (next.length) this.postings.set(gram, next);
+            else this.postings.delete(gram);
+        }
+    }
+
+    // Slots whose text contains the query (substring match, as before)
+    searchBits(query) {
+        if (!query) return this.live.copy();
+
+        const bits = new BitSet(this.ids.length);
+        let candidates;
+        if (query.length < 3) {
+            candidates = this.live.indices();
+        } else {
+            const lists = [];
+            for (const gram of trigrams(query)) {
+                const list = this.postings.get(gram);
+                if (!list) return bits;
+                lists.push(list);
+            }
+            lists.sort((a, b) => a.length - b.length);
+            candidates = lists[0];
+        }
+
+        for (const slot of candidates) {
+            const text = this.texts[slot];
+            if (text !== null && text.includes(query)) bits.set(slot);
+        }
+        return bits;
+    }
+
+    groupBits(group, values) {
+        const bits = new BitSet(this.ids.length);
+        for (const value of values) {
+            const facet = this.facets[group][value];
+            if (facet) bits.or(facet);
+        }
+        return bits;
+    }
+
+    // filters: { search, location: [], type: [], deadline: [], keywords: [] }
+    // (an empty list means the group does not filter)
+    query(filters) {
+        const base = this.searchBits(filters.search || '');
+        const groups = {};
+        for (const group of Object.keys(this.facets)) {
+            if (filters[group] && filters[group].length) {
+                groups[group] = this.groupBits(group, filters[group]);
+            }
+        }
+
+        const result = base.copy();
+        Object.values(groups).forEach(bits => result.and(bits));
+
+        // Facet counts: each group's values counted with every other group applied
+        const facetCounts = {};
+        for (const group of Object.keys(this.facets)) {
+            const others = base.copy();
+            for (const [name, bits] of Object.entries(groups)) {
+                if (name !== group) others.and(bits);
+            }
+            facetCounts[group] = {};
+            for (const [value, bits] of Object.entries(this.facets[group])) {
+                facetCounts[group][value] = others.andCount(bits);
+            }
+        }
+
+        const ids = [];
+        for (const slot of result.indices()) ids.push(this.ids[slot]);
+        return {
+            ids: ids,
+            counts: {
+                total: ids.length,
+                municipal: result.andCount(this.facets.type.municipal),
+                county: result.andCount(this.facets.type.county),
+                state: result.andCount(this.facets.type.state)
+            },
+            facets: facetCounts
+        };
+    }
+}
+
+// Worker protocol: {type: 'load' | 'upsert', opportunities} and
+// {type: 'query', requestId, filters} -> {requestId, ids, counts, facets}
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+    const index = new SearchIndex();
+
+    self.onmessage = function(e) {
+        const message = e.data;
+        switch (message.type) {
+            case 'load':
+                index.load(message.opportunities);
+                break;
+            case 'upsert':
+                index.upsert(message.opportunities);
+                break;
+            case 'query':
+                self.postMessage({ requestId: message.requestId, ...index.query(message.filters) });
+                break;
+        }
+    };
+}
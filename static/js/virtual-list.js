@@ -0,0 +1,115 @@
+// Virtualized, keyed card grid
+//
+// Only the rows in (or near) the viewport exist in the DOM; the rest of the
+// list is represented by padding on the grid container. Cards are keyed, so
+// when the item list changes, cards that are still visible are kept (and
+// patched only if their item object changed) instead of rebuilding the grid.
+class VirtualGrid {
+    constructor(container, { key, create, update, overscan = 3 }) {
+        this.container = container;
+        this.key = key;
+        this.create = create;
+        this.update = update;
+        this.overscan = overscan;
+
+        this.items = [];
+        this.cards = new Map();      // key -> { el, item }
+        this.rowHeight = 0;          // card height + row gap, measured
+        this.columns = 1;
+        this.frame = null;
+
+        // Capture phase also sees scrolls of inner containers (e.g. .content)
+        document.addEventListener('scroll', () => this.scheduleRender(), { passive: true, capture: true });
+        window.addEventListener('resize', () => {
+            this.rowHeight = 0;
+            this.scheduleRender();
+        });
+    }
+
+    setItems(items) {
+        this.items = items;
+        this.scheduleRender();
+    }
+
+    // Coalesce scroll/resize/data changes into one render per frame
+    scheduleRender() {
+        if (this.frame === null) {
+            this.frame = requestAnimationFrame(() => {
+                this.frame = null;
+                this.render();
+            });
+        }
+    }
+
+    measure() {
+        const style = getComputedStyle(this.container);
+        this.columns = Math.max(1, style.gridTemplateColumns.split(' ').filter(Boolean).length);
+
+        const sample = this.container.firstElementChild;
+        if (sample) {
+            this.rowHeight = sample.offsetHeight + (parseFloat(style.rowGap) || 0);
+        }
+    }
+
+    render() {
+        if (!this.rowHeight) {
+            // Render one card to learn the grid's geometry
+            this.patch(0, Math.min(this.items.length, 1));
+            this.measure();
+            if (!this.rowHeight) {
+                this.container.style.paddingTop = this.container.style.paddingBottom = '0px';
+                return;
+            }
+        }
+
+        const rows = Math.ceil(this.items.length / this.columns);
+        const top = this.container.getBoundingClientRect().top;
+        const firstRow = Math.min(rows, Math.max(0, Math.floor(-top / this.rowHeight) - this.overscan));
+        const lastRow = Math.min(rows, Math.ceil((window.innerHeight - top) / this.rowHeight) + this.overscan);
+
+        const start = Math.min(firstRow * this.columns, this.items.length);
+        const end = Math.max(start, Math.min(lastRow * this.columns, this.items.length));
+        this.patch(start, end);
+
+        this.container.style.paddingTop = `${firstRow * this.rowHeight}px`;
+        this.container.style.paddingBottom = `${Math.max(0, rows - Math.max(lastRow, firstRow)) * this.rowHeight}px`;
+    }
+
+    // Make the container hold exactly items[start:end], in order
+    patch(start, end) {
+        const wanted = new Set();
+        for (let i = start; i < end; i++) {
+            wanted.add(this.key(this.items[i]));
+        }
+
+        for (const [key, card] of this.cards) {
+            if (!wanted.has(key)) {
+                card.el.remove();
+                this.cards.delete(key);
+            }
+        }
+
+        let cursor = this.container.firstElementChild;
+        for (let i = start; i < end; i++) {
+            const item = this.items[i];
+            const key = this.key(item);
+            let card = this.cards.get(key);
+
+            if (!card) {
+                card = { el: this.create(item), item };
+                this.cards.set(key, card);
+            } else if (card.item !== item) {
+                this.update(card.el, item);
+                card.item = item;
+            }
+
+            if (card.el === cursor) {
+                cursor = cursor.nextElementSibling;
+            } else {
+                this.container.insertBefore(card.el, cursor);
+            }
+        }
+    }
+}
+
+window.VirtualGrid = VirtualGrid;
@@ -0,0 +1,21 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    """The web app (`app .py`) loaded against a fresh database, offline"""
+    monkeypatch.setenv('BID_MONITOR_DB', str(tmp_path / 'bids.db'))
+    monkeypatch.setenv('BID_MONITOR_HTTP_MODE', 'replay')
+    monkeypatch.setenv('BID_MONITOR_FIXTURES', str(tmp_path / 'fixtures'))
+    monkeypatch.setenv('BID_MONITOR_ENRICH', '0')
+    spec = importlib.util.spec_from_file_location('bid_monitor_app', os.path.join(ROOT, 'app .py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,70 @@
+import json
+import os
+
+from artifacts import CSV_FILE, JOURNAL_FILE, STATE_FILE, ExportStage
+
+BIDS = [
+    {'id': 1, 'bid_number': 'P-1', 'title': 'Road paving', 'type': 'Municipal', 'url': 'https://city.example/1'},
+    {'id': 2, 'bid_number': 'S-1', 'title': 'Sewer lining', 'type': 'County', 'url': 'https://county.example/1'},
+    {'id': 3, 'bid_number': 'B-1', 'title': 'Bridge deck', 'type': 'State', 'url': 'https://state.example/1'},
+]
+
+
+class Rows:
+    """Row source that counts how often it is read"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return iter(self.rows)
+
+    def since(self, last_id):
+        return iter([row for row in self.rows if row['id'] > last_id])
+
+
+def journal_ids(stage):
+    with open(stage.path(JOURNAL_FILE), encoding='utf-8') as f:
+        return [json.loads(line)['id'] for line in f]
+
+
+def test_unchanged_version_is_not_republished(tmp_path):
+    stage = ExportStage(str(tmp_path))
+    rows = Rows(BIDS)
+
+    assert stage.export(4, rows)['skipped'] is False
+    published = os.stat(stage.path(CSV_FILE)).st_mtime_ns
+    calls = rows.calls
+
+    assert stage.export(4, rows) == {'skipped': True, 'version': 4}
+    assert rows.calls == calls and os.stat(stage.path(CSV_FILE)).st_mtime_ns == published
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+    # A new version, or a deleted artifact, publishes again
+    assert stage.export(5, rows)['skipped'] is False
+    os.remove(stage.path(CSV_FILE))
+    assert stage.export(5, rows)['skipped'] is False and os.path.exists(stage.path(CSV_FILE))
+
+
+def test_journal_drops_interrupted_appends(tmp_path):
+    stage = ExportStage(str(tmp_path))
+    rows = Rows(BIDS[:2])
+    stage.export(1, rows, new_rows=rows.since)
+    assert journal_ids(stage) == [1, 2]
+
+    # Crash after the journal append but before the state file was replaced
+    with open(stage.path(STATE_FILE), encoding='utf-8') as f:
+        state_before = f.read()
+    rows = Rows(BIDS)
+    stage.export(2, rows, new_rows=rows.since)
+    with open(stage.path(STATE_FILE), 'w', encoding='utf-8') as f:
+        f.write(state_before)
+    with open(stage.path(JOURNAL_FILE), 'ab') as f:
+        f.write(b'{"id": 4, "title": "Half wri')
+
+    result = stage.export(3, rows, new_rows=rows.since)
+    assert result['journaled'] == 1
+    assert journal_ids(stage) == [1, 2, 3]
+    assert stage.load_state()['journal_bytes'] == os.path.getsize(stage.path(JOURNAL_FILE))
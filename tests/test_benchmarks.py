@@ -0,0 +1,34 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from load_test import parse_mix, percentile  # noqa: E402
+from synthetic_bids import populate, synthetic_bids  # noqa: E402
+
+
+def test_synthetic_bids_are_reproducible():
+    assert list(synthetic_bids(20, seed=3)) == list(synthetic_bids(20, seed=3))
+    assert list(synthetic_bids(20, seed=3)) != list(synthetic_bids(20, seed=4))
+    assert len({bid['bid_number'] for bid in synthetic_bids(500)}) == 500
+
+
+def test_populate_appends_tagged_bids(app_module):
+    db = app_module.db
+
+    assert populate(db, 300, batch_size=128) == 300
+    assert populate(db, 50, seed=1) == 50
+
+    bids = db.get_all_bids(active_only=False)
+    assert len(bids) == 350
+    sewer = next(b for b in bids if b['title'].startswith('Storm Sewer Cleaning'))
+    assert 'sewer' in sewer['keywords'].split(',')
+    response = app_module.app.test_client().get('/api/statistics')
+    assert response.status_code == 200
+
+
+def test_load_test_helpers():
+    assert parse_mix('bids=80, statistics=20') == {'bids': 80.0, 'statistics': 20.0}
+    latencies = sorted(range(1, 101))
+    assert [percentile(latencies, p) for p in (50, 95, 99)] == [50, 95, 99]
+    assert percentile([], 50) != percentile([], 50)  # NaN
@@ -0,0 +1,28 @@
+import pytest
+
+
+@pytest.fixture
+def client(app_module):
+    for n in (1, 2):
+        app_module.db.add_bid({'bid_number': f'B{n}', 'title': f'Sewer job {n}', 'source': 'City',
+                               'url': f'https://example.gov/bid/{n}', 'location': 'Cleveland', 'type': 'municipal'})
+    return app_module.app.test_client()
+
+
+def test_batch_is_idempotent_and_bumps_version_once(client, app_module):
+    operations = [{'id': 1, 'op': 'favorite'}, {'id': 2, 'op': 'note', 'note': 'call PM'}, {'id': 9, 'op': 'archive'}]
+    version = app_module.db.get_data_version()
+
+    first = client.post('/api/bids/batch', json={'operations': operations}).get_json()
+    second = client.post('/api/bids/batch', json={'operations': operations}).get_json()
+
+    assert [r['status'] for r in first['results']] == ['updated', 'updated', 'not_found']
+    assert [r['status'] for r in second['results']] == ['unchanged', 'unchanged', 'not_found']
+    assert first['data_version'] == second['data_version'] == version + 1
+
+
+@pytest.mark.parametrize('body', [[{'id': 1, 'op': 'favorite'}], 'favorite', {'operations': 'x'}])
+def test_malformed_bodies_are_rejected(client, body):
+    response = client.post('/api/bids/batch', json=body)
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
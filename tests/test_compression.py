@@ -0,0 +1,55 @@
+import gzip
+import re
+
+import pytest
+
+from compression import IMMUTABLE_CACHE, brotli
+
+
+@pytest.fixture
+def client(app_module):
+    for n in range(30):
+        app_module.db.add_bid({'bid_number': f'B{n}', 'title': f'Storm sewer cleaning {n}', 'source': 'City',
+                               'url': f'https://example.gov/bid/{n}', 'location': 'Cleveland', 'type': 'municipal'})
+    return app_module.app.test_client()
+
+
+@pytest.mark.parametrize('accept, encoding', [
+    ('gzip', 'gzip'),
+    pytest.param('br, gzip', 'br', marks=pytest.mark.skipif(brotli is None, reason='brotli not installed')),
+    ('identity', None)
+])
+def test_api_responses_are_negotiated(client, accept, encoding):
+    plain = client.get('/api/bids', headers={'Accept-Encoding': 'identity'}).get_data()
+    response = client.get('/api/bids', headers={'Accept-Encoding': accept})
+
+    assert response.headers.get('Content-Encoding') == encoding
+    assert 'Accept-Encoding' in response.headers['Vary']
+    decode = {'gzip': gzip.decompress, 'br': getattr(brotli, 'decompress', None), None: bytes}[encoding]
+    assert decode(response.get_data()) == plain
+
+
+def test_streamed_exports_are_gzipped_incrementally(client):
+    plain = client.get('/api/export/ndjson').get_data()
+    response = client.get('/api/export/ndjson', headers={'Accept-Encoding': 'br, gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    assert gzip.decompress(response.get_data()) == plain
+
+
+def test_hashed_assets_are_cached_forever(client, app_module):
+    index = client.get('/')
+    assert index.headers['Cache-Control'] == 'no-cache'
+    assert client.get('/', headers={'If-None-Match': index.headers['ETag']}).status_code == 304
+
+    url = re.search(r'src="(/assets/js/app\.[0-9a-f]{12}\.js)"', index.get_data(as_text=True)).group(1)
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Cache-Control'] == IMMUTABLE_CACHE
+    assert response.headers['Content-Encoding'] == 'gzip'
+    with open(f'{app_module.app.static_folder}/js/app.js', 'rb') as f:
+        assert gzip.decompress(response.get_data()) == f.read()
+
+    again = client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']})
+    assert again.status_code == 304
+    assert client.get('/assets/js/app.000000000000.js').status_code == 404
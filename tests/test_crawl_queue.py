@@ -0,0 +1,144 @@
+import sqlite3
+import time
+
+from crawl_queue import DISCOVER_TASK, SOURCE_TASK, CrawlQueue, CrawlWorker, collect_opportunities
+
+
+class FakeBot:
+    """Scrapes from a dict: source -> list of opportunities, or an error run"""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.opportunities = []
+        self.source_runs = {}
+        self.calls = []
+
+    def scrape_sources(self, sources, pause=0):
+        found = {}
+        for source in sources:
+            self.calls.append(source)
+            outcome = self.outcomes[source]
+            run = {'source': source, 'error': None, 'http_status': 200}
+            if isinstance(outcome, dict):
+                run.update(outcome)
+                outcome = []
+            self.source_runs[source] = run
+            found[source] = outcome
+        return found
+
+    def discover(self, state=None, sources=None):
+        raise ConnectionError('sitemap unreachable')
+
+
+def make_queue(tmp_path, **kwargs):
+    return CrawlQueue(str(tmp_path / 'queue.db'), retry_backoff=0, **kwargs)
+
+
+def drain(queue, run_id, bot):
+    CrawlWorker(queue, bot_factory=lambda: bot, enrich=False, pause=0).drain(run_id, idle_wait=0)
+
+
+def test_fetch_errors_are_retried_then_failed(tmp_path):
+    queue = make_queue(tmp_path)
+    run_id = queue.start_run()
+    queue.enqueue(run_id, SOURCE_TASK, 'ok')
+    queue.enqueue(run_id, SOURCE_TASK, 'down')
+    bot = FakeBot({'ok': [{'source': 'ok', 'url': 'u'}], 'down': {'error': 'timed out', 'http_status': None}})
+
+    drain(queue, run_id, bot)
+
+    assert bot.calls.count('down') == queue.max_attempts
+    assert queue.run_status(run_id) == {'done': 1, 'failed': 1}
+    assert queue.failed_sources(run_id, (SOURCE_TASK,)) == {'down'}
+    assert collect_opportunities(queue, run_id) == [{'source': 'ok', 'url': 'u'}]
+
+
+def test_client_errors_fail_without_retry(tmp_path):
+    queue = make_queue(tmp_path)
+    run_id = queue.start_run()
+    queue.enqueue(run_id, SOURCE_TASK, 'gone')
+    bot = FakeBot({'gone': {'error': 'HTTP 404', 'http_status': 404}})
+
+    drain(queue, run_id, bot)
+
+    assert bot.calls == ['gone']
+    assert queue.run_status(run_id) == {'failed': 1}
+
+
+def test_discovery_errors_reach_the_queue(tmp_path):
+    queue = make_queue(tmp_path)
+    run_id = queue.start_run()
+    queue.enqueue(run_id, DISCOVER_TASK, 'city')
+
+    drain(queue, run_id, FakeBot({}))
+
+    assert queue.run_status(run_id) == {'failed': 1}
+    assert queue.failed_sources(run_id, (DISCOVER_TASK,)) == {'city'}
+
+
+def test_run_is_given_up_after_repeated_ingest_failures(tmp_path):
+    queue = make_queue(tmp_path, max_run_attempts=2)
+    run_id = queue.start_run()
+
+    assert not queue.fail_run(run_id, 'ingest blew up')
+    assert queue.unfinished_run() == run_id
+    assert queue.fail_run(run_id, 'ingest blew up again')
+    assert queue.unfinished_run() is None
+
+
+def test_stale_runs_are_not_resumed(tmp_path):
+    queue = make_queue(tmp_path, max_run_hours=1)
+    run_id = queue.start_run()
+    conn = sqlite3.connect(queue.db_path)
+    conn.execute("UPDATE crawl_runs SET created_at = datetime('now', '-2 hours')")
+    conn.commit()
+    conn.close()
+
+    assert queue.unfinished_run() is None
+    assert queue.start_run() != run_id
+
+
+def test_leases_depend_on_kind_and_are_renewed(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds={SOURCE_TASK: 1})
+    run_id = queue.start_run()
+    queue.enqueue(run_id, SOURCE_TASK, 'a')
+    queue.enqueue(run_id, DISCOVER_TASK, 'a')
+
+    source = queue.lease(run_id, SOURCE_TASK, 'w1')
+    queue.lease(run_id, DISCOVER_TASK, 'w1')
+    conn = sqlite3.connect(queue.db_path)
+    expires = dict(conn.execute('SELECT kind, lease_expires FROM crawl_queue').fetchall())
+    conn.close()
+    assert expires[DISCOVER_TASK] - expires[SOURCE_TASK] > 600
+
+    time.sleep(0.6)
+    queue.renew(source, 'w1')
+    time.sleep(0.6)
+    assert queue.lease(run_id, SOURCE_TASK, 'w2') == []
+
+
+def test_unfinished_run_is_claimed_by_one_owner(tmp_path):
+    queue = make_queue(tmp_path, run_claim_seconds=1)
+    run_id = queue.start_run('w1')
+    queue.enqueue(run_id, SOURCE_TASK, 'a')
+
+    assert queue.claim_run('w2') is None
+    assert queue.claim_run('w1') == run_id
+    assert queue.unfinished_run() == run_id
+
+    # Leasing keeps the claim alive; once it lapses another owner takes over
+    time.sleep(0.6)
+    queue.lease(run_id, SOURCE_TASK, 'w1')
+    time.sleep(0.6)
+    assert queue.claim_run('w2') is None
+    time.sleep(0.5)
+    assert queue.claim_run('w2') == run_id
+
+
+def test_failed_ingest_releases_the_claim(tmp_path):
+    queue = make_queue(tmp_path)
+    run_id = queue.start_run('w1')
+
+    queue.fail_run(run_id, 'ingest blew up')
+
+    assert queue.claim_run('w2') == run_id
@@ -0,0 +1,102 @@
+from dedup import MinHasher, MinHashLSH, bid_text, collapse_repeats
+
+SWEEPING = 'Street Sweeping Services {zone} - sweeping of arterial streets and bike lanes, spring and fall cycles'
+
+
+def posting(zone, **fields):
+    bid = {
+        'source': 'City of Cleveland',
+        'title': f'Street Sweeping Services {zone}',
+        'description': SWEEPING.format(zone=zone),
+        'url': f'https://example.gov/bids/{zone.replace(" ", "-").lower()}',
+        'bid_number': f'CC-{zone.replace(" ", "")}'
+    }
+    bid.update(fields)
+    return bid
+
+
+def test_signature_similarity_tracks_text_overlap():
+    hasher = MinHasher()
+    a = hasher.signature(bid_text(posting('Zone 2')))
+    b = hasher.signature(bid_text(posting('Zone 3')))
+    c = hasher.signature('Catch basin cleaning and vactor truck services for the sewer district')
+
+    assert hasher.similarity(a, a) == 1.0
+    assert hasher.similarity(a, b) > 0.6
+    assert hasher.similarity(a, c) < 0.2
+
+
+def test_signature_is_none_for_text_without_words():
+    hasher = MinHasher()
+    assert hasher.signature('') is None
+    assert hasher.signature('»') is None
+    assert hasher.signature(bid_text({'title': ' — ', 'description': None})) is None
+
+
+def test_lsh_returns_near_duplicates_only():
+    hasher = MinHasher()
+    index = MinHashLSH(hasher)
+    index.insert('zone-2', hasher.signature(bid_text(posting('Zone 2'))))
+    index.insert('sewer', hasher.signature('Catch basin cleaning and vactor truck services for the sewer district'))
+
+    assert index.query(hasher.signature(bid_text(posting('Zone 3')))) == ['zone-2']
+    assert index.query(hasher.signature('Road salt delivery for the winter season')) == []
+    assert len(index) == 2
+
+
+def test_collapse_repeats_keeps_distinct_near_duplicates():
+    bids = [posting('Zone 2'), posting('Zone 3')]
+    assert collapse_repeats(bids) == bids
+
+
+def test_collapse_repeats_merges_exact_repeats():
+    first = posting('Zone 2', deadline='')
+    same_url = posting('Zone 2', bid_number='', deadline='2026-11-01')
+    same_number = posting('Zone 2', url='https://example.gov/print/zone-2', description='')
+
+    kept = collapse_repeats([first, same_url, same_number])
+
+    assert kept == [first]
+    assert first['deadline'] == '2026-11-01'
+    assert first['url'] == 'https://example.gov/bids/zone-2'
+
+
+def test_collapse_repeats_keeps_bids_sharing_a_listing_url():
+    listing = 'https://example.gov/purchasing'
+    bids = [
+        posting('Zone 2', url=listing, bid_number='CLV-1'),
+        posting('Zone 5', url=listing, bid_number='CLV-2'),
+        posting('Zone 2', url=listing, bid_number='')
+    ]
+
+    kept = collapse_repeats(bids)
+
+    assert [b['bid_number'] for b in kept] == ['CLV-1', 'CLV-2']
+
+
+def test_cluster_index_labels_near_duplicates(app_module):
+    db = app_module.db
+    for zone in ('Zone 2', 'Zone 3'):
+        assert db.add_bid(dict(posting(zone), location='Cleveland', type='municipal'))
+
+    bids = db.get_all_bids()
+    assert len(bids) == 2
+    assert [b['bid_number'] for b in db.get_duplicates(bids[0]['id'])] == [bids[1]['bid_number']]
+
+
+def test_catch_up_indexes_empty_text_bids_once(app_module):
+    db = app_module.db
+    db.add_bid({
+        'bid_number': 'IMG-1', 'title': '»', 'source': 'City of Cleveland',
+        'url': 'https://example.gov/bid.pdf', 'location': 'Cleveland', 'type': 'municipal'
+    })
+    conn = db.get_connection()
+    conn.execute('DELETE FROM bid_signatures')
+    conn.commit()
+    conn.close()
+
+    version = db.get_data_version()
+    assert db.index_missing_duplicates() == 1
+    assert db.index_missing_duplicates() == 0
+    assert db.get_data_version() == version + 1
+    assert db.get_duplicates(db.get_all_bids()[0]['id']) == []
@@ -0,0 +1,150 @@
+import pytest
+
+from discovery import MemoryCrawlState, SiteDiscovery, url_bid_number
+
+CONFIG = {
+    'listing_urls': ['https://example.gov/bids'],
+    'location': 'Cleveland, OH',
+    'type': 'municipal'
+}
+
+
+class Response:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeSite:
+    """Pages by URL; answers If-None-Match with 304 when the ETag matches"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    def fetch(self, url, headers):
+        self.fetched.append(url)
+        if isinstance(self.pages[url], int):
+            return Response(self.pages[url])
+        body = self.pages[url].encode()
+        etag = f'"{hash(body)}"'
+        if headers.get('If-None-Match') == etag:
+            return Response(304)
+        return Response(200, body, {'ETag': etag})
+
+
+class NoWait:
+    def wait(self, url):
+        pass
+
+
+def crawl(site, state, config=CONFIG):
+    discovery = SiteDiscovery('City', config, site.fetch, state,
+                              is_relevant=lambda text: 'sewer' in text.lower(), rate_limiter=NoWait())
+    return discovery.crawl(), discovery.stats
+
+
+def test_unchanged_listing_page_still_leads_to_changed_pages():
+    site = FakeSite({
+        'https://example.gov/bids': '<a href="/bids?page=2" rel="next">Next</a>',
+        'https://example.gov/bids?page=2': '<a href="/bid/1">Sewer lining</a>'
+    })
+    state = MemoryCrawlState()
+    found, _ = crawl(site, state)
+    assert [o['url'] for o in found] == ['https://example.gov/bid/1']
+
+    site.pages['https://example.gov/bids?page=2'] += '<a href="/bid/2">Sewer cleaning</a>'
+    site.fetched = []
+    found, stats = crawl(site, state)
+
+    assert site.fetched == ['https://example.gov/bids', 'https://example.gov/bids?page=2']
+    assert stats['not_modified'] == 1 and stats['changed'] == 1
+    assert {o['url'] for o in found} == {'https://example.gov/bid/1', 'https://example.gov/bid/2'}
+
+
+def test_url_bid_number_is_stable_per_normalized_url():
+    assert url_bid_number('https://Example.gov/bid/1?utm_source=x') == url_bid_number('https://example.gov/bid/1')
+    assert url_bid_number('https://example.gov/bid/1') != url_bid_number('https://example.gov/bid/2')
+    assert url_bid_number('') == ''
+
+
+def test_bids_without_numbers_are_stored_separately(app_module):
+    db = app_module.db
+    for n in (1, 2, 1):
+        db.add_bid({'title': f'Sewer job {n}', 'source': 'City', 'url': f'https://example.gov/bid/{n}',
+                    'location': 'Cleveland', 'type': 'municipal'})
+
+    bids = db.get_all_bids()
+    assert sorted(b['title'] for b in bids) == ['Sewer job 1', 'Sewer job 2']
+    assert all(b['bid_number'].startswith('URL-') for b in bids)
+
+
+def test_database_crawl_state_keeps_listing_links(app_module):
+    db = app_module.db
+    site = FakeSite({
+        'https://example.gov/bids': '<a href="/bids?page=2" rel="next">Next</a>',
+        'https://example.gov/bids?page=2': '<a href="/bid/1">Sewer lining</a>'
+    })
+    crawl(site, db)
+    site.fetched = []
+    crawl(site, db)
+
+    assert db.get_crawl_state('https://example.gov/bids')['links'] == ['https://example.gov/bids?page=2']
+    assert site.fetched == ['https://example.gov/bids', 'https://example.gov/bids?page=2']
+
+
+SITEMAP_INDEX = """<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.gov/sitemap-bids.xml</loc><lastmod>2026-10-01</lastmod></sitemap>
+</sitemapindex>"""
+SITEMAP = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.gov/bids/sewer</loc><lastmod>2026-10-01</lastmod></url>
+</urlset>"""
+
+
+def test_unchanged_child_sitemap_is_not_refetched():
+    config = dict(CONFIG, listing_urls=[], sitemaps=['https://example.gov/sitemap.xml'])
+    site = FakeSite({
+        'https://example.gov/sitemap.xml': SITEMAP_INDEX,
+        'https://example.gov/sitemap-bids.xml': SITEMAP,
+        'https://example.gov/bids/sewer': '<a href="/bid/1">Sewer lining</a>'
+    })
+    state = MemoryCrawlState()
+    crawl(site, state, config)
+    assert state.get_crawl_state('https://example.gov/sitemap-bids.xml')['sitemap_lastmod'] == '2026-10-01'
+
+    site.fetched = []
+    _, stats = crawl(site, state, config)
+    assert site.fetched == ['https://example.gov/sitemap.xml']
+    assert stats['skipped_by_lastmod'] == 1
+
+
+def test_crawl_with_every_request_failing_raises():
+    site = FakeSite({'https://example.gov/bids': 503})
+    with pytest.raises(RuntimeError, match='all 1 requests errored'):
+        crawl(site, MemoryCrawlState())
+
+
+def test_partial_failures_still_return_results():
+    site = FakeSite({
+        'https://example.gov/bids': '<a href="/bids?page=2" rel="next">Next</a><a href="/bid/1">Sewer lining</a>',
+        'https://example.gov/bids?page=2': 500
+    })
+    found, stats = crawl(site, MemoryCrawlState())
+    assert [o['url'] for o in found] == ['https://example.gov/bid/1']
+    assert stats['errors'] == 1
+
+
+def test_enriched_bid_number_rekeys_the_url_keyed_row(app_module):
+    db = app_module.db
+    link = {'title': 'Sewer lining', 'source': 'City', 'url': 'https://example.gov/bid/1',
+            'location': 'Cleveland', 'type': 'municipal'}
+    db.add_bid(link)
+    bid_id = db.get_all_bids()[0]['id']
+
+    db.add_bid(dict(link, bid_number='RFQ-2026-17', description='Line 800 ft of sewer'))
+
+    bids = db.get_all_bids()
+    assert [(b['id'], b['bid_number'], b['description']) for b in bids] == [
+        (bid_id, 'RFQ-2026-17', 'Line 800 ft of sewer')
+    ]
@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+import pytest
+
+from enrichment import DetailEnricher, MemoryDetailCache
+
+URL = 'https://example.gov/bid/1'
+PAGE = b'<p>Bid No. RFQ-2026-17</p><p>Bids due: October 30, 2026</p>'
+
+
+class Response:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class DetailSite:
+    """One detail page with an ETag; `outage` makes every fetch fail"""
+
+    def __init__(self):
+        self.requests = []
+        self.outage = None
+
+    def fetch(self, source, url, headers):
+        self.requests.append(dict(headers))
+        if self.outage == 'error':
+            raise ConnectionError('connection reset')
+        if self.outage:
+            return Response(self.outage)
+        if headers.get('If-None-Match') == '"v1"':
+            return Response(304)
+        return Response(200, PAGE, {'ETag': '"v1"'})
+
+
+class NoWait:
+    def wait(self, url):
+        pass
+
+
+def enrich(site, cache, **kwargs):
+    enricher = DetailEnricher(site.fetch, cache, rate_limiter=NoWait(), **kwargs)
+    opportunity = {'source': 'City', 'url': URL, 'title': 'Sewer lining'}
+    enricher.enrich([opportunity])
+    return opportunity, enricher.stats
+
+
+@pytest.fixture(params=['memory', 'database'])
+def cache(request, app_module):
+    return MemoryDetailCache() if request.param == 'memory' else app_module.db
+
+
+def test_cached_details_are_reused_within_the_revalidation_window(cache):
+    site = DetailSite()
+    first, _ = enrich(site, cache)
+    second, stats = enrich(site, cache)
+
+    assert first['bid_number'] == second['bid_number'] == 'RFQ-2026-17'
+    assert second['deadline'] == '2026-10-30'
+    assert len(site.requests) == 1 and stats['cache_hits'] == 1
+
+
+def test_stale_entries_are_revalidated_conditionally(cache):
+    site = DetailSite()
+    enrich(site, cache)
+    opportunity, stats = enrich(site, cache, revalidate_after=timedelta(0))
+
+    assert site.requests[-1] == {'If-None-Match': '"v1"'}
+    assert stats['not_modified'] == 1 and opportunity['bid_number'] == 'RFQ-2026-17'
+
+
+@pytest.mark.parametrize('outage', ['error', 503])
+def test_failed_revalidation_falls_back_to_cached_details(cache, outage):
+    site = DetailSite()
+    enrich(site, cache)
+    site.outage = outage
+
+    opportunity, stats = enrich(site, cache, revalidate_after=timedelta(0))
+    assert opportunity['deadline'] == '2026-10-30'
+    assert stats['errors'] == (1 if outage == 'error' else 0)
+
+    uncached, _ = enrich(site, MemoryDetailCache())
+    assert 'deadline' not in uncached
@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.mark.parametrize('headers, query', [({'Last-Event-ID': 'abc'}, ''), ({}, '?since=1.5')])
+def test_malformed_event_id_is_rejected(app_module, headers, query):
+    response = app_module.app.test_client().get('/api/events' + query, headers=headers)
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
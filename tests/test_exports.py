@@ -0,0 +1,46 @@
+import csv
+import io
+import json
+
+import pytest
+
+from exports import iter_csv, iter_json_array, iter_ndjson
+
+
+@pytest.fixture
+def client(app_module):
+    titles = ['Sewer jetting, phase "2"', 'Catch basin cleaning\nand disposal', 'Égout – storm drain repair']
+    for n, title in enumerate(titles):
+        app_module.db.add_bid({'bid_number': f'B{n}', 'title': title, 'source': 'City', 'description': f'Job {n}',
+                               'url': f'https://example.gov/bid/{n}', 'location': 'Cleveland', 'type': 'municipal'})
+    return app_module.app.test_client()
+
+
+def as_text(bids):
+    return [{k: '' if v is None else str(v) for k, v in bid.items()} for bid in bids]
+
+
+def test_streamed_csv_matches_get_all_bids(client, app_module):
+    response = client.get('/api/export/csv')
+
+    assert response.status_code == 200 and response.is_streamed
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert rows == as_text(app_module.db.get_all_bids())
+
+
+def test_streamed_ndjson_matches_get_all_bids(client, app_module):
+    response = client.get('/api/export/ndjson')
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == app_module.db.get_all_bids()
+
+
+def test_small_chunks_reassemble_to_the_same_document():
+    rows = [{'id': n, 'title': f'Bid {n}, "quoted"'} for n in range(50)]
+
+    chunks = list(iter_csv(rows, chunk_size=64))
+    assert len(chunks) > 2
+    assert list(csv.DictReader(io.StringIO(''.join(chunks)))) == as_text(rows)
+    assert [json.loads(line) for line in ''.join(iter_ndjson(rows, chunk_size=64)).splitlines()] == rows
+    assert json.loads(''.join(iter_json_array(rows))) == rows
+    assert json.loads(''.join(iter_json_array([]))) == []
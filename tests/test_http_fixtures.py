@@ -0,0 +1,39 @@
+import pytest
+import requests
+
+from http_fixtures import RecordingSession, ReplaySession, build_response
+
+
+class LiveSession:
+    headers = {'User-Agent': 'test'}
+
+    def get(self, url, **kwargs):
+        return build_response(url, 200, b'<a href="/bid/1">Sewer lining</a>',
+                              {'Content-Type': 'text/html', 'ETag': '"v1"', 'Set-Cookie': 'x=1'})
+
+
+def test_recorded_responses_replay_offline(tmp_path):
+    url = 'https://example.gov/bids'
+    live = RecordingSession(LiveSession(), str(tmp_path)).get(url)
+
+    replayed = ReplaySession(str(tmp_path)).get(url)
+
+    assert (replayed.status_code, replayed.content) == (live.status_code, live.content)
+    assert replayed.headers['ETag'] == '"v1"' and 'Set-Cookie' not in replayed.headers
+    assert ReplaySession(str(tmp_path)).get('https://example.gov/other').status_code == 404
+
+
+def test_failure_injection(tmp_path):
+    session = ReplaySession(str(tmp_path), error_rate=1.0)
+    session.add('https://example.gov/bids', 'ok')
+    assert session.get('https://example.gov/bids').status_code == 503
+
+    with pytest.raises(requests.ConnectionError):
+        ReplaySession(str(tmp_path), failure_rate=1.0).get('https://example.gov/bids')
+
+    def outcomes(seed):
+        session = ReplaySession(str(tmp_path), error_rate=0.5, seed=seed)
+        session.add('https://example.gov/bids', 'ok')
+        return [session.get('https://example.gov/bids').status_code for _ in range(20)]
+
+    assert outcomes(7) == outcomes(7) and set(outcomes(7)) == {200, 503}
@@ -0,0 +1,61 @@
+import sqlite3
+
+import pytest
+
+from maintenance import DatabaseMaintenance
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """A WAL database with incremental auto-vacuum and a few hundred free pages"""
+    path = str(tmp_path / 'bids.db')
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('CREATE TABLE bids (id INTEGER PRIMARY KEY, description TEXT)')
+    conn.executemany('INSERT INTO bids (description) VALUES (?)', [('x' * 2000,) for _ in range(400)])
+    conn.commit()
+    conn.execute('DELETE FROM bids WHERE id > 10')
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_vacuum_runs_in_bounded_slices_beside_a_reader(db_path):
+    reader = sqlite3.connect(db_path)
+    reader.execute('BEGIN')
+    assert reader.execute('SELECT COUNT(*) FROM bids').fetchone()[0] == 10
+
+    maintenance = DatabaseMaintenance(db_path, vacuum_pages=16, max_vacuum_slices=3, pause=0)
+    free_before = sqlite3.connect(db_path).execute('PRAGMA freelist_count').fetchone()[0]
+    result = maintenance.run_pass(['vacuum'])['tasks']['vacuum']
+
+    # An open read transaction does not block the slices, and each frees at most vacuum_pages
+    assert result['status'] == 'ok' and not result['converted']
+    assert result['slices'] == 3 and result['pages_freed'] == 48
+    assert result['free_pages'] == free_before - 48
+    assert reader.execute('SELECT COUNT(*) FROM bids').fetchone()[0] == 10
+    reader.rollback()
+
+    writer = sqlite3.connect(db_path, timeout=0)
+    writer.execute("INSERT INTO bids (description) VALUES ('new')")
+    writer.commit()
+
+
+def test_checkpoint_is_passive(db_path):
+    reader = sqlite3.connect(db_path)
+    reader.execute('BEGIN')
+    reader.execute('SELECT COUNT(*) FROM bids').fetchone()
+
+    writer = sqlite3.connect(db_path)
+    writer.execute("INSERT INTO bids (description) VALUES ('new')")
+    writer.commit()
+
+    # Frames the reader may still need are left in the WAL instead of waiting on it
+    result = DatabaseMaintenance(db_path).run_pass(['checkpoint'])['tasks']['checkpoint']
+    assert result['status'] == 'ok' and not result['busy']
+    assert result['checkpointed'] < result['wal_frames']
+
+    reader.rollback()
+    result = DatabaseMaintenance(db_path).run_pass(['checkpoint'])['tasks']['checkpoint']
+    assert result['checkpointed'] == result['wal_frames']
@@ -0,0 +1,44 @@
+import re
+
+from metrics import Counter, Gauge, Histogram, Registry
+
+# name{labels} value, as in the Prometheus text exposition format
+SAMPLE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_]\w*="([^"\\\n]|\\.)*",?)*\})? (-?[0-9.e+-]+|\+Inf|NaN)$')
+
+
+def test_exposition_format():
+    registry = Registry()
+    requests = Counter('app_requests_total', 'Requests', ['path'], registry=registry)
+    temperature = Gauge('app_temperature', 'Degrees', registry=registry)
+    latency = Histogram('app_latency_seconds', 'Latency', buckets=(0.1, 1.0), registry=registry)
+
+    requests.labels(path='/a "quoted"\\path').inc(2)
+    temperature.set(21.5)
+    for value in (0.05, 0.5, 5):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ['# HELP app_requests_total Requests', '# TYPE app_requests_total counter']
+    assert 'app_requests_total{path="/a \\"quoted\\"\\\\path"} 2' in lines
+    assert 'app_temperature 21.5' in lines
+    assert lines[-5:] == [
+        'app_latency_seconds_bucket{le="0.1"} 1',
+        'app_latency_seconds_bucket{le="1.0"} 2',
+        'app_latency_seconds_bucket{le="+Inf"} 3',
+        'app_latency_seconds_sum 5.55',
+        'app_latency_seconds_count 3'
+    ]
+    assert all(SAMPLE.match(line) for line in lines if not line.startswith('#'))
+
+
+def test_metrics_endpoint_reports_api_requests(app_module):
+    client = app_module.app.test_client()
+    client.get('/api/bids')
+
+    response = client.get('/metrics')
+    body = response.get_data(as_text=True)
+
+    assert response.mimetype == 'text/plain' and 'version=0.0.4' in response.headers['Content-Type']
+    assert '# TYPE bid_monitor_http_request_duration_seconds histogram' in body
+    assert re.search(r'bid_monitor_http_request_duration_seconds_count\{endpoint="get_bids",method="GET",status="200"\} [1-9]', body)
+    assert all(SAMPLE.match(line) for line in body.splitlines() if line and not line.startswith('#'))
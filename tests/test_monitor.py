@@ -0,0 +1,18 @@
+from crawl_queue import SOURCE_TASK
+
+
+def test_refresh_is_refused_while_one_is_running(app_module):
+    monitor = app_module.monitor_thread
+    with monitor._refresh_lock:
+        assert monitor.run_monitor() is None
+        response = app_module.app.test_client().post('/api/refresh')
+    assert response.status_code == 409
+
+
+def test_run_held_by_another_process_is_not_ingested_twice(app_module):
+    queue = app_module.crawl_queue
+    run_id = queue.start_run('other-host:1:1')
+    queue.enqueue(run_id, SOURCE_TASK, 'City')
+
+    assert app_module.monitor_thread.run_monitor() is None
+    assert queue.run_status(run_id) == {'pending': 1}
@@ -0,0 +1,69 @@
+import smtplib
+
+import pytest
+
+from notifications import DebugSMTPServer, NotificationWorker, SMTPPool
+
+
+@pytest.fixture
+def outbox(app_module):
+    db = app_module.db
+    db.outbox_enabled = True
+    db.create_saved_search({'name': 'Paving', 'keywords': 'paving', 'email': 'ops@example.com'})
+    db.create_saved_search({'name': 'Roads', 'keywords': 'road', 'email': 'ops@example.com'})
+    db.create_saved_search({'name': 'Sewer', 'keywords': 'sewer', 'email': 'utilities@example.com'})
+    for number, title in (('P-1', 'Road paving phase 1'), ('P-2', 'Road paving phase 2'),
+                          ('S-1', 'Sewer lining')):
+        db.add_bid({'bid_number': number, 'title': title, 'source': 'City',
+                    'location': 'Springfield', 'url': f'https://city.example/{number}'})
+    return db
+
+
+@pytest.fixture
+def smtp_server():
+    server = DebugSMTPServer(port=0, echo=False).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_one_digest_per_recipient(outbox, smtp_server):
+    pool = SMTPPool(*smtp_server.server_address)
+    totals = NotificationWorker(outbox, pool, 'bids@example.com').deliver()
+    pool.close()
+
+    # Two searches matching the same two bids still make one digest listing each bid once
+    assert totals == {'sent': 2, 'failed': 0, 'skipped': 0, 'alerts': 5}
+    digests = {m['to'][0].strip('<>'): m['message'] for m in smtp_server.messages}
+    assert sorted(digests) == ['ops@example.com', 'utilities@example.com']
+    body = digests['ops@example.com'].get_payload()
+    assert digests['ops@example.com']['Subject'].startswith('2 new bid opportunities')
+    assert body.count('Road paving phase 1') == 1 and 'Matched: Paving, Roads' in body
+    assert outbox.get_notification_stats() == {'sent': 5}
+    assert NotificationWorker(outbox, pool, 'bids@example.com').deliver()['alerts'] == 0
+
+
+class DownPool:
+    size = 2
+    host, port = 'smtp.example', 25
+
+    def send(self, message):
+        raise smtplib.SMTPServerDisconnected('connection refused')
+
+
+def test_failed_digest_is_retried_with_backoff_then_failed(outbox):
+    worker = NotificationWorker(outbox, DownPool(), 'bids@example.com', max_attempts=2, retry_backoff=0)
+
+    # With no backoff the rows come due again within the same pass, until they give up
+    assert worker.deliver()['failed'] == 4
+    assert outbox.get_notification_stats() == {'failed': 5}
+    assert worker.deliver()['alerts'] == 0
+
+
+def test_retry_waits_for_backoff(outbox):
+    worker = NotificationWorker(outbox, DownPool(), 'bids@example.com', retry_backoff=60)
+
+    assert worker.deliver()['failed'] == 2
+    # Not due again until the backoff has passed
+    assert worker.deliver()['alerts'] == 0
+    assert outbox.get_notification_stats() == {'pending': 5}
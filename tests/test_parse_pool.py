@@ -0,0 +1,31 @@
+import multiprocessing
+import os
+
+from parse_pool import ParsePool, parse_listing
+
+
+def crash_in_worker(value):
+    # Kills a pool worker outright; runs normally in the parent
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return value
+
+
+def test_crashed_worker_falls_back_inline_and_rebuilds():
+    pool = ParsePool(1)
+    try:
+        futures = [(n, pool.submit(crash_in_worker, n)) for n in (1, 2)]
+        assert [pool.result(future, crash_in_worker, n) for n, future in futures] == [1, 2]
+        assert pool.run(crash_in_worker, 3) == 3
+        assert pool.run(len, 'abc') == 3
+    finally:
+        pool.close()
+
+
+def test_spawned_workers_parse_listings():
+    pool = ParsePool(1, start_method='spawn')
+    try:
+        links, _ = pool.run(parse_listing, b'<a href="/bid/1">Sewer lining</a>', 'sewer', 'https://example.gov')
+    finally:
+        pool.close()
+    assert links == (('Sewer lining', 'https://example.gov/bid/1'),)
@@ -0,0 +1,54 @@
+from crawl_queue import DISCOVER_TASK, SOURCE_TASK
+
+
+def test_failed_fetch_is_not_recorded_as_a_change(app_module):
+    queue, db = app_module.crawl_queue, app_module.db
+    listing = [{'source': 'City', 'url': 'https://example.gov/bid/1', 'title': 'Sewer cleaning'}]
+    sitemap = [{'source': 'City', 'url': 'https://example.gov/bid/2', 'title': 'Catch basin cleaning'}]
+
+    def poll(source_result):
+        run_id = queue.start_run()
+        queue.enqueue(run_id, SOURCE_TASK, 'City')
+        queue.enqueue(run_id, DISCOVER_TASK, 'City')
+        task = queue.lease(run_id, SOURCE_TASK, 'test')[0]
+        if source_result is None:
+            queue.fail(task, 'test', 'timed out', retry=False)
+        else:
+            queue.complete(task, 'test', source_result)
+        queue.complete(queue.lease(run_id, DISCOVER_TASK, 'test')[0], 'test', sitemap)
+        app_module.monitor_thread._record_polls(run_id, ['City'])
+        return db.get_source_schedule('City')
+
+    first = poll(listing)
+    failed = poll(None)
+
+    # The landing page failed: only the discovery half came back, which must
+    # not look like a changed listing
+    assert failed['signature'] == first['signature']
+    assert failed['changes'] == 0
+    assert failed['polls'] == first['polls']
+
+
+def test_quiet_polls_after_a_discovery_change_are_unchanged(app_module):
+    queue, db = app_module.crawl_queue, app_module.db
+    listing = [{'source': 'City', 'url': 'https://example.gov/bid/1', 'title': 'Sewer cleaning'}]
+    page = 'https://example.gov/bids?page=2'
+
+    def poll(page_hash, discovered):
+        # Discovery stores the page state and returns matches only when the page changed
+        db.save_crawl_state(page, 'City', content_hash=page_hash)
+        run_id = queue.start_run()
+        queue.enqueue(run_id, SOURCE_TASK, 'City')
+        queue.enqueue(run_id, DISCOVER_TASK, 'City')
+        queue.complete(queue.lease(run_id, SOURCE_TASK, 'test')[0], 'test', listing)
+        queue.complete(queue.lease(run_id, DISCOVER_TASK, 'test')[0], 'test', discovered)
+        app_module.monitor_thread._record_polls(run_id, ['City'])
+        return db.get_source_schedule('City')
+
+    poll('a', [])
+    changed = poll('b', [{'source': 'City', 'url': 'https://example.gov/bid/2', 'title': 'Culvert jetting'}])
+    quiet = [poll('b', []) for _ in range(2)]
+
+    assert changed['changes'] == 1
+    assert [state['changes'] for state in quiet] == [1, 1]
+    assert quiet[-1]['signature'] == changed['signature']
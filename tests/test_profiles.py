@@ -0,0 +1,34 @@
+import pytest
+
+from profiles import DEFAULT_PROFILE, CompiledProfile, validate_profile
+
+
+def test_validate_profile_normalizes_terms():
+    profile = validate_profile({'keywords': ['  Sewer ', '', 'Vactor'], 'tags': {'sewer': ['Sewer', ' ']}})
+    assert profile['keywords'] == ['sewer', 'vactor']
+    assert profile['tags'] == {'sewer': ['sewer']}
+
+
+@pytest.mark.parametrize('keywords', [[], ['  ', ''], 'sewer', None])
+def test_validate_profile_rejects_empty_keywords(keywords):
+    with pytest.raises(ValueError):
+        validate_profile({'keywords': keywords})
+
+
+def test_validate_profile_rejects_blank_weights():
+    with pytest.raises(ValueError):
+        validate_profile({'keywords': ['sewer'], 'weights': {' ': 1}})
+
+
+def test_compiled_profile_matches_keywords_only():
+    profile = CompiledProfile(validate_profile(DEFAULT_PROFILE))
+    assert profile.matches('Catch Basin Cleaning - Zone 4')
+    assert not profile.matches('office supplies')
+    assert profile.tag('Storm drain and sewer cleaning') == 'cleaning,sewer,catch-basin'
+
+
+def test_profile_put_rejects_blank_keywords(app_module):
+    client = app_module.app.test_client()
+    response = client.put('/api/profile', json={'keywords': ['  ']})
+    assert response.status_code == 400
+    assert client.get('/api/profile').get_json()['profile']['keywords'] == DEFAULT_PROFILE['keywords']
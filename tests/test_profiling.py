@@ -0,0 +1,30 @@
+from flask import Flask
+
+from profiling import Profiler
+
+
+def test_overlapping_captures_are_skipped(tmp_path):
+    profiler = Profiler(str(tmp_path))
+
+    def nested():
+        return profiler.profile_call('inner', lambda: 'done')
+
+    (inner_result, inner_name), outer_name = profiler.profile_call('outer', nested)
+
+    assert inner_result == 'done' and inner_name is None
+    assert outer_name and [p['name'] for p in profiler.list_profiles()] == [outer_name]
+    # The lock is released, so the next capture runs
+    assert profiler.profile_call('again', lambda: None)[1]
+
+
+def test_flagged_request_is_profiled_and_releases(tmp_path):
+    app = Flask(__name__)
+    profiler = Profiler(str(tmp_path))
+    profiler.init_app(app)
+    app.add_url_rule('/ping', 'ping', lambda: 'pong')
+    client = app.test_client()
+
+    for _ in range(2):
+        assert client.get('/ping', headers={'X-Profile': '1'}).data == b'pong'
+
+    assert len(profiler.list_profiles()) == 2
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from relevance import RelevanceModel
+
+
+def batch(n):
+    return [{'title': f'Storm sewer jetting {i}', 'description': 'catch basin cleaning ' * (n % 3)} for i in range(n)]
+
+
+def test_rank_leaves_the_shared_model_unchanged():
+    model = RelevanceModel()
+    idf = model.idf.copy()
+
+    model.rank(batch(5), corpus=['janitorial services', 'sewer televising'])
+
+    assert np.array_equal(model.idf, idf)
+    assert model.avgdl is None
+
+
+def test_concurrent_rank_matches_sequential():
+    model = RelevanceModel()
+    sizes = [1, 2, 3, 5, 8, 13] * 10
+    expected = [[o['relevance'] for o in model.rank(batch(n))] for n in sizes]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda n: [o['relevance'] for o in model.rank(batch(n))], sizes))
+
+    assert results == expected
+
+
+def test_stored_bid_scoring_keeps_statistics_off_the_shared_model(app_module):
+    db = app_module.db
+    for n, title in enumerate(['Storm sewer jetting', 'Catch basin cleaning', 'Janitorial services']):
+        db.add_bid({'bid_number': f'B{n}', 'title': title, 'source': 'City', 'url': f'https://example.gov/bid/{n}',
+                    'location': 'Cleveland', 'type': 'municipal'})
+    profile = db.keyword_profile()
+    model = profile.relevance
+
+    db.score_unranked_bids(profile)
+    db.retag_bids(profile)
+
+    assert model.avgdl is None and np.array_equal(model.idf, np.ones(len(model.terms)))
+    idf, avgdl = profile.relevance_statistics(db.get_relevance_corpus)
+    expected = model.score([b['title'] + ' ' for b in db.get_all_bids()], (idf, avgdl))
+    assert sorted(round(b['relevance'], 4) for b in db.get_all_bids()) == sorted(round(s, 4) for s in expected)
+
+
+def test_keyword_match_that_scores_zero_is_kept():
+    model = RelevanceModel()
+    opportunities = [{'title': 'Storm sewer jetting'}, {'title': 'Street repaving program'}]
+
+    ranked = model.rank([dict(o) for o in opportunities])
+    assert [o['title'] for o in ranked] == ['Storm sewer jetting', 'Street repaving program']
+    assert ranked[-1]['relevance'] == 0
+
+    kept = model.rank([dict(o) for o in opportunities], min_relevance=0.01)
+    assert [o['title'] for o in kept] == ['Storm sewer jetting']
@@ -0,0 +1,42 @@
+from datetime import date
+
+import pytest
+
+from reports import ReportCache, render_report, safe_url
+
+
+def test_relative_filters_are_keyed_by_date():
+    relative = {'deadline_within': 7, 'types': []}
+    assert ReportCache.key(3, relative, today=date(2026, 10, 19)) != ReportCache.key(3, relative, today=date(2026, 10, 20))
+
+    fixed = {'deadline_within': None, 'types': ['county']}
+    assert ReportCache.key(3, fixed, today=date(2026, 10, 19)) == ReportCache.key(3, fixed, today=date(2026, 10, 20))
+    assert ReportCache.key(3, fixed) != ReportCache.key(4, fixed)
+
+
+def test_report_escapes_scraped_text():
+    html = ''.join(render_report([{
+        'title': '<script>alert(1)</script>',
+        'description': 'Bids "due" <b>soon</b>',
+        'type': 'County',
+        'url': 'https://county.example/bids?a=1&b=2',
+    }]))
+
+    assert '<script>alert(1)</script>' not in html
+    assert '&lt;script&gt;alert(1)&lt;/script&gt;' in html
+    assert '&lt;b&gt;soon&lt;/b&gt;' in html
+    assert 'href="https://county.example/bids?a=1&amp;b=2"' in html
+
+
+@pytest.mark.parametrize('url', [
+    'javascript:alert(1)', ' JavaScript:alert(1)', 'data:text/html,<script>', 'vbscript:msgbox', '', None
+])
+def test_safe_url_rejects_non_http_links(url):
+    assert safe_url(url) == '#'
+    html = ''.join(render_report([{'title': 'Paving', 'url': url}]))
+    assert 'href="#"' in html and 'script:' not in html.lower()
+
+
+def test_safe_url_keeps_http_links():
+    assert safe_url(' https://city.example/rfq/1 ') == 'https://city.example/rfq/1'
+    assert safe_url('HTTP://city.example') == 'HTTP://city.example'
@@ -0,0 +1,22 @@
+def test_non_numeric_deadline_within_is_rejected(app_module):
+    client = app_module.app.test_client()
+
+    response = client.post('/api/searches', json={'name': 'Sewer', 'deadline_within': 'soon'})
+    assert response.status_code == 400
+    assert 'deadline_within' in response.get_json()['error']
+
+    search = client.post('/api/searches', json={'name': 'Sewer', 'deadline_within': '14'}).get_json()['search']
+    assert search['deadline_within'] == 14
+    response = client.put(f"/api/searches/{search['id']}", json={'deadline_within': [1]})
+    assert response.status_code == 400
+
+
+def test_non_numeric_deadline_filter_is_rejected(app_module):
+    client = app_module.app.test_client()
+    for path in ('/api/bids', '/api/export/csv', '/api/export/ndjson', '/api/report'):
+        response = client.get(f'{path}?deadline_within=soon')
+        assert response.status_code == 400, path
+        assert 'deadline_within' in response.get_json()['error']
+
+    assert client.get('/api/bids?deadline_within=').status_code == 200
+    assert client.get('/api/bids?deadline_within=7').status_code == 200
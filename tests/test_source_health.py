@@ -0,0 +1,65 @@
+import sqlite3
+
+DAY = "datetime('now', '-2 days', 'start of day', ?)"
+
+
+def log_runs(db, run_id, runs):
+    """Log runs at the given offsets (e.g. '+9 hours') into the day before yesterday"""
+    db.log_source_runs(run_id, [run for run, _ in runs])
+    conn = sqlite3.connect(db.db_path)
+    ids = [row[0] for row in conn.execute('SELECT id FROM source_runs WHERE run_id = ? ORDER BY id', (run_id,))]
+    conn.executemany(f'UPDATE source_runs SET run_at = {DAY} WHERE id = ?',
+                     [(offset, i) for (_, offset), i in zip(runs, ids)])
+    conn.commit()
+    conn.close()
+
+
+def stats(db, period):
+    conn = sqlite3.connect(db.db_path)
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute('SELECT * FROM source_stats WHERE period = ? ORDER BY source, bucket', (period,))
+    result = [dict(row) for row in rows]
+    conn.close()
+    return result
+
+
+def test_hourly_runs_roll_up_into_days(app_module):
+    db = app_module.db
+    log_runs(db, 'r1', [
+        ({'source': 'City', 'duration_seconds': 1.0, 'bytes': 100, 'matches': 3}, '+9 hours'),
+        ({'source': 'City', 'duration_seconds': 3.0, 'bytes': 300, 'matches': 1}, '+570 minutes'),
+        ({'source': 'City', 'duration_seconds': 2.0, 'error': 'HTTP 503'}, '+10 hours'),
+        ({'source': 'County', 'duration_seconds': 4.0, 'bytes': 50, 'matches': 2}, '+10 hours'),
+    ])
+    db.rollup_source_runs()
+
+    hours = [(s['source'], s['bucket'][11:], s['runs'], s['errors']) for s in stats(db, 'hour')]
+    assert hours == [('City', '09:00:00', 2, 0), ('City', '10:00:00', 1, 1), ('County', '10:00:00', 1, 0)]
+    city, county = stats(db, 'day')
+    assert (city['runs'], city['errors'], city['duration_seconds'], city['max_duration_seconds']) == (3, 1, 6.0, 3.0)
+    assert (city['bytes'], city['matches']) == (400, 4)
+    assert (county['runs'], county['bucket']) == (1, city['bucket'])
+
+    # A later run in the same day updates its buckets instead of counting earlier runs twice
+    log_runs(db, 'r2', [({'source': 'City', 'duration_seconds': 5.0, 'matches': 1}, '+23 hours')])
+    db.rollup_source_runs()
+    db.rollup_source_runs()
+    city = stats(db, 'day')[0]
+    assert (city['runs'], city['errors'], city['max_duration_seconds'], city['matches']) == (4, 1, 5.0, 5)
+    assert len(stats(db, 'hour')) == 4
+
+    health = {h['source']: h['summary'] for h in db.get_source_health(period='day', buckets=7)}
+    assert health['City']['runs'] == 4 and health['City']['error_rate'] == 0.25
+    assert health['County']['matches'] == 2
+
+
+def test_rolled_up_raw_runs_expire(app_module):
+    db = app_module.db
+    log_runs(db, 'r1', [({'source': 'City', 'duration_seconds': 1.0}, '+9 hours')])
+
+    db.rollup_source_runs(keep_raw_days=1)
+
+    conn = sqlite3.connect(db.db_path)
+    assert conn.execute('SELECT COUNT(*) FROM source_runs').fetchone()[0] == 0
+    conn.close()
+    assert [s['runs'] for s in stats(db, 'day')] == [1]
@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+
+from conftest import ROOT
+
+CHECK = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location('app', 'app .py')
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print('loaded=' + ','.join(m for m in ('bs4', 'lxml', 'bid_monitor_bot') if m in sys.modules))
+"""
+
+
+def test_app_import_defers_scraper_modules(tmp_path):
+    env = dict(os.environ, BID_MONITOR_DB=str(tmp_path / 'bids.db'))
+    result = subprocess.run(
+        [sys.executable, '-c', CHECK], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == 'loaded='